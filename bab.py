@@ -1,54 +1,47 @@
-import matplotlib.pyplot as plt
 from docx import Document
 from docx.shared import Inches
+from chart_cache import cached_chart
+from docx_charts import add_figure
+from sample_store import open_store
+from profiling import RunProfile
+
+profile = RunProfile('bab')
+profile.stage('data load')
 
 # Data
-banana_sap_composition = {
-    "Moisture (%)": 95.81,
-    "Protein (%)": 1.75,
-    "Fat/Lipid (%)": 0.23,
-    "Fibre (%)": 0.00,
-    "Ash (%)": 0.12,
-    "Carbohydrate (%)": 2.08,
-    "Energy (kcal/100g)": 17.39,
-    "Lignin (%)": 0.01,
-    "Hemicellulose (%)": 0.51,
-    "Cellulose (%)": 0.58,
-    "Sugar (%)": 5.13
-}
+banana_sap_composition = open_store().record('banana-sap-1', feedstock='banana')
 
 # Plot 1: Proximate Composition
-plt.figure(figsize=(10, 6))
-plt.bar(banana_sap_composition.keys(), banana_sap_composition.values(), color='skyblue')
-plt.xticks(rotation=45, ha='right')
-plt.title("Proximate Composition of Banana Sap")
-plt.ylabel("Amount")
-plt.tight_layout()
-plt.savefig("proximate_composition.jpeg")
-plt.close()
+profile.stage('chart: proximate_composition', output="proximate_composition.png")
+proximate_img = cached_chart("proximate_composition.png", embed_width=6, kind="bar", data=banana_sap_composition,
+                             title="Proximate Composition of Banana Sap", ylabel="Amount", color="skyblue",
+                             figsize=(10, 6), rotation=(45, "right"), dpi=None)
 
 # Plot 2: Bioethanol-Relevant Metrics
 bioethanol_metrics = {k: banana_sap_composition[k] for k in ["Sugar (%)", "Cellulose (%)", "Hemicellulose (%)", "Lignin (%)"]}
-plt.figure(figsize=(8, 5))
-plt.bar(bioethanol_metrics.keys(), bioethanol_metrics.values(), color='lightgreen')
-plt.title("Bioethanol-Relevant Metrics in Banana Sap")
-plt.ylabel("Percentage (%)")
-plt.tight_layout()
-plt.savefig("bioethanol_metrics.jpeg")
-plt.close()
+
+profile.stage('chart: bioethanol_metrics', output="bioethanol_metrics.png")
+bioethanol_img = cached_chart("bioethanol_metrics.png", embed_width=6, kind="bar", data=bioethanol_metrics,
+                              title="Bioethanol-Relevant Metrics in Banana Sap", ylabel="Percentage (%)", color="lightgreen",
+                              figsize=(8, 5), rotation=None, dpi=None)
 
 # Create Word Document
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading("Banana Sap Composition Analysis", 0)
 
 doc.add_paragraph("This document presents the proximate composition of banana sap and highlights key metrics relevant for bioethanol production.")
 
+profile.stage('docx: Proximate Composition')
 doc.add_heading("Proximate Composition", level=1)
-doc.add_picture("proximate_composition.jpeg", width=Inches(6))
+add_figure(doc, proximate_img, Inches(6))
 
+profile.stage('docx: Bioethanol-Relevant Metrics')
 doc.add_heading("Bioethanol-Relevant Metrics", level=1)
-doc.add_picture("bioethanol_metrics.jpeg", width=Inches(6))
+add_figure(doc, bioethanol_img, Inches(6))
 
 doc.add_paragraph("Sugar, cellulose, hemicellulose, and lignin are important components for evaluating bioethanol potential. Banana sap shows promising sugar content with moderate cellulose and hemicellulose levels.")
 
+profile.stage('save', output="banana_sap_analysis.docx")
 doc.save("banana_sap_analysis.docx")
+profile.finish()
@@ -1,3 +1,4 @@
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -5,71 +6,165 @@ import seaborn as sns
 from scipy.stats import f_oneway, ttest_ind
 from docx import Document
 from docx.shared import Inches
+from docx_tables import add_dataframe_table
+from docx_charts import add_figure, line_chart
+from figures import NATIVE_CHARTS, embed_figure
+from loaders import load_fermentation
+from bootstrap import bootstrap_anova
+from permutation import permutation_tests
+from factorial import twoway_anova
+from pairwise import oneway_anova_multi
+from datasets import BANANA_FERMENTATION
+from profiling import RunProfile
+from results_store import fermentation_rows, record_run
 
-# Step 1: Load the data
-data = pd.DataFrame({
-    'Time Point': ['72 hrs', '72 hrs', '72 hrs', '4 days', '4 days', '4 days',
-                   '5 days', '5 days', '5 days', '6 days', '6 days', '6 days'],
-    'Sample Type': ['Blank', 'Acid treatment', 'Alkaline treatment'] * 4,
-    'Viable Cell Count': [0.000, 1.570, 1.796, 0.000, 1.610, 1.836,
-                          0.000, 1.724, 1.912, 0.000, 1.411, 1.725],
-    'pH': [7.0, 5.0, 8.0, 7.0, 4.8, 8.6, 7.0, 5.5, 8.2, 7.0, 5.0, 8.0],
-    'Temperature': [30] * 12
-})
+profile = RunProfile('banana')
+profile.stage('data load')
+
+# Step 1: Load the data (a CSV/Parquet export path may be given on the command line)
+data = pd.DataFrame(BANANA_FERMENTATION)
+
+if len(sys.argv) > 1:
+    data = load_fermentation(sys.argv[1])
 
 # Step 2: Descriptive statistics
-desc_stats = data.groupby('Sample Type')['Viable Cell Count'].agg(['mean', 'std', 'min', 'max'])
+profile.stage('descriptive stats')
+desc_stats = data.groupby('Sample Type', observed=True)['Viable Cell Count'].agg(['mean', 'std', 'min', 'max'])
 
 # Step 3: ANOVA
+profile.stage('anova')
 acid = data[data['Sample Type'] == 'Acid treatment']['Viable Cell Count']
 alkaline = data[data['Sample Type'] == 'Alkaline treatment']['Viable Cell Count']
 blank = data[data['Sample Type'] == 'Blank']['Viable Cell Count']
 anova_result = f_oneway(acid, alkaline, blank)
 
-# Step 4: T-tests
+# Step 4: One-way ANOVA of every measured response (grouping done once)
+profile.stage('anova: all responses')
+responses = [c for c in data.select_dtypes('number').columns if c != 'Hours']
+responses_anova = oneway_anova_multi(data, 'Sample Type', responses)
+
+# Step 5: Two-way ANOVA (time x treatment; interaction pooled as error when unreplicated)
+profile.stage('two-way anova')
+twoway = twoway_anova(data, 'Time Point', 'Sample Type', 'Viable Cell Count')
+
+# Step 6: T-tests
+profile.stage('t-tests')
 ttest_acid_alkaline = ttest_ind(acid, alkaline)
 ttest_acid_blank = ttest_ind(acid, blank)
 ttest_alkaline_blank = ttest_ind(alkaline, blank)
 
-# Step 5: Plotting
+# Step 7: Bootstrap CIs (B = 100,000 stratified resamples, seeded). Kept
+# in-process: this script has no __main__ guard, so spawned workers would
+# re-run it; `cli.py fermentation --stats-only --bootstrap B` fans out.
+profile.stage('bootstrap')
+boot = bootstrap_anova(data, 'Sample Type', 'Viable Cell Count', n_boot=100_000, seed=0, max_workers=1)
+
+# Step 8: Permutation tests (no normality assumption; exact at these replicate counts)
+profile.stage('permutation tests')
+perm = permutation_tests(data, 'Sample Type', 'Viable Cell Count', seed=0)
+
+# Step 9: Plotting
 sns.set(style="whitegrid")
-plt.figure(figsize=(8, 5))
-sns.lineplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type', marker='o')
-plt.title('Viable Cell Count Over Time')
-plt.savefig('line_plot.png')
-plt.close()
+profile.stage('chart: line_plot', output='line_plot.png')
+if NATIVE_CHARTS:
+    line_img = line_chart(data, 'Time Point', 'Viable Cell Count', 'Sample Type', title='Viable Cell Count Over Time')
+else:
+    plt.figure(figsize=(8, 5))
+    sns.lineplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type', marker='o')
+    plt.title('Viable Cell Count Over Time')
+    line_img = embed_figure(plt.gcf(), 'line_plot.png', 'line', embed_width=5)
+    plt.close()
 
+profile.stage('chart: bar_chart', output='bar_chart.png')
 plt.figure(figsize=(8, 5))
 sns.barplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type')
 plt.title('Bar Chart of Cell Counts')
-plt.savefig('bar_chart.png')
+bar_img = embed_figure(plt.gcf(), 'bar_chart.png', 'bar', embed_width=5)
 plt.close()
 
+profile.stage('chart: box_plot', output='box_plot.png')
 plt.figure(figsize=(8, 5))
 sns.boxplot(data=data, x='Sample Type', y='Viable Cell Count')
 plt.title('Box Plot of Cell Counts by Treatment')
-plt.savefig('box_plot.png')
+box_img = embed_figure(plt.gcf(), 'box_plot.png', 'box', embed_width=5)
 plt.close()
 
-# Step 6: Export to DOCX
+# Step 10: Export to DOCX
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading('Statistical Analysis of Banana Sap Fermentation', 0)
 
+profile.stage('docx: Descriptive Statistics')
 doc.add_heading('Descriptive Statistics', level=1)
 for idx, row in desc_stats.iterrows():
     doc.add_paragraph(f"{idx}: Mean={row['mean']:.3f}, Std={row['std']:.3f}, Min={row['min']:.3f}, Max={row['max']:.3f}")
 
+profile.stage('docx: ANOVA Result')
 doc.add_heading('ANOVA Result', level=1)
 doc.add_paragraph(f"F-statistic: {anova_result.statistic:.3f}, p-value: {anova_result.pvalue:.5f}")
 
+profile.stage('docx: ANOVA Across Measured Responses')
+doc.add_heading('ANOVA Across Measured Responses', level=1)
+add_dataframe_table(doc, responses_anova, formats={
+    'F': lambda v: 'n/a (no variation)' if pd.isna(v) else f'{v:.3f}',
+    'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+})
+
+profile.stage('docx: Two-Way ANOVA')
+doc.add_heading('Two-Way ANOVA (Time Point × Sample Type)', level=1)
+if 'Time Point × Sample Type' not in twoway.index:
+    doc.add_paragraph('One observation per time point and sample type: the interaction is the error term.')
+add_dataframe_table(doc, twoway.reset_index(), formats={
+    'Sum Sq': '{:.4f}', 'Mean Sq': '{:.4f}',
+    'F': lambda v: '' if pd.isna(v) else f'{v:.3f}',
+    'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+})
+
+profile.stage('docx: T-Test Results')
 doc.add_heading('T-Test Results', level=1)
 doc.add_paragraph(f"Acid vs Alkaline: t={ttest_acid_alkaline.statistic:.3f}, p={ttest_acid_alkaline.pvalue:.5f}")
 doc.add_paragraph(f"Acid vs Blank: t={ttest_acid_blank.statistic:.3f}, p={ttest_acid_blank.pvalue:.5f}")
 doc.add_paragraph(f"Alkaline vs Blank: t={ttest_alkaline_blank.statistic:.3f}, p={ttest_alkaline_blank.pvalue:.5f}")
 
+profile.stage('docx: Permutation Test Results')
+doc.add_heading('Permutation Test Results', level=1)
+omnibus = perm['omnibus']
+doc.add_paragraph(f"Omnibus (one-way F): p={omnibus['p']:.5f} "
+                  f"({'exact, ' if omnibus['exact'] else 'Monte Carlo, '}{omnibus['n_perm']:,} permutations)")
+for _, row in perm['pairwise'].iterrows():
+    doc.add_paragraph(f"{row['Group 1']} vs {row['Group 2']}: difference={row['Difference']:.3f}, "
+                      f"p={row['p-value']:.5f} ({'exact, ' if row['Exact'] else 'Monte Carlo, '}{row['Permutations']:,} permutations)")
+
+profile.stage('docx: Bootstrap Confidence Intervals')
+doc.add_heading('Bootstrap Confidence Intervals', level=1)
+doc.add_paragraph(f"95% percentile intervals from {boot['n_boot']:,} resamples within each sample type (seed {boot['seed']}).")
+for idx, row in boot['means'].iterrows():
+    doc.add_paragraph(f"{idx}: Mean={row['mean']:.3f}, 95% CI [{row['CI low']:.3f}, {row['CI high']:.3f}]")
+for _, row in boot['differences'].iterrows():
+    doc.add_paragraph(f"{row['Group 1']} - {row['Group 2']}: {row['Difference']:.3f}, "
+                      f"95% CI [{row['CI low']:.3f}, {row['CI high']:.3f}]")
+doc.add_paragraph(f"F-statistic: {boot['F']['F']:.3f}, 95% CI [{boot['F']['CI low']:.3f}, {boot['F']['CI high']:.3f}]")
+
+profile.stage('docx: Graphs')
 doc.add_heading('Graphs', level=1)
-doc.add_picture('line_plot.png', width=Inches(5))
-doc.add_picture('bar_chart.png', width=Inches(5))
-doc.add_picture('box_plot.png', width=Inches(5))
+add_figure(doc, line_img, Inches(5))
+add_figure(doc, bar_img, Inches(5))
+add_figure(doc, box_img, Inches(5))
 
+profile.stage('save', output='Banana_Sap_Analysis.docx')
 doc.save('Banana_Sap_Analysis.docx')
+
+# Step 11: Keep the numbers for trend queries (results.sqlite, one transaction)
+profile.stage('results db')
+# the t-tests printed in the report (Step 6), not a second computation
+ttests = pd.DataFrame(
+    [(a, b, result.statistic, result.pvalue) for a, b, result in [
+        ('Acid treatment', 'Alkaline treatment', ttest_acid_alkaline),
+        ('Acid treatment', 'Blank', ttest_acid_blank),
+        ('Alkaline treatment', 'Blank', ttest_alkaline_blank)]],
+    columns=['Group 1', 'Group 2', 't-statistic', 'p-value'])
+record_run('banana', 'banana', fermentation_rows({
+    'desc_stats': desc_stats, 'responses': responses_anova, 'ttests': ttests, 'twoway': twoway,
+    'bootstrap': boot, 'permutation': perm,
+}), started=profile.started, source=sys.argv[1] if len(sys.argv) > 1 else None)
+profile.finish()
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+
+def batched_ols(data, target, features, group_cols=None, rcond=1e-10):
+    """Fit target ~ features + intercept separately for every group, in one pass.
+
+    Groups are formed once; per-group centred cross-products X'X, X'y and y'y
+    are accumulated with bincount and every group's normal equations are
+    solved in a single stacked np.linalg call.
+
+    Returns one row per group with n, rank, status, intercept, coefficients
+    ("coef: <feature>"), standard errors ("se: <feature>", "se: intercept")
+    and R². Groups whose centred design is rank deficient (e.g. a single
+    sample, fewer samples than features, constant or collinear features)
+    get status 'rank deficient' and NaN estimates instead of an arbitrary fit.
+    Standard errors need n > rank + 1 and are NaN otherwise.
+    """
+    features = list(features)
+    p = len(features)
+    if group_cols:
+        group_cols = [group_cols] if isinstance(group_cols, str) else list(group_cols)
+        grouped = data.groupby(group_cols, observed=True, sort=True)
+        codes = grouped.ngroup().to_numpy()
+        index = grouped.size().index
+    else:
+        codes = np.zeros(len(data), dtype=np.intp)
+        index = pd.RangeIndex(1)
+    k = len(index)
+
+    X = data[features].to_numpy(dtype=float)
+    y = data[target].to_numpy(dtype=float)
+    n = np.bincount(codes, minlength=k).astype(float)
+
+    def group_sum(values):
+        return np.bincount(codes, weights=values, minlength=k)
+
+    x_mean = np.column_stack([group_sum(X[:, j]) for j in range(p)]) / n[:, None]
+    y_mean = group_sum(y) / n
+    Xc = X - x_mean[codes]
+    yc = y - y_mean[codes]
+
+    Sxx = np.empty((k, p, p))
+    for a in range(p):
+        for b in range(a, p):
+            Sxx[:, a, b] = Sxx[:, b, a] = group_sum(Xc[:, a] * Xc[:, b])
+    Sxy = np.column_stack([group_sum(Xc[:, j] * yc) for j in range(p)])
+    Syy = group_sum(yc * yc)
+
+    # Rank on the correlation-scaled cross-product so the tolerance is unit free
+    scale = np.sqrt(np.einsum('gii->gi', Sxx))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = Sxx / (scale[:, :, None] * scale[:, None, :])
+    corr[~np.isfinite(corr)] = 0.0
+    rank = np.linalg.matrix_rank(corr, tol=rcond * p, hermitian=True)
+    ok = rank == p
+
+    coef = np.full((k, p), np.nan)
+    se = np.full((k, p), np.nan)
+    intercept = np.full(k, np.nan)
+    se_intercept = np.full(k, np.nan)
+    r2 = np.full(k, np.nan)
+
+    if ok.any():
+        inv = np.linalg.inv(Sxx[ok])
+        b = np.einsum('gij,gj->gi', inv, Sxy[ok])
+        coef[ok] = b
+        intercept[ok] = y_mean[ok] - np.einsum('gi,gi->g', x_mean[ok], b)
+        ssr = np.maximum(Syy[ok] - np.einsum('gi,gi->g', b, Sxy[ok]), 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2[ok] = np.where(Syy[ok] > 0, 1 - ssr / Syy[ok], np.nan)
+            dof = n[ok] - p - 1
+            sigma2 = np.where(dof > 0, ssr / dof, np.nan)
+        se[ok] = np.sqrt(sigma2[:, None] * np.einsum('gii->gi', inv))
+        xm = x_mean[ok]
+        se_intercept[ok] = np.sqrt(sigma2 * (1 / n[ok] + np.einsum('gi,gij,gj->g', xm, inv, xm)))
+
+    result = pd.DataFrame({
+        'n': n.astype(int),
+        'rank': rank,
+        'status': np.where(ok, 'ok', 'rank deficient'),
+        'intercept': intercept,
+        'R²': r2,
+    }, index=index)
+    for j, feature in enumerate(features):
+        result[f'coef: {feature}'] = coef[:, j]
+    for j, feature in enumerate(features):
+        result[f'se: {feature}'] = se[:, j]
+    result['se: intercept'] = se_intercept
+    return result
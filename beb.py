@@ -5,21 +5,19 @@ import numpy as np
 import matplotlib.pyplot as plt
 from docx import Document
 from docx.shared import Inches
+from chart_cache import cached_chart
+from docx_charts import add_figure
+from docx_tables import add_dataframe_table
+from derived_metrics import derive_metrics, SUMMARY_COLUMNS
+from sample_store import open_store
+from profiling import RunProfile
+from results_store import derived_rows, record_run
+
+profile = RunProfile('beb')
+profile.stage('data load')
 
 # --- Input data ---
-banana_sap_composition = {
-    "Moisture (%)": 95.81,
-    "Protein (%)": 1.75,
-    "Fat/Lipid (%)": 0.23,
-    "Fibre (%)": 0.00,
-    "Ash (%)": 0.12,
-    "Carbohydrate (%)": 2.08,
-    "Energy (kcal/100g)": 17.39,
-    "Lignin (%)": 0.01,
-    "Hemicellulose (%)": 0.51,
-    "Cellulose (%)": 0.58,
-    "Sugar (%)": 5.13
-}
+banana_sap_composition = open_store().record('banana-sap-1', feedstock='banana')
 
 # --- Setup output folder ---
 output_dir = Path("banana_sap_analysis_outputs")
@@ -31,36 +29,25 @@ df_input = pd.DataFrame(
 ).set_index("Metric")
 
 # --- Derived metrics ---
-moisture = banana_sap_composition["Moisture (%)"]
-dry_matter = 100 - moisture
+profile.stage('derived metrics')
+derived = derive_metrics(df_input.T).iloc[0]
 
-# Convert fresh basis to dry basis (except moisture & energy)
-dry_basis = {}
-for k, v in banana_sap_composition.items():
-    if k not in ["Moisture (%)", "Energy (kcal/100g)"]:
-        dry_basis[k + " (dry-basis %)"] = (v / dry_matter) * 100
+moisture = derived["Moisture (%)"]
+dry_matter = derived["Dry matter (%)"]
+dry_basis = derived.filter(like="(dry-basis %)").to_dict()
 
 # Energy per gram sugar
-energy = banana_sap_composition["Energy (kcal/100g)"]
-sugar = banana_sap_composition["Sugar (%)"]   # g/100 g fresh
-energy_per_g_sugar = energy / sugar
+energy = derived["Energy (kcal/100g fresh)"]
+sugar = derived["Sugar (g/100g fresh)"]   # g/100 g fresh
+energy_per_g_sugar = derived["Energy per g sugar (kcal/g)"]
 
 # Ethanol yield (theoretical)
-# 1 g sugar -> 0.511 g ethanol
-ethanol_g_100g = sugar * 0.511
-ethanol_ml_100g = ethanol_g_100g / 0.789  # density ethanol = 0.789 g/mL
-ethanol_l_tonne = (ethanol_ml_100g * 10_000) / 1000  # L/tonne fresh
-
-summary = {
-    "Moisture (%)": moisture,
-    "Dry matter (%)": dry_matter,
-    "Sugar (g/100g fresh)": sugar,
-    "Energy (kcal/100g fresh)": energy,
-    "Energy per g sugar (kcal/g)": energy_per_g_sugar,
-    "Ethanol (g/100g fresh)": ethanol_g_100g,
-    "Ethanol (mL/100g fresh)": ethanol_ml_100g,
-    "Ethanol (L/tonne fresh)": ethanol_l_tonne
-}
+# 1 g sugar -> 0.511 g ethanol, density ethanol = 0.789 g/mL
+ethanol_g_100g = derived["Ethanol (g/100g fresh)"]
+ethanol_ml_100g = derived["Ethanol (mL/100g fresh)"]
+ethanol_l_tonne = derived["Ethanol (L/tonne fresh)"]
+
+summary = derived[SUMMARY_COLUMNS].to_dict()
 df_summary = pd.DataFrame(list(summary.items()), columns=["Metric", "Value"]).set_index("Metric")
 
 # --- PLOTS ---
@@ -70,43 +57,43 @@ prox_keys = ["Moisture (%)", "Protein (%)", "Fat/Lipid (%)", "Fibre (%)",
              "Ash (%)", "Carbohydrate (%)", "Sugar (%)"]
 prox_vals = [banana_sap_composition[k] for k in prox_keys]
 
-plt.figure(figsize=(9,5))
-plt.bar(prox_keys, prox_vals)
-plt.title("Banana Sap — Proximate Composition")
-plt.ylabel("Percent (%)")
-plt.xticks(rotation=30, ha="right")
-plt.tight_layout()
-plt.savefig(output_dir/"proximate_composition.jpg", dpi=300)
-plt.close()
+profile.stage('chart: proximate_composition', output=output_dir/"proximate_composition.png")
+proximate_img = cached_chart(output_dir/"proximate_composition.png", embed_width=6, kind="bar",
+                             data=dict(zip(prox_keys, prox_vals)), title="Banana Sap — Proximate Composition",
+                             ylabel="Percent (%)", color=None, figsize=(9, 5), rotation=(30, "right"), dpi=300)
 
 # 2. Energy vs Sugar
-plt.figure(figsize=(6,5))
-plt.scatter([sugar], [energy], color="red")
-plt.xlabel("Sugar (g/100 g fresh)")
-plt.ylabel("Energy (kcal/100 g fresh)")
-plt.title("Energy vs Sugar in Banana Sap")
-plt.annotate(f"{energy_per_g_sugar:.2f} kcal/g sugar",
-             (sugar, energy), xytext=(8,-12), textcoords="offset points")
-plt.tight_layout()
-plt.savefig(output_dir/"energy_vs_sugar.jpg", dpi=300)
-plt.close()
+def plot_energy_vs_sugar():
+    plt.figure(figsize=(6,5))
+    plt.scatter([sugar], [energy], color="red")
+    plt.xlabel("Sugar (g/100 g fresh)")
+    plt.ylabel("Energy (kcal/100 g fresh)")
+    plt.title("Energy vs Sugar in Banana Sap")
+    plt.annotate(f"{energy_per_g_sugar:.2f} kcal/g sugar",
+                 (sugar, energy), xytext=(8,-12), textcoords="offset points")
+    plt.tight_layout()
+
+profile.stage('chart: energy_vs_sugar', output=output_dir/"energy_vs_sugar.png")
+scatter_img = cached_chart(output_dir/"energy_vs_sugar.png", plot_energy_vs_sugar, embed_width=5, kind="scatter",
+                           data={"sugar": sugar, "energy": energy, "annotation": f"{energy_per_g_sugar:.2f} kcal/g sugar"},
+                           title="Energy vs Sugar in Banana Sap", xlabel="Sugar (g/100 g fresh)",
+                           ylabel="Energy (kcal/100 g fresh)", color="red", figsize=(6, 5), dpi=300)
 
 # 3. Ethanol yield
 eth_labels = ["g/100g", "mL/100g", "L/tonne"]
 eth_values = [ethanol_g_100g, ethanol_ml_100g, ethanol_l_tonne]
 
-plt.figure(figsize=(8,5))
-plt.bar(eth_labels, eth_values, color="green")
-plt.title("Theoretical Ethanol Yield from Banana Sap")
-plt.ylabel("Amount")
-plt.tight_layout()
-plt.savefig(output_dir/"ethanol_yield.jpg", dpi=300)
-plt.close()
+profile.stage('chart: ethanol_yield', output=output_dir/"ethanol_yield.png")
+yield_img = cached_chart(output_dir/"ethanol_yield.png", embed_width=6, kind="bar",
+                         data=dict(zip(eth_labels, eth_values)), title="Theoretical Ethanol Yield from Banana Sap",
+                         ylabel="Amount", color="green", figsize=(8, 5), rotation=None, dpi=300)
 
 # --- WORD REPORT ---
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading("Banana Sap Composition — Analysis & Bioethanol Metrics", level=1)
 
+profile.stage('docx: Methods')
 doc.add_heading("1. Methods", level=2)
 doc.add_paragraph(
     "Proximate composition of banana sap was analyzed. Derived metrics include "
@@ -114,48 +101,48 @@ doc.add_paragraph(
     "(assuming 0.511 g ethanol per g sugar, density 0.789 g/mL)."
 )
 
+profile.stage('docx: Results (Tables)')
 doc.add_heading("2. Results (Tables)", level=2)
 doc.add_paragraph("Input composition (fresh weight):")
-t1 = doc.add_table(rows=1, cols=2)
-t1.style = "Light List"
-t1.rows[0].cells[0].text, t1.rows[0].cells[1].text = "Metric", "Value"
-for m,v in banana_sap_composition.items():
-    row = t1.add_row().cells
-    row[0].text, row[1].text = m, str(v)
+add_dataframe_table(doc, df_input.reset_index(), style="Light List")
 
 doc.add_paragraph("\nDerived summary:")
-t2 = doc.add_table(rows=1, cols=2)
-t2.style = "Light List"
-t2.rows[0].cells[0].text, t2.rows[0].cells[1].text = "Metric", "Value"
-for m,v in summary.items():
-    row = t2.add_row().cells
-    row[0].text = m
-    row[1].text = f"{v:.4g}" if isinstance(v,float) else str(v)
+add_dataframe_table(doc, df_summary.reset_index(), float_format="{:.4g}", style="Light List")
 
+profile.stage('docx: Results (Figures)')
 doc.add_heading("3. Results (Figures)", level=2)
-doc.add_picture(str(output_dir/"proximate_composition.jpg"), width=Inches(6))
+add_figure(doc, proximate_img, Inches(6))
 doc.add_paragraph("Figure 1: Proximate composition of banana sap (fresh-weight %).")
-doc.add_picture(str(output_dir/"energy_vs_sugar.jpg"), width=Inches(5))
+add_figure(doc, scatter_img, Inches(5))
 doc.add_paragraph("Figure 2: Energy vs sugar content.")
-doc.add_picture(str(output_dir/"ethanol_yield.jpg"), width=Inches(6))
+add_figure(doc, yield_img, Inches(6))
 doc.add_paragraph("Figure 3: Theoretical ethanol yield metrics.")
 
+profile.stage('docx: Discussion')
 doc.add_heading("4. Discussion", level=2)
 doc.add_paragraph(
     f"Banana sap contains {moisture:.2f}% moisture, leaving only {dry_matter:.2f}% "
     "dry matter. Sugar content is modest (5.13 g/100 g fresh), yielding "
     f"{ethanol_l_tonne:.2f} L ethanol per tonne (theoretical). "
     "This indicates that very large sap volumes are needed for significant ethanol production. "
-    "The low energy density (%.2f kcal/g sugar) compared to other feedstocks reflects high dilution. "
-    "Real-world ethanol yields would be lower due to process inefficiencies." % energy_per_g_sugar
+    f"The low energy density ({energy_per_g_sugar:.2f} kcal/g sugar) compared to other feedstocks "
+    "reflects high dilution. "
+    "Real-world ethanol yields would be lower due to process inefficiencies."
 )
 
+profile.stage('docx: Conclusions')
 doc.add_heading("5. Conclusions", level=2)
 doc.add_paragraph(
     f"Banana sap has potential as a feedstock but its high water content and modest sugar "
     f"levels limit efficiency. Theoretical yield is about {ethanol_l_tonne:.2f} L ethanol per tonne."
 )
 
+profile.stage('save', output=output_dir/"banana_sap_analysis_report.docx")
 doc.save(output_dir/"banana_sap_analysis_report.docx")
 
+# --- RESULTS DATABASE ---
+profile.stage('results db')
+record_run('beb', 'banana', derived_rows(derived), started=profile.started)
+
 print("All files saved in:", output_dir.resolve())
+profile.finish()
@@ -0,0 +1,255 @@
+"""Scaling benchmarks for every analysis stage on synthetic data.
+
+    python bench.py                                  # 10, 1e3, 1e5 rows
+    python bench.py --sizes 10 1000 100000 10000000 --suites fermentation
+    python bench.py --save-baseline bench_baseline.json
+    python bench.py --baseline bench_baseline.json   # exit 1 on time or memory regression
+
+Each suite generates inputs shaped like the real ones and times four stages
+separately: data build, statistics, chart rendering and DOCX assembly. The
+tracemalloc peak per stage comes from a second, untimed pass: tracing slows
+allocation-heavy pandas/matplotlib code several-fold, so it never runs while
+a stage is timed. Charts and DOCX tables are built from the
+statistics output (group summaries, capped table rows), as the reports do,
+so those stages scale with the number of groups rather than raw rows.
+"""
+import argparse
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DOCX_ROW_CAP = 1000
+FUEL_PROPERTIES = {
+    "Octane number": (90, 110), "Flash point": (13, 16), "Density": (0.79, 0.81),
+    "Viscosity": (1.1, 1.4), "Vapor pressure": (5.5, 6.2), "Calorific value": (26.5, 27.5),
+    "Boiling point": (78, 78), "Freezing point": (-114, -95), "Autoignition temp.": (360, 370),
+}
+COMPOSITION_RANGES = {
+    "Moisture (%)": (85, 98), "Protein (%)": (0, 2), "Fat/Lipid (%)": (0, 0.5), "Fibre (%)": (0, 3),
+    "Ash (%)": (0, 1.5), "Carbohydrate (%)": (1, 9), "Energy (kcal/100g)": (10, 20), "Lignin (%)": (0, 1),
+    "Hemicellulose (%)": (0, 1), "Cellulose (%)": (0, 1), "Sugar (%)": (0, 8),
+}
+PHYSICOCHEMICAL_RANGES = {
+    'Ethanol concentration': (30, 40), 'pH': (5, 6), 'Density': (0.97, 0.99),
+    'Viscosity': (1.2, 1.8), 'Total Acidity': (0.3, 0.6),
+}
+
+
+# --- Synthetic inputs -------------------------------------------------------
+
+def synth_fermentation(n, rng, n_groups=6, time_points=('72 hrs', '4 days', '5 days', '6 days')):
+    groups = ['Blank'] + [f'Treatment {i}' for i in range(1, n_groups)]
+    sample_type = rng.integers(0, n_groups, n)
+    count = np.where(sample_type == 0, 0.0, rng.normal(1.7, 0.15, n))
+    return pd.DataFrame({
+        'Time Point': pd.Categorical.from_codes(rng.integers(0, len(time_points), n), time_points),
+        'Sample Type': pd.Categorical.from_codes(sample_type, groups),
+        'Viable Cell Count': count,
+        'pH': rng.normal(6.5, 1.2, n),
+        'Temperature': np.full(n, 30),
+    })
+
+
+def synth_fuel_ranges(n, rng):
+    cols = {}
+    for prop, (lo, hi) in FUEL_PROPERTIES.items():
+        span = max(hi - lo, abs(lo) * 0.05 + 0.01)
+        low = lo + rng.normal(0, span * 0.1, n)
+        cols[(prop, 'min')] = low
+        cols[(prop, 'max')] = low + rng.uniform(0, span, n)
+    return pd.DataFrame(cols)
+
+
+def synth_compositions(n, rng):
+    return pd.DataFrame({k: rng.uniform(lo, hi, n) for k, (lo, hi) in COMPOSITION_RANGES.items()})
+
+
+def synth_physicochemical(n, rng):
+    df = pd.DataFrame({k: rng.uniform(lo, hi, n) for k, (lo, hi) in PHYSICOCHEMICAL_RANGES.items()})
+    df.insert(1, 'Ethanol yield', 0.015 * df['Ethanol concentration'] + rng.normal(0, 0.02, n))
+    return df
+
+
+# --- Stages -----------------------------------------------------------------
+
+def _docx(tables):
+    from docx import Document
+    from docx_tables import add_dataframe_table
+    doc = Document()
+    for title, df, kwargs in tables:
+        doc.add_heading(title, level=1)
+        add_dataframe_table(doc, df.head(DOCX_ROW_CAP), **kwargs)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.tell()
+
+
+def fermentation_suite(n, rng, out_dir):
+    from pipelines import fermentation_stats
+    from chart_templates import BarTemplate
+    data = yield 'build', lambda: synth_fermentation(n, rng)
+    results = yield 'stats', lambda: fermentation_stats(data)
+    means = results['desc_stats']['mean']
+    yield 'charts', lambda: BarTemplate(rotation=45).render(means.index, means.to_numpy(), out_dir / 'fermentation.png')
+    yield 'docx', lambda: _docx([
+        ('Descriptive Statistics', results['desc_stats'].reset_index(), {'float_format': '{:.3f}'}),
+        ('Pairwise T-Test Results', results['ttests'], {'float_format': '{:.5f}'}),
+    ])
+
+
+def fuel_properties_suite(n, rng, out_dir):
+    from render import minmax_bar, radar
+    ranges = yield 'build', lambda: synth_fuel_ranges(n, rng)
+
+    def stats():
+        summary = pd.DataFrame({
+            'Min': ranges.xs('min', axis=1, level=1).mean(),
+            'Max': ranges.xs('max', axis=1, level=1).mean(),
+        })
+        summary['Midpoint'] = (summary['Min'] + summary['Max']) / 2
+        return summary
+    summary = yield 'stats', stats
+    ranges_dict = {k: (row['Min'], row['Max']) for k, row in summary.iterrows()}
+    yield 'charts', lambda: [minmax_bar(ranges_dict, 'Fuel properties', out_dir / 'fuel_bar.png'),
+                             radar(ranges_dict, 'Fuel properties', out_dir / 'fuel_radar.png')]
+    yield 'docx', lambda: _docx([('Property ranges', summary.reset_index(), {'float_format': '{:.3f}'})])
+
+
+def composition_suite(n, rng, out_dir):
+    from derived_metrics import derive_metrics
+    from chart_templates import BarTemplate
+    compositions = yield 'build', lambda: synth_compositions(n, rng)
+    derived = yield 'stats', lambda: derive_metrics(compositions)
+    means = derived.mean()
+    yield 'charts', lambda: BarTemplate(rotation=45, ha='right').render(
+        means.index, means.to_numpy(), out_dir / 'composition.png')
+    yield 'docx', lambda: _docx([('Derived metrics', derived, {'float_format': '{:.4g}'})])
+
+
+def physicochemical_suite(n, rng, out_dir):
+    from pipelines import physicochemical_stats
+    from chart_templates import BarTemplate
+    df = yield 'build', lambda: synth_physicochemical(n, rng)
+    results = yield 'stats', lambda: physicochemical_stats(df)
+    means = results['desc_stats']['mean']
+    yield 'charts', lambda: BarTemplate(rotation=45).render(means.index, means.to_numpy(), out_dir / 'physicochemical.png')
+    yield 'docx', lambda: _docx([
+        ('Descriptive Statistics', results['desc_stats'].reset_index(), {'float_format': '{:.4f}'}),
+        ('Correlation Matrix', results['corr_matrix'], {'float_format': '{:.2f}', 'index': True}),
+    ])
+
+
+SUITES = {
+    'fermentation': fermentation_suite,
+    'fuel-properties': fuel_properties_suite,
+    'composition': composition_suite,
+    'physicochemical': physicochemical_suite,
+}
+
+
+# --- Runner -----------------------------------------------------------------
+
+def run_suite(name, n, seed=0, trace=False):
+    """Drive one suite generator, timing each stage it yields (trace=True: its tracemalloc peak instead)."""
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = SUITES[name](n, np.random.default_rng(seed), Path(tmp))
+        result = None
+        while True:
+            try:
+                stage, func = suite.send(result)
+            except StopIteration:
+                break
+            row = {'suite': name, 'rows': n, 'stage': stage}
+            if trace:
+                tracemalloc.start()
+                result = func()
+                row['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            else:
+                start = time.perf_counter()
+                result = func()
+                row['seconds'] = time.perf_counter() - start
+            rows.append(row)
+    return rows
+
+
+def measure_suite(name, n, seed=0):
+    """Stage timings from an untraced run, with the peak memory of a separate traced run."""
+    timed = run_suite(name, n, seed)
+    for row, traced in zip(timed, run_suite(name, n, seed, trace=True)):
+        row['peak_bytes'] = traced['peak_bytes']
+    return timed
+
+
+def compare(results, baseline, tolerance, min_delta=0.05, mem_tolerance=1.25, min_mem_delta=2**20):
+    """Rows slower than `tolerance` x baseline (and by at least `min_delta` s), or whose
+    peak memory exceeds `mem_tolerance` x baseline (and by at least `min_mem_delta` bytes)."""
+    ref = {(r['suite'], r['rows'], r['stage']): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = ref.get((r['suite'], r['rows'], r['stage']))
+        if base is None:
+            continue
+        if r['seconds'] > max(base['seconds'] * tolerance, base['seconds'] + min_delta):
+            regressions.append(dict(r, metric='seconds', baseline=base['seconds']))
+        if 'peak_bytes' in base and \
+                r['peak_bytes'] > max(base['peak_bytes'] * mem_tolerance, base['peak_bytes'] + min_mem_delta):
+            regressions.append(dict(r, metric='peak_bytes', baseline=base['peak_bytes']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1_000, 100_000])
+    parser.add_argument('--suites', nargs='+', choices=list(SUITES), default=list(SUITES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against a results JSON")
+    parser.add_argument('--save-baseline', help="write results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="allowed slowdown factor")
+    parser.add_argument('--min-delta', type=float, default=0.05, help="ignore slowdowns smaller than this (s)")
+    parser.add_argument('--mem-tolerance', type=float, default=1.25, help="allowed peak memory growth factor")
+    parser.add_argument('--min-mem-delta', type=float, default=1.0,
+                        help="ignore peak memory growth smaller than this (MB)")
+    args = parser.parse_args(argv)
+
+    # Untimed pass so lazy imports and font caches don't land in the first stage timings
+    for name in args.suites:
+        run_suite(name, 10, args.seed)
+
+    results = []
+    for name in args.suites:
+        for n in args.sizes:
+            rows = measure_suite(name, n, args.seed)
+            results.extend(rows)
+            for r in rows:
+                print(f"{r['suite']:<16} {r['rows']:>10} {r['stage']:<7} {r['seconds']:9.4f} s "
+                      f"{r['peak_bytes'] / 2**20:9.1f} MB")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance, args.min_delta,
+                              args.mem_tolerance, args.min_mem_delta * 2**20)
+        for r in regressions:
+            if r['metric'] == 'seconds':
+                detail = f"{r['seconds']:.4f} s vs {r['baseline']:.4f} s"
+            else:
+                detail = f"peak {r['peak_bytes'] / 2**20:.1f} MB vs {r['baseline'] / 2**20:.1f} MB"
+            print(f"REGRESSION {r['suite']} {r['rows']} {r['stage']}: {detail}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Stratified bootstrap for one-way designs. Values are sorted by group so
+# each group is a contiguous column block; one (B x n) matrix of uniform
+# draws, scaled per column to that column's group size, indexes every
+# replicate of every group at once. Group means, pairwise mean differences
+# and the F statistic then come from reduceat over the column blocks.
+#
+# Replicates are generated in fixed-size chunks, each with its own child of
+# SeedSequence(seed), so results depend only on (seed, n_boot) and not on
+# how many worker processes the chunks were spread over.
+
+CHUNK_CELLS = 2_000_000
+
+
+def _group_stats(sample, starts, sizes):
+    """Group means [B, k] and one-way F [B] for every row of sample[B, n]."""
+    sums = np.add.reduceat(sample, starts, axis=1)
+    means = sums / sizes
+    dev = sample - np.repeat(means, sizes, axis=1)
+    ss_within = (dev * dev).sum(axis=1)
+    grand = sums.sum(axis=1) / sizes.sum()
+    ss_between = (sizes * (means - grand[:, None]) ** 2).sum(axis=1)
+    k, total = len(sizes), sizes.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_stat = (ss_between / (k - 1)) / (ss_within / (total - k))
+    return means, f_stat
+
+
+def _replicates(sorted_values, starts, sizes, n_rep, seed_seq):
+    """Statistics of n_rep stratified resamples (one chunk)."""
+    rng = np.random.default_rng(seed_seq)
+    offsets = np.repeat(starts, sizes)
+    scale = np.repeat(sizes, sizes)
+    idx = offsets + (rng.random((n_rep, len(sorted_values))) * scale).astype(np.intp)
+    return _group_stats(sorted_values[idx], starts, sizes)
+
+
+def _run(job):
+    return _replicates(*job)
+
+
+def bootstrap_anova(data, group_col, value_col, n_boot=10_000, seed=0, confidence=0.95, max_workers=None):
+    """Percentile bootstrap CIs for group means, pairwise mean differences and F.
+
+    Resamples `value_col` with replacement within each `group_col` group.
+    Returns {'means': DataFrame, 'differences': DataFrame, 'F': dict,
+    'n_boot': int, 'seed': int}; group order follows first appearance, as in
+    pairwise.py. max_workers=1 keeps everything in-process.
+    """
+    codes, labels = pd.factorize(data[group_col])
+    labels = np.asarray(labels)
+    order = np.argsort(codes, kind='stable')
+    sorted_values = data[value_col].to_numpy(dtype=float)[order]
+    sizes = np.bincount(codes, minlength=len(labels)).astype(np.intp)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    chunk = max(1, min(n_boot, CHUNK_CELLS // max(1, len(sorted_values))))
+    counts = [min(chunk, n_boot - s) for s in range(0, n_boot, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    jobs = [(sorted_values, starts, sizes, n, s) for n, s in zip(counts, seeds)]
+    if max_workers == 1 or len(jobs) < 2:
+        parts = [_run(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or min(len(jobs), os.cpu_count() or 1)) as pool:
+            parts = list(pool.map(_run, jobs))
+    means = np.concatenate([m for m, _ in parts])
+    f_stat = np.concatenate([f for _, f in parts])
+
+    alpha = (1 - confidence) / 2
+    q = [alpha, 1 - alpha]
+    observed, observed_f = _group_stats(sorted_values[None], starts, sizes)
+    observed, observed_f = observed[0], observed_f[0]
+
+    mean_ci = np.quantile(means, q, axis=0)
+    i, j = np.triu_indices(len(labels), k=1)
+    diff_ci = np.quantile(means[:, i] - means[:, j], q, axis=0)
+    # Resamples with no within-group spread give F = inf; they stay in the quantiles
+    f_ci = np.nanquantile(f_stat, q)
+
+    return {
+        'means': pd.DataFrame({'mean': observed, 'CI low': mean_ci[0], 'CI high': mean_ci[1]},
+                              index=pd.Index(labels, name=group_col)),
+        'differences': pd.DataFrame({
+            'Group 1': labels[i],
+            'Group 2': labels[j],
+            'Difference': observed[i] - observed[j],
+            'CI low': diff_ci[0],
+            'CI high': diff_ci[1],
+        }),
+        'F': {'F': float(observed_f), 'CI low': float(f_ci[0]), 'CI high': float(f_ci[1]),
+              'non-finite': int((~np.isfinite(f_stat)).sum())},
+        'n_boot': n_boot,
+        'seed': seed,
+    }
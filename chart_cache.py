@@ -0,0 +1,121 @@
+import hashlib
+import inspect
+import io
+import json
+import os
+from pathlib import Path
+
+import figures
+
+# Rendered charts are stored under a hash of everything that affects the
+# picture (data, chart type, labels, colours, figure size, dpi, embed width
+# and resolution). A hit copies the stored image to the requested path and
+# never touches matplotlib. Either way the image comes back as a BytesIO for
+# doc.add_picture(); the copy at the requested path follows
+# figures.FIGURE_COPIES.
+#
+# Bar charts are drawn from their spec by draw_bar(), so the key and the
+# picture come from the same values; a chart drawn by its own callback also
+# hashes the callback's source, so restyling it misses the cache.
+CACHE_DIR = Path(os.environ.get('CHART_CACHE_DIR', '.chart_cache'))
+MAX_CACHE_BYTES = int(os.environ.get('CHART_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+CACHE_VERSION = 3
+
+
+def chart_key(**spec):
+    """Stable SHA-256 of a chart spec.
+
+    Keyword order and tuple/list don't matter; `data` is hashed as ordered
+    (label, value) pairs, so reordered bars get a new key.
+    """
+    spec = dict(spec, _version=CACHE_VERSION)
+    if isinstance(spec.get('data'), dict):
+        spec['data'] = list(spec['data'].items())
+    payload = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _source_digest(render):
+    try:
+        code = inspect.getsource(render).encode('utf-8')
+    except (OSError, TypeError):
+        code = render.__code__.co_code
+    return hashlib.sha256(code).hexdigest()
+
+
+def draw_bar(data, title=None, ylabel=None, color=None, figsize=(8, 5), rotation=None, **_):
+    """Bar chart of a {label: value} dict on a new pyplot figure; rotation is degrees or (degrees, ha)."""
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=figsize)
+    plt.bar(list(data), list(data.values()), color=color)
+    if title:
+        plt.title(title)
+    if ylabel:
+        plt.ylabel(ylabel)
+    if rotation is not None:
+        degrees, ha = rotation if isinstance(rotation, (tuple, list)) else (rotation, 'center')
+        plt.xticks(rotation=degrees, ha=ha)
+    plt.tight_layout()
+
+
+def _evict(cache_dir, max_bytes):
+    entries = [(p.stat(), p) for p in cache_dir.iterdir() if p.is_file() and p.suffix != '.tmp']
+    total = sum(st.st_size for st, _ in entries)
+    # Oldest access first; hits refresh the mtime, so this is LRU order
+    for st, path in sorted(entries, key=lambda e: e[0].st_mtime):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= st.st_size
+
+
+def cached_chart(path, render=None, embed_width=None, cache_dir=None, max_bytes=None, copy=None, **spec):
+    """The chart described by `spec` as a BytesIO, rendering only on a miss.
+
+    'bar' specs are drawn by draw_bar(**spec) unless `render` is given; a
+    `render()` callback must draw the chart on a new pyplot figure (its
+    source is part of the key). Drawing only happens when no image with the
+    same key is cached, and the figure is then saved
+    with figures.embed_figure() for an `embed_width`-inch picture (spec['kind']
+    picks the format, spec['dpi'] is the chart's own resolution) and closed.
+    A copy goes to `path` unless figure copies are off.
+
+    With figures.NATIVE_CHARTS on, a 'bar' spec comes back as a
+    docx_charts.NativeChart instead (no rendering, no cache, no file).
+    """
+    if figures.NATIVE_CHARTS and spec['kind'] == 'bar':
+        from docx_charts import bar_chart
+        return bar_chart(list(spec['data']), list(spec['data'].values()), spec.get('title'), spec.get('ylabel'),
+                         spec.get('color'), spec.get('rotation'), spec.get('figsize', (8, 5)))
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    kind = spec['kind']
+    path = Path(figures.embed_path(path, kind))
+    drawn_by = 'draw_bar' if render is None else _source_digest(render)
+    key = chart_key(**spec, render=drawn_by, embed=(embed_width, figures.EMBED_DPI, figures.CHART_FORMATS[kind]))
+    cached = cache_dir / (key + path.suffix)
+
+    if cached.exists():
+        os.utime(cached)
+        data = cached.read_bytes()
+        from PIL import Image  # reads the header only
+        fmt = figures.CHART_FORMATS[kind][0]
+        figures.EMBEDDED.append({'path': str(path), 'kind': kind, 'format': fmt, 'embed_width_in': embed_width,
+                                 'pixels': list(Image.open(io.BytesIO(data)).size), 'bytes': len(data),
+                                 'cached': True})
+        return figures.keep(data, path, copy)
+
+    import matplotlib.pyplot as plt
+    if render is None:
+        draw_bar(**spec)
+    else:
+        render()
+    fig = plt.gcf()
+    image = figures.embed_figure(fig, path, kind, embed_width, dpi=spec.get('dpi'), copy=copy)
+    plt.close(fig)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(cached.suffix + f'.{os.getpid()}.tmp')
+    tmp.write_bytes(image.getvalue())
+    os.replace(tmp, cached)
+    _evict(cache_dir, max_bytes)
+    return image
@@ -0,0 +1,151 @@
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.layout_engine import TightLayoutEngine
+
+from figures import embed_figure
+
+# Reusable chart templates for bulk rendering. Each template builds and styles
+# its Figure/Axes once; render() only swaps the data artists, and the
+# tight_layout result is cached per label set so charts with the same labels
+# skip text layout entirely. The layout is applied with
+# TightLayoutEngine.execute() rather than fig.tight_layout(), which leaves a
+# placeholder layout engine on the figure that makes every savefig draw the
+# figure twice. Radars keep the default subplot layout (tight_layout = False),
+# as the polar axes already leave room for their labels. render() returns the image as a BytesIO
+# (figures.embed_figure), ready for doc.add_picture(); pass embed_width (inches)
+# to size it for the picture it becomes.
+
+
+class ChartTemplate:
+    figsize = (8, 5)
+    subplot_kw = {}
+    kind = 'bar'
+    tight_layout = True
+
+    def __init__(self, figsize=None, xlabel=None, ylabel=None, rotation=0, ha='center', dpi=None, embed_width=None):
+        self.fig = Figure(figsize=figsize or self.figsize)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111, **self.subplot_kw)
+        if xlabel:
+            self.ax.set_xlabel(xlabel)
+        if ylabel:
+            self.ax.set_ylabel(ylabel)
+        self.rotation = rotation
+        self.ha = ha
+        self.dpi = dpi
+        self.embed_width = embed_width
+        self._artists = []
+        self._labels = None
+        self._layouts = {}
+
+    def _clear(self):
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+
+    def _set_labels(self, ticks, labels):
+        labels = tuple(labels)
+        if labels != self._labels:
+            self.ax.set_xticks(ticks)
+            self.ax.set_xticklabels(labels, rotation=self.rotation, ha=self.ha)
+            self._labels = labels
+
+    def _rescale(self):
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def save(self, path, title=None):
+        if title is not None:
+            self.ax.set_title(title)
+        if self.tight_layout:
+            key = (self._labels, title is not None)
+            params = self._layouts.get(key)
+            if params is None:
+                TightLayoutEngine().execute(self.fig)
+                sp = self.fig.subplotpars
+                self._layouts[key] = dict(left=sp.left, right=sp.right, bottom=sp.bottom, top=sp.top)
+            else:
+                self.fig.subplots_adjust(**params)
+        return embed_figure(self.fig, path, self.kind, self.embed_width, dpi=self.dpi)
+
+
+class BarTemplate(ChartTemplate):
+    def render(self, labels, values, path, title=None, **style):
+        self._clear()
+        x = np.arange(len(values))
+        self._artists.append(self.ax.bar(x, values, **style))
+        self._set_labels(x, labels)
+        self._rescale()
+        return self.save(path, title)
+
+
+class MinMaxBarTemplate(ChartTemplate):
+    """Grouped min/max bars; overlap=True draws Max behind Min in one slot."""
+    kind = 'minmax'
+
+    def __init__(self, overlap=False, **kwargs):
+        super().__init__(**kwargs)
+        self.overlap = overlap
+        self._legend = False
+
+    def render(self, labels, mins, maxs, path, title=None):
+        self._clear()
+        x = np.arange(len(mins))
+        if self.overlap:
+            self._artists.append(self.ax.bar(x, maxs, color='skyblue', label='Max'))
+            self._artists.append(self.ax.bar(x, mins, color='orange', label='Min'))
+        else:
+            self._artists.append(self.ax.bar(x - 0.2, mins, width=0.4, color='orange', label='Min'))
+            self._artists.append(self.ax.bar(x + 0.2, maxs, width=0.4, color='skyblue', label='Max'))
+        if not self._legend:
+            self.ax.legend()
+            self._legend = True
+        self._set_labels(x, labels)
+        self._rescale()
+        return self.save(path, title)
+
+
+class RadarTemplate(ChartTemplate):
+    figsize = (6, 6)
+    subplot_kw = {'polar': True}
+    kind = 'radar'
+    tight_layout = False
+
+    def render(self, labels, values, path, title=None, fmt='-', color=None, linewidth=2, alpha=0.25):
+        self._clear()
+        n = len(values)
+        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        closed_angles = np.append(angles, angles[0])
+        closed_values = np.append(values, values[0])
+        self._artists.extend(self.ax.plot(closed_angles, closed_values, fmt, color=color, linewidth=linewidth))
+        self._artists.extend(self.ax.fill(closed_angles, closed_values, color=color, alpha=alpha))
+        self._set_labels(angles, labels)
+        self._rescale()
+        return self.save(path, title)
+
+
+class BoxTemplate(ChartTemplate):
+    figsize = (6, 4)
+    kind = 'box'
+
+    def render(self, data, path, labels=None, title=None, vert=True):
+        self._clear()
+        parts = self.ax.boxplot(data, vert=vert)
+        self._artists.extend(artist for group in parts.values() for artist in group)
+        if labels is not None:
+            self._set_labels(np.arange(1, len(labels) + 1), labels)
+        self._rescale()
+        return self.save(path, title)
+
+
+class HistogramTemplate(ChartTemplate):
+    figsize = (6, 4)
+    kind = 'hist'
+
+    def render(self, values, path, title=None, bins=10, **style):
+        self._clear()
+        _, _, patches = self.ax.hist(values, bins=bins, **style)
+        self._artists.append(patches)
+        self._rescale()
+        return self.save(path, title)
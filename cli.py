@@ -0,0 +1,364 @@
+"""Single entry point for the sap analyses.
+
+    python cli.py fermentation --feedstock plantain [--input export.csv] [--stats-only [--bootstrap 100000] [--permutation]]
+    python cli.py fuel-properties --feedstock banana plantain [--ranges cassava.json] [--output-dir out] [--overview all.pdf]
+    python cli.py screen --ranges catalog.json --where "Octane number: min >= 95" "Flash point: max <= 15"
+    python cli.py composition [--script bab.py] [--metrics-only] [--input assays.csv]
+    python cli.py physicochemical-regression --feedstock banana [--stats-only]
+    python cli.py samples --feedstock banana [--start 2024-01-01 --end 2024-03-31] [--dataset composition] [--import assays.parquet]
+    python cli.py trend --metric p-value --analysis t-test --feedstock banana [--since 2025-01-01]
+    python cli.py serve [--port 8765] [--workers 4]
+    python cli.py import-budget
+    python cli.py [--embed-dpi 150] image-savings [--script sap.py deb.py]
+
+Without a *-only flag the matching report script is run unchanged; it
+writes a per-stage JSON profile to --profile-dir (see profiling.py). Report
+scripts and the *-only paths append their numbers to --results-db (see
+results_store.py), which `trend` queries. Charts are embedded from memory
+(figures.py), rendered for their embed width at --embed-dpi;
+--no-figure-files skips the image copies on disk and --native-charts writes
+the simple bar, min/max and line charts as editable Word charts
+(docx_charts.py) instead of pictures. Only argparse and the standard
+library are imported here; everything heavy is imported lazily inside
+pipelines.py.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+import pipelines
+
+# Measured import-time budget (ms, cumulative -X importtime of top-level
+# imports) for the fast paths. Reference box: pandas ~620 ms, scipy.special
+# ~450 ms (numpy shared). The full scripts also pull in matplotlib, seaborn,
+# scipy.stats, sklearn and python-docx (~3-5 s), none of which may appear here.
+IMPORT_BUDGET_MS = {
+    ('fermentation', '--stats-only'): 1500,
+    ('composition', '--metrics-only'): 1000,
+    ('physicochemical-regression', '--stats-only'): 1000,
+}
+FORBIDDEN_MODULES = ('matplotlib', 'seaborn', 'sklearn', 'docx', 'scipy.stats')
+REPORT_SCRIPTS = ['bab.py', 'sap.py', 'psap.py', 'deb.py', 'beb.py', 'plat.py', 'bbb.py', 'ggg.py',
+                  'banana.py', 'plantain.py', 'ethb.py', 'ethp.py']
+
+
+def _fermentation(args):
+    if not args.stats_only:
+        pipelines.run_script(pipelines.SCRIPTS['fermentation'][args.feedstock],
+                             [args.input] if args.input else [])
+        return
+    data = pipelines.load_fermentation_data(args.feedstock, args.input)
+    results = pipelines.fermentation_stats(data, n_boot=args.bootstrap, seed=args.seed,
+                                           permutation=args.permutation)
+    print(results['desc_stats'].to_string())
+    print(f"\nANOVA: F={results['anova']['F']:.3f}, p={results['anova']['p']:.5f}\n")
+    print(results['ttests'].to_string(index=False))
+    print('\nOne-way ANOVA, all responses\n' + results['responses'].to_string(index=False))
+    if 'twoway' in results:
+        print('\nTwo-way ANOVA\n' + results['twoway'].to_string())
+    if args.bootstrap:
+        boot = results['bootstrap']
+        print(f"\nBootstrap 95% CIs ({boot['n_boot']} resamples, seed {boot['seed']})")
+        print(boot['means'].to_string())
+        print(boot['differences'].to_string(index=False))
+        print(f"F: {boot['F']['F']:.3f} [{boot['F']['CI low']:.3f}, {boot['F']['CI high']:.3f}]")
+    if args.permutation:
+        perm = results['permutation']
+        omnibus = perm['omnibus']
+        print(f"\nPermutation omnibus: p={omnibus['p']:.5f} ({omnibus['n_perm']} permutations"
+              f"{', exact' if omnibus['exact'] else ''})")
+        print(perm['pairwise'].to_string(index=False))
+    from results_store import fermentation_rows, record_run
+    record_run('fermentation --stats-only', args.feedstock, fermentation_rows(results), source=args.input)
+
+
+def _fuel_properties(args):
+    tables = {}
+    if args.feedstock or not args.ranges:
+        from datasets import FUEL_PROPERTIES
+        tables = {f: FUEL_PROPERTIES[f] for f in args.feedstock or ['banana']}
+    if args.ranges:
+        import json
+        with open(args.ranges) as fh:
+            tables.update(json.load(fh))
+    for feedstock, path in pipelines.fuel_property_reports(
+            tables, args.output_dir, args.workers, args.overview).items():
+        print(f"{feedstock}: {path}")
+
+
+def _screen(args):
+    import json
+    from range_index import RangeIndex, parse_condition
+    tables = {}
+    if args.feedstock:
+        from datasets import FUEL_PROPERTIES
+        tables.update((f, FUEL_PROPERTIES[f]) for f in args.feedstock)
+    for path in args.ranges or []:
+        with open(path) as fh:
+            tables.update(json.load(fh))
+    try:
+        matches = RangeIndex.from_tables(tables).query([parse_condition(c) for c in args.where])
+    except ValueError as e:  # unknown property, relation or operator, or an unparsable condition
+        sys.exit(f"screen: {e}")
+    print('\n'.join(matches))
+    print(f"{len(matches)} of {len(tables)} feedstocks match", file=sys.stderr)
+
+
+def _composition(args):
+    if not args.metrics_only:
+        pipelines.run_script(args.script or pipelines.SCRIPTS['composition'][args.feedstock])
+        return
+    compositions = None
+    if args.input:
+        import pandas as pd
+        compositions = pd.read_csv(args.input)
+    derived = pipelines.composition_metrics(compositions)
+    print(derived.to_string())
+    from results_store import derived_rows, record_run
+    record_run('composition --metrics-only', args.feedstock, derived_rows(derived), source=args.input)
+
+
+def _physicochemical(args):
+    if not args.stats_only:
+        pipelines.run_script(pipelines.SCRIPTS['physicochemical-regression'][args.feedstock])
+        return
+    import pandas as pd
+    from datasets import PHYSICOCHEMICAL
+    results = pipelines.physicochemical_stats(pd.DataFrame(PHYSICOCHEMICAL[args.feedstock]))
+    from results_store import record_run, regression_rows
+    record_run('physicochemical-regression --stats-only', args.feedstock,
+               regression_rows(results['fit'], 'Ethanol yield', results['desc_stats']))
+    print(results['desc_stats'].to_string())
+    print('\n' + results['corr_matrix'].to_string())
+    if results['r2'] is None:
+        print(f"\nRegression not estimable ({results['fit']['n']} sample(s), rank-deficient design)")
+        return
+    print(f"\nIntercept: {results['intercept']:.4f}")
+    print(f"R² Score: {results['r2']:.4f}")
+    for feature, coef in results['coefficients'].items():
+        print(f"{feature}: {coef:.4f}")
+
+
+def _samples(args):
+    from sample_store import STORE_DIR, open_store, seed_frame, seed_hash, write_store
+    path = args.store or STORE_DIR
+    if args.import_path:
+        import pandas as pd
+        read = pd.read_parquet if args.import_path.lower().endswith(('.parquet', '.pq')) else pd.read_csv
+        write_store(read(args.import_path), path)
+    elif args.rebuild:
+        write_store(seed_frame(), path, seed=seed_hash())
+    store = open_store(path)
+    equals = {k: v for k, v in (('dataset', args.dataset), ('assay', args.assay), ('sample_id', args.sample)) if v}
+    rows = store.select(args.columns, args.feedstock, args.start, args.end, **equals)
+    print(rows.to_string(index=False))
+    print(f"{len(rows)} of {len(store)} rows", file=sys.stderr)
+
+
+def _trend(args):
+    from results_store import ResultsStore
+    with ResultsStore() as store:
+        if args.runs:
+            table = store.runs(args.feedstock, since=args.since, until=args.until)
+        else:
+            try:
+                table = store.trend_table(args.metric, columns=args.by, analysis=args.analysis,
+                                          feedstock=args.feedstock, response=args.response,
+                                          treatment=args.treatment, since=args.since, until=args.until)
+            except ValueError as e:
+                sys.exit(f"trend: {e}")
+    print(table.to_string(index=False))
+
+
+def _serve(args):
+    import service
+    return service.main(['--host', args.host, '--port', str(args.port), '--queue-size', str(args.queue_size)]
+                        + (['--workers', str(args.workers)] if args.workers else []))
+
+
+def _import_budget(args):
+    import tempfile
+    failed = False
+    # The timed runs record their results; keep them out of the real database
+    with tempfile.TemporaryDirectory() as scratch:
+        env = dict(os.environ, SAP_RESULTS_DB=os.path.join(scratch, 'results.sqlite'))
+        for (command, flag), budget in IMPORT_BUDGET_MS.items():
+            proc = subprocess.run(
+                [sys.executable, '-X', 'importtime', __file__, command, flag],
+                capture_output=True, text=True, cwd=pipelines.REPO_DIR, env=env,
+            )
+            # Top-level imports are the ones without indentation in the name column
+            total_us, modules = 0, set()
+            for line in proc.stderr.splitlines():
+                match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)', line)
+                if match:
+                    modules.add(match.group(3))
+                    if not match.group(2):
+                        total_us += int(match.group(1))
+            heavy = sorted(m for m in FORBIDDEN_MODULES if m in modules)
+            ok = proc.returncode == 0 and total_us / 1000 <= budget and not heavy
+            failed |= not ok
+            print(f"{command} {flag}: {total_us / 1000:.0f} ms (budget {budget} ms)"
+                  f"{' heavy imports: ' + ', '.join(heavy) if heavy else ''} {'OK' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+def _image_savings(args):
+    import json
+    import tempfile
+    total, legacy_total = 0, 0
+    with tempfile.TemporaryDirectory() as scratch:
+        # Charts are rendered both ways (figures.IMAGE_SAVINGS) with a cold
+        # cache, in a scratch directory so no report or image lands here
+        env = dict(os.environ, SAP_IMAGE_SAVINGS='1', SAP_FIGURE_COPIES='0',
+                   SAP_PROFILE_DIR=os.path.join(scratch, 'profiles'),
+                   CHART_CACHE_DIR=os.path.join(scratch, 'chart_cache'),
+                   SAP_RESULTS_DB=os.path.join(scratch, 'results.sqlite'))
+        print(f"{'chart':<48} {'kind':<8} {'before (stored in DOCX)':>24} {'after':>24} {'saved':>6}")
+        for script in args.script or REPORT_SCRIPTS:
+            profile_dir = os.path.join(scratch, 'profiles', script)
+            env['SAP_PROFILE_DIR'] = profile_dir
+            proc = subprocess.run([sys.executable, os.path.join(pipelines.REPO_DIR, script)],
+                                  capture_output=True, text=True, cwd=scratch, env=env)
+            if proc.returncode != 0:
+                last = proc.stderr.strip().splitlines()[-1:] or ['no output']
+                print(f"{script}: failed ({last[0]})")
+                continue
+            for name in sorted(os.listdir(profile_dir)):
+                if not name.endswith('.json'):
+                    continue
+                with open(os.path.join(profile_dir, name)) as f:
+                    images = json.load(f).get('images', [])
+                for image in images:
+                    if image.get('cached'):
+                        continue  # a repeat of a chart already counted, not rendered again
+                    before, after = image['legacy_stored_bytes'], image['stored_bytes']
+                    print(f"{script + ': ' + os.path.basename(image['path']):<48} {image['kind']:<8} "
+                          f"{'x'.join(map(str, image['legacy_pixels'])) + ' jpeg':>15} {before / 1024:>5.0f} kB "
+                          f"{'x'.join(map(str, image['pixels'])) + ' ' + image['format']:>15} {after / 1024:>5.0f} kB "
+                          f"{1 - after / before:>6.0%}")
+                    total += after
+                    legacy_total += before
+    if legacy_total:
+        print(f"total stored: {legacy_total / 1024:.0f} kB -> {total / 1024:.0f} kB "
+              f"({legacy_total - total:,} bytes saved, {1 - total / legacy_total:.0%})")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Banana/plantain sap analyses")
+    parser.add_argument('--profile-dir', help="where report scripts write their JSON run profile (default ./profiles)")
+    parser.add_argument('--results-db', help="SQLite file runs store their numbers in (default ./results.sqlite)")
+    parser.add_argument('--no-figure-files', action='store_true',
+                        help="embed charts from memory only; do not also write the image files")
+    parser.add_argument('--native-charts', action='store_true',
+                        help="write bar, min/max and line charts as native (editable) Word charts, not images")
+    parser.add_argument('--embed-dpi', type=float,
+                        help="print resolution report charts are rendered at for their embed width "
+                             "(default 150; 0 keeps each chart's own dpi)")
+    parser.add_argument('--cprofile-stage', help="also dump a cProfile .prof for this stage name")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('fermentation', help="viable cell count statistics and report")
+    p.add_argument('--feedstock', choices=['banana', 'plantain'], default='banana')
+    p.add_argument('--input', help="CSV/Parquet export instead of the built-in data")
+    p.add_argument('--stats-only', action='store_true', help="print statistics, skip charts and DOCX")
+    p.add_argument('--bootstrap', type=int, default=0, metavar='B', help="with --stats-only: bootstrap CIs from B resamples")
+    p.add_argument('--permutation', action='store_true', help="with --stats-only: permutation tests")
+    p.add_argument('--seed', type=int, default=0, help="bootstrap / permutation seed")
+    p.set_defaults(func=_fermentation)
+
+    p = sub.add_parser('fuel-properties', help="fuel property range charts and reports, one per feedstock")
+    p.add_argument('--feedstock', nargs='+', choices=['banana', 'plantain'],
+                   help="built-in range tables to report on (default banana unless --ranges is given)")
+    p.add_argument('--ranges', help='JSON {feedstock: {property: [min, max]}} of further feedstocks')
+    p.add_argument('--output-dir', default='.', help="where charts and reports are written")
+    p.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    p.add_argument('--overview', help="also draw all feedstocks as paged radar small multiples (.pdf or image path)")
+    p.set_defaults(func=_fuel_properties)
+
+    p = sub.add_parser('screen', help="list feedstocks whose fuel-property ranges meet every condition")
+    p.add_argument('--feedstock', nargs='+', choices=['banana', 'plantain'], help="include built-in range tables")
+    p.add_argument('--ranges', nargs='+', help='JSON {feedstock: {property: [min, max]}} catalog file(s)')
+    p.add_argument('--where', nargs='+', default=[],
+                   help="'Property: min|max OP value' or 'Property: overlaps|within|contains lo [hi]'")
+    p.set_defaults(func=_screen)
+
+    p = sub.add_parser('composition', help="sap composition and bioethanol metrics")
+    p.add_argument('--feedstock', choices=['banana', 'plantain'], default='banana')
+    p.add_argument('--script', choices=['bab.py', 'beb.py', 'deb.py', 'sap.py', 'psap.py'],
+                   help="report script to run (default depends on --feedstock)")
+    p.add_argument('--input', help="CSV of compositions, one sample per row (with --metrics-only)")
+    p.add_argument('--metrics-only', action='store_true', help="print derived metrics, skip charts and DOCX")
+    p.set_defaults(func=_composition)
+
+    p = sub.add_parser('physicochemical-regression', help="descriptive stats, correlation and regression")
+    p.add_argument('--feedstock', choices=['banana', 'plantain'], default='banana')
+    p.add_argument('--stats-only', action='store_true', help="print statistics, skip charts and DOCX")
+    p.set_defaults(func=_physicochemical)
+
+    p = sub.add_parser('samples', help="select assays from the columnar sample store")
+    p.add_argument('--store', help="store directory (default $SAP_SAMPLE_STORE or ./sample_store)")
+    p.add_argument('--feedstock', nargs='+')
+    p.add_argument('--start', help="first sampling date (YYYY-MM-DD, inclusive)")
+    p.add_argument('--end', help="last sampling date (YYYY-MM-DD, inclusive)")
+    p.add_argument('--dataset', nargs='+', help="composition, physicochemical, fuel-properties, ...")
+    p.add_argument('--assay', nargs='+')
+    p.add_argument('--sample', nargs='+', help="sample IDs")
+    p.add_argument('--columns', nargs='+', help="columns to read (default all)")
+    p.add_argument('--import', dest='import_path',
+                   help="replace the store with a long CSV/Parquet table (sample_id, feedstock, dataset, assay, unit, value[, date])")
+    p.add_argument('--rebuild', action='store_true', help="rebuild the store from datasets.py")
+    p.set_defaults(func=_samples)
+
+    p = sub.add_parser('trend', help="one metric across past runs, from the results database")
+    p.add_argument('--metric', default='p-value', help="F, p-value, t-statistic, mean, coef: pH, Ethanol (L/tonne fresh), ...")
+    p.add_argument('--analysis', help="descriptive, anova, t-test, two-way anova, bootstrap, permutation, regression, derived metrics")
+    p.add_argument('--feedstock', nargs='+')
+    p.add_argument('--response', help="measured variable, e.g. 'Viable Cell Count'")
+    p.add_argument('--treatment', nargs='+', help="e.g. 'Blank vs Acid treatment'")
+    p.add_argument('--since', help="ISO date or datetime")
+    p.add_argument('--until', help="ISO date or datetime")
+    p.add_argument('--by', choices=['treatment', 'response', 'feedstock', 'analysis'], default='treatment',
+                   help="one column per distinct value of this field; widened to analysis / response / treatment "
+                   "labels when a run has several values under one")
+    p.add_argument('--runs', action='store_true', help="list the stored runs instead")
+    p.set_defaults(func=_trend)
+
+    p = sub.add_parser('serve', help="local HTTP service that queues report jobs and returns DOCX")
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8765)
+    p.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    p.add_argument('--queue-size', type=int, default=256, help="queued jobs before submissions get 503")
+    p.set_defaults(func=_serve)
+
+    p = sub.add_parser('import-budget', help="check fast-path import times against IMPORT_BUDGET_MS")
+    p.set_defaults(func=_import_budget)
+
+    p = sub.add_parser('image-savings', help="render report charts the old and the embed-sized way, compare bytes")
+    p.add_argument('--script', nargs='+', choices=REPORT_SCRIPTS, help="report scripts to run (default all)")
+    p.set_defaults(func=_image_savings)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile_dir:
+        os.environ['SAP_PROFILE_DIR'] = args.profile_dir
+    if args.results_db:
+        os.environ['SAP_RESULTS_DB'] = args.results_db
+    if args.embed_dpi is not None:
+        os.environ['SAP_EMBED_DPI'] = str(args.embed_dpi)
+    if args.no_figure_files:
+        os.environ['SAP_FIGURE_COPIES'] = '0'
+    if args.native_charts:
+        os.environ['SAP_NATIVE_CHARTS'] = '1'
+    if args.cprofile_stage:
+        os.environ['SAP_CPROFILE_STAGE'] = args.cprofile_stage
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# Measured datasets shared by the analysis scripts and cli.py.
+# Plain dicts/lists only, so importing this module costs nothing.
+
+# Fermentation time courses (banana.py / plantain.py)
+BANANA_FERMENTATION = {
+    'Time Point': ['72 hrs', '72 hrs', '72 hrs', '4 days', '4 days', '4 days',
+                   '5 days', '5 days', '5 days', '6 days', '6 days', '6 days'],
+    'Sample Type': ['Blank', 'Acid treatment', 'Alkaline treatment'] * 4,
+    'Viable Cell Count': [0.000, 1.570, 1.796, 0.000, 1.610, 1.836,
+                          0.000, 1.724, 1.912, 0.000, 1.411, 1.725],
+    'pH': [7.0, 5.0, 8.0, 7.0, 4.8, 8.6, 7.0, 5.5, 8.2, 7.0, 5.0, 8.0],
+    'Temperature': [30] * 12
+}
+
+PLANTAIN_FERMENTATION = {
+    'Time Point': ['72 hrs']*6 + ['4 days']*6 + ['5 days']*6 + ['6 days']*6,
+    'Sample Type': ['Blank', 'Untreated', 'Acid treatment', 'Alkaline treatment', 'Enzyme', 'Acid w/o organism']*4,
+    'Viable Cell Count': [
+        0.000, 1.692, 1.747, 1.600, 1.557, 1.277,
+        0.000, 1.752, 1.931, 1.810, 1.627, 1.422,
+        0.000, 1.810, 1.985, 1.892, 1.714, 1.623,
+        0.000, 1.943, 1.742, 1.648, 1.557, 1.610
+    ],
+    'pH': [
+        7.0, 6.2, 5.5, 8.7, 6.4, 5.7,
+        7.0, 5.8, 5.2, 7.6, 6.1, 5.1,
+        7.0, 6.2, 5.5, 8.7, 6.4, 5.7,
+        7.0, 5.9, 5.3, 8.1, 6.1, 5.5
+    ],
+    'Temperature': [30]*24
+}
+
+# Physicochemical properties (bbb.py / ggg.py)
+BANANA_PHYSICOCHEMICAL = {
+    'Ethanol concentration': [32.70],
+    'Ethanol yield': [0.50],
+    'pH': [5.4],
+    'Density': [0.98],
+    'Viscosity': [1.30],
+    'Total Acidity': [0.50]
+}
+
+PLANTAIN_PHYSICOCHEMICAL = {
+    'Ethanol concentration': [36.50],
+    'Ethanol yield': [0.62],
+    'pH': [5.6],
+    'Density': [0.98],
+    'Viscosity': [1.70],
+    'Total Acidity': [0.4]
+}
+
+# Sap composition (bab.py / beb.py / deb.py)
+BANANA_SAP_COMPOSITION = {
+    "Moisture (%)": 95.81,
+    "Protein (%)": 1.75,
+    "Fat/Lipid (%)": 0.23,
+    "Fibre (%)": 0.00,
+    "Ash (%)": 0.12,
+    "Carbohydrate (%)": 2.08,
+    "Energy (kcal/100g)": 17.39,
+    "Lignin (%)": 0.01,
+    "Hemicellulose (%)": 0.51,
+    "Cellulose (%)": 0.58,
+    "Sugar (%)": 5.13
+}
+
+# Sap sample behind sap.py (a different banana sap batch; energy reported in MJ/kg)
+BANANA_SAP_COMPOSITION_B = {
+    "Moisture (%)": 85.2,
+    "Fibre (%)": 3.1,
+    "Ash (%)": 1.2,
+    "Protein (%)": 1.5,
+    "Fat/Lipid (%)": 0.3,
+    "Carbohydrate (%)": 8.7,
+    "Energy (MJ/kg)": 16.5,
+    "Lignin (%)": 12.3,
+    "Cellulose (%)": 25.4,
+    "Hemicellulose (%)": 18.7,
+    "Sugar (%)": 9.8
+}
+
+# Plantain sap composition (psap.py)
+PLANTAIN_SAP_COMPOSITION = {
+    "Moisture (%)": 95.62,
+    "Protein (%)": 1.63,
+    "Fat/Lipid (%)": 0.25,
+    "Fibre (%)": 0.0,
+    "Ash (%)": 0.15,
+    "Carbohydrate (%)": 2.34,
+    "Energy (kcal/100g)": 18.13,
+    "Lignin (%)": 0.01,
+    "Hemicellulose (%)": 0.52,
+    "Cellulose (%)": 0.61,
+    "Sugar (%)": 5.13
+}
+
+# Fuel property (min, max) ranges (ethb.py / ethp.py)
+BANANA_FUEL_PROPERTIES = {
+    "Octane number": (92, 105),
+    "Flash point": (13, 15),
+    "Density": (0.79, 0.80),
+    "Viscosity": (1.1, 1.3),
+    "Vapor pressure": (5.5, 6.0),
+    "Calorific value": (26.5, 27.0),
+    "Boiling point": (78, 78),
+    "Freezing point": (-114, -95),
+    "Autoignition temp.": (360, 370)
+}
+
+PLANTAIN_FUEL_PROPERTIES = {
+    "Octane number": (90, 110),
+    "Flash point": (13, 16),
+    "Density": (0.79, 0.81),
+    "Viscosity": (1.1, 1.4),
+    "Vapor pressure": (5.5, 6.2),
+    "Calorific value": (26.5, 27.5),
+    "Boiling point": (78, 78),
+    "Freezing point": (-114, -95),
+    "Autoignition temp.": (360, 370)
+}
+
+# Units of the physicochemical and fuel-property columns above (composition
+# keys carry their unit in the name)
+UNITS = {
+    'Ethanol concentration': '%',
+    'Ethanol yield': 'g/g',
+    'pH': '',
+    'Density': 'g/cm³',
+    'Viscosity': 'mPa·s',
+    'Total Acidity': '%',
+    'Octane number': '',
+    'Flash point': '°C',
+    'Vapor pressure': 'kPa',
+    'Calorific value': 'MJ/kg',
+    'Boiling point': '°C',
+    'Freezing point': '°C',
+    'Autoignition temp.': '°C',
+}
+
+FERMENTATION = {'banana': BANANA_FERMENTATION, 'plantain': PLANTAIN_FERMENTATION}
+PHYSICOCHEMICAL = {'banana': BANANA_PHYSICOCHEMICAL, 'plantain': PLANTAIN_PHYSICOCHEMICAL}
+FUEL_PROPERTIES = {'banana': BANANA_FUEL_PROPERTIES, 'plantain': PLANTAIN_FUEL_PROPERTIES}
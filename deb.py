@@ -1,31 +1,32 @@
 import os
-import matplotlib.pyplot as plt
+import pandas as pd
 from docx import Document
 from docx.shared import Inches
+from chart_cache import cached_chart
+from docx_charts import add_figure
+from docx_tables import add_dataframe_table
+from derived_metrics import derive_metrics
+from sample_store import open_store
+from profiling import RunProfile
+from results_store import derived_rows, record_run
+
+profile = RunProfile('deb')
+profile.stage('data load')
 
 # === Data ===
-banana_sap_composition = {
-    "Moisture (%)": 95.81,
-    "Protein (%)": 1.75,
-    "Fat/Lipid (%)": 0.23,
-    "Fibre (%)": 0.00,
-    "Ash (%)": 0.12,
-    "Carbohydrate (%)": 2.08,
-    "Energy (kcal/100g)": 17.39,
-    "Lignin (%)": 0.01,
-    "Hemicellulose (%)": 0.51,
-    "Cellulose (%)": 0.58,
-    "Sugar (%)": 5.13
-}
+banana_sap_composition = open_store().record('banana-sap-1', feedstock='banana')
 
 # === Derived metrics ===
-moisture = banana_sap_composition["Moisture (%)"]
-dry_matter = 100 - moisture
-sugar = banana_sap_composition["Sugar (%)"]
-energy = banana_sap_composition["Energy (kcal/100g)"]
+profile.stage('derived metrics')
+derived = derive_metrics(pd.DataFrame([banana_sap_composition]), ethanol_per_sugar=0.51).iloc[0]  # 0.51 g ethanol per g sugar
 
-energy_per_sugar = energy / sugar if sugar != 0 else 0
-ethanol_yield = sugar * 0.51  # 0.51 g ethanol per g sugar
+moisture = derived["Moisture (%)"]
+dry_matter = derived["Dry matter (%)"]
+sugar = derived["Sugar (g/100g fresh)"]
+energy = derived["Energy (kcal/100g fresh)"]
+
+energy_per_sugar = derived["Energy per g sugar (kcal/g)"]
+ethanol_yield = derived["Ethanol (g/100g fresh)"]
 
 metrics = {
     "Moisture (%)": moisture,
@@ -45,72 +46,48 @@ os.makedirs(output_dir, exist_ok=True)
 proximate = {k: v for k, v in banana_sap_composition.items() if k in [
     "Moisture (%)", "Protein (%)", "Fat/Lipid (%)", "Fibre (%)", "Ash (%)", "Carbohydrate (%)"
 ]}
-plt.figure(figsize=(8, 5))
-plt.bar(proximate.keys(), proximate.values(), color="skyblue")
-plt.title("Proximate Composition of Banana Sap")
-plt.ylabel("Percentage (%)")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-proximate_path = os.path.join(output_dir, "proximate_composition.jpg")
-plt.savefig(proximate_path, dpi=300)
-plt.close()
+proximate_path = os.path.join(output_dir, "proximate_composition.png")
+profile.stage('chart: proximate', output=proximate_path)
+proximate_img = cached_chart(proximate_path, embed_width=5, kind="bar", data=proximate,
+                             title="Proximate Composition of Banana Sap", ylabel="Percentage (%)", color="skyblue",
+                             figsize=(8, 5), rotation=(45, "right"), dpi=300)
 
 # Bioethanol relevant metrics: energy → sugar
 bioethanol = {k: v for k, v in banana_sap_composition.items() if k in [
     "Energy (kcal/100g)", "Lignin (%)", "Hemicellulose (%)", "Cellulose (%)", "Sugar (%)"
 ]}
-plt.figure(figsize=(8, 5))
-plt.bar(bioethanol.keys(), bioethanol.values(), color="orange")
-plt.title("Bioethanol-Relevant Metrics of Banana Sap")
-plt.ylabel("Value")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-bioethanol_path = os.path.join(output_dir, "bioethanol_metrics.jpg")
-plt.savefig(bioethanol_path, dpi=300)
-plt.close()
+bioethanol_path = os.path.join(output_dir, "bioethanol_metrics.png")
+profile.stage('chart: bioethanol', output=bioethanol_path)
+bioethanol_img = cached_chart(bioethanol_path, embed_width=5, kind="bar", data=bioethanol,
+                              title="Bioethanol-Relevant Metrics of Banana Sap", ylabel="Value", color="orange",
+                              figsize=(8, 5), rotation=(45, "right"), dpi=300)
 
 # === Word report ===
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading("Statistical and Bioethanol Analysis of Banana Sap", 0)
 
 # Overall composition table
+profile.stage('docx: General Composition Data')
 doc.add_heading("General Composition Data", level=1)
-table = doc.add_table(rows=1, cols=2)
-hdr_cells = table.rows[0].cells
-hdr_cells[0].text = "Metric"
-hdr_cells[1].text = "Value"
-for k, v in banana_sap_composition.items():
-    row_cells = table.add_row().cells
-    row_cells[0].text = k
-    row_cells[1].text = str(v)
+add_dataframe_table(doc, pd.DataFrame(list(banana_sap_composition.items()), columns=["Metric", "Value"]))
 
 # Derived metrics table
+profile.stage('docx: Derived Metrics')
 doc.add_heading("Derived Metrics", level=1)
-table = doc.add_table(rows=1, cols=2)
-hdr_cells = table.rows[0].cells
-hdr_cells[0].text = "Metric"
-hdr_cells[1].text = "Value"
-for k, v in metrics.items():
-    row_cells = table.add_row().cells
-    row_cells[0].text = k
-    row_cells[1].text = f"{v:.2f}"
+add_dataframe_table(doc, pd.DataFrame(list(metrics.items()), columns=["Metric", "Value"]), formats={"Value": "{:.2f}"})
 
 # Proximate composition section
+profile.stage('docx: Proximate Composition')
 doc.add_heading("Proximate Composition", level=1)
 
 # Table for proximate composition
 doc.add_paragraph("The proximate composition values are presented below:")
-table = doc.add_table(rows=1, cols=2)
-hdr_cells = table.rows[0].cells
-hdr_cells[0].text = "Component"
-hdr_cells[1].text = "Percentage (%)"
-for k, v in proximate.items():
-    row_cells = table.add_row().cells
-    row_cells[0].text = k
-    row_cells[1].text = f"{v:.2f}"
+add_dataframe_table(doc, pd.DataFrame(list(proximate.items()), columns=["Component", "Percentage (%)"]),
+                    formats={"Percentage (%)": "{:.2f}"})
 
 # Graph
-doc.add_picture(proximate_path, width=Inches(5))
+add_figure(doc, proximate_img, Inches(5))
 
 # Discussion
 doc.add_heading("Discussion: Proximate Composition", level=2)
@@ -126,21 +103,15 @@ doc.add_paragraph(
 )
 
 # Bioethanol metrics section
+profile.stage('docx: Bioethanol-Relevant Metrics')
 doc.add_heading("Bioethanol-Relevant Metrics", level=1)
 
 # Table for bioethanol metrics
 doc.add_paragraph("The bioethanol-relevant metrics are summarized below:")
-table = doc.add_table(rows=1, cols=2)
-hdr_cells = table.rows[0].cells
-hdr_cells[0].text = "Metric"
-hdr_cells[1].text = "Value"
-for k, v in bioethanol.items():
-    row_cells = table.add_row().cells
-    row_cells[0].text = k
-    row_cells[1].text = f"{v:.2f}"
+add_dataframe_table(doc, pd.DataFrame(list(bioethanol.items()), columns=["Metric", "Value"]), formats={"Value": "{:.2f}"})
 
 # Graph
-doc.add_picture(bioethanol_path, width=Inches(5))
+add_figure(doc, bioethanol_img, Inches(5))
 
 # Discussion
 doc.add_heading("Discussion: Bioethanol-Relevant Metrics", level=2)
@@ -157,6 +128,7 @@ doc.add_paragraph(
 )
 
 # Conclusion
+profile.stage('docx: Conclusion')
 doc.add_heading("Conclusion", level=1)
 doc.add_paragraph(
     f"In conclusion, banana sap is predominantly water but contains a fermentable "
@@ -169,6 +141,12 @@ doc.add_paragraph(
 
 # Save document
 doc_path = os.path.join(output_dir, "banana_sap_analysis_report.docx")
+profile.stage('save', output=doc_path)
 doc.save(doc_path)
 
+# === Results database ===
+profile.stage('results db')
+record_run('deb', 'banana', derived_rows(derived), started=profile.started)
+
 print("Analysis complete. Files saved in:", output_dir)
+profile.finish()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+# Theoretical conversion constants (see beb.py methods section)
+ETHANOL_PER_SUGAR = 0.511   # g ethanol per g sugar
+ETHANOL_DENSITY = 0.789     # g/mL
+
+# Inputs that stay on a fresh basis
+NON_DRY_BASIS = ["Moisture (%)", "Energy (kcal/100g)"]
+
+SUMMARY_COLUMNS = [
+    "Moisture (%)",
+    "Dry matter (%)",
+    "Sugar (g/100g fresh)",
+    "Energy (kcal/100g fresh)",
+    "Energy per g sugar (kcal/g)",
+    "Ethanol (g/100g fresh)",
+    "Ethanol (mL/100g fresh)",
+    "Ethanol (L/tonne fresh)",
+]
+
+
+def derive_metrics(compositions, ethanol_per_sugar=ETHANOL_PER_SUGAR, ethanol_density=ETHANOL_DENSITY):
+    """Derived sap metrics for N samples at once.
+
+    `compositions` has one row per sample and the composition keys used in
+    the scripts as columns ("Moisture (%)", "Sugar (%)", "Energy (kcal/100g)",
+    ...). Returns an N-row frame with SUMMARY_COLUMNS followed by a
+    "<component> (dry-basis %)" column for every other composition column.
+    Energy per g sugar is 0 where sugar is 0 (the deb.py guard).
+    """
+    comp = pd.DataFrame(compositions)
+    moisture = comp["Moisture (%)"].to_numpy(dtype=float)
+    sugar = comp["Sugar (%)"].to_numpy(dtype=float)
+    energy = comp["Energy (kcal/100g)"].to_numpy(dtype=float)
+
+    dry_matter = 100 - moisture
+    safe_sugar = np.where(sugar != 0, sugar, 1.0)
+    energy_per_g_sugar = np.where(sugar != 0, energy / safe_sugar, 0.0)
+
+    ethanol_g_100g = sugar * ethanol_per_sugar
+    ethanol_ml_100g = ethanol_g_100g / ethanol_density
+    ethanol_l_tonne = ethanol_ml_100g * 10_000 / 1000
+
+    out = {
+        "Moisture (%)": moisture,
+        "Dry matter (%)": dry_matter,
+        "Sugar (g/100g fresh)": sugar,
+        "Energy (kcal/100g fresh)": energy,
+        "Energy per g sugar (kcal/g)": energy_per_g_sugar,
+        "Ethanol (g/100g fresh)": ethanol_g_100g,
+        "Ethanol (mL/100g fresh)": ethanol_ml_100g,
+        "Ethanol (L/tonne fresh)": ethanol_l_tonne,
+    }
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for col in comp.columns:
+            if col not in NON_DRY_BASIS:
+                out[col + " (dry-basis %)"] = comp[col].to_numpy(dtype=float) / dry_matter * 100
+    return pd.DataFrame(out, index=comp.index)
@@ -0,0 +1,260 @@
+import io
+import math
+import zipfile
+from xml.sax.saxutils import escape
+
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.part import Part
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+# Native Word charts: the chart is a DrawingML part (word/charts/chartN.xml)
+# holding the categories and values in its caches, plus the same table as an
+# embedded workbook so "Edit Data" works in Word. Nothing is rasterized and
+# matplotlib is never imported; the chart stays editable in the document.
+# Report scripts get these from chart_cache.cached_chart() /
+# fuel_properties.run() when figures.NATIVE_CHARTS is on and add them with
+# add_figure(), which takes either a NativeChart or an image.
+
+C_NS = 'http://schemas.openxmlformats.org/drawingml/2006/chart'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# matplotlib colour names used by the report scripts, and seaborn's "deep"
+# palette for series without a colour (what sns.lineplot draws with)
+COLORS = {
+    'skyblue': '87CEEB', 'lightgreen': '90EE90', 'orange': 'FFA500', 'coral': 'FF7F50',
+    'mediumseagreen': '3CB371', 'green': '008000', 'red': 'FF0000', 'blue': '0000FF',
+}
+DEEP = ['4C72B0', 'DD8452', '55A868', 'C44E52', '8172B3', '937860', 'DA8BC3', '8C8C8C', 'CCB974', '64B5CD']
+
+
+def _rgb(color, i=0):
+    if color is None:
+        return DEEP[i % len(DEEP)]
+    if color.startswith('#') and len(color) == 7:
+        return color[1:].upper()
+    if color not in COLORS:
+        raise ValueError(f'no native chart colour for {color!r}; use #rrggbb')
+    return COLORS[color]
+
+
+def _column(n):
+    """0 -> 'A', 25 -> 'Z', 26 -> 'AA'."""
+    name = ''
+    n += 1
+    while n:
+        n, rem = divmod(n - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def _rotation(rotation):
+    """matplotlib xticks rotation (degrees, or (degrees, ha)) -> DrawingML bodyPr rot."""
+    if isinstance(rotation, (tuple, list)):
+        rotation = rotation[0]
+    return -int(round((rotation or 0) * 60000))
+
+
+class NativeChart:
+    """A chart to be written as a DrawingML part.
+
+    kind: 'bar' (clustered columns, one slot per category) or 'line';
+    series: [(name, values, colour)], values aligned with `categories`
+    (NaN/None leaves a gap). overlap=True draws the series on top of each
+    other in one slot, later series in front.
+    """
+
+    def __init__(self, kind, categories, series, title=None, xlabel=None, ylabel=None,
+                 rotation=0, overlap=False, aspect=5 / 8):
+        self.kind = kind
+        self.categories = [str(c) for c in categories]
+        self.series = [(str(name), [None if v is None or math.isnan(v) else float(v) for v in values], color)
+                       for name, values, color in series]
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.rotation = rotation
+        self.overlap = overlap
+        self.aspect = aspect
+
+    # --- chart part ---------------------------------------------------------
+
+    @staticmethod
+    def _cache(values, ref, numeric):
+        pts = ''.join(f'<c:pt idx="{i}"><c:v>{v if numeric else escape(v)}</c:v></c:pt>'
+                      for i, v in enumerate(values) if v is not None)
+        if numeric:
+            return (f'<c:numRef><c:f>{ref}</c:f><c:numCache><c:formatCode>General</c:formatCode>'
+                    f'<c:ptCount val="{len(values)}"/>{pts}</c:numCache></c:numRef>')
+        return f'<c:strRef><c:f>{ref}</c:f><c:strCache><c:ptCount val="{len(values)}"/>{pts}</c:strCache></c:strRef>'
+
+    def _series_xml(self):
+        n = len(self.categories)
+        cat_ref = f'Sheet1!$A$2:$A${n + 1}'
+        out = []
+        for i, (name, values, color) in enumerate(self.series):
+            col = _column(i + 1)
+            rgb = _rgb(color, i)
+            if self.kind == 'line':
+                style = (f'<c:spPr><a:ln w="28575" cap="rnd"><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
+                         f'<a:round/></a:ln></c:spPr><c:marker><c:symbol val="circle"/><c:size val="5"/>'
+                         f'<c:spPr><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill></c:spPr></c:marker>')
+            else:
+                style = (f'<c:spPr><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill></c:spPr>'
+                         f'<c:invertIfNegative val="0"/>')
+            out.append(
+                f'<c:ser><c:idx val="{i}"/><c:order val="{i}"/>'
+                f'<c:tx>{self._cache([name], f"Sheet1!${col}$1", False)}</c:tx>{style}'
+                f'<c:cat>{self._cache(self.categories, cat_ref, False)}</c:cat>'
+                f'<c:val>{self._cache(values, f"Sheet1!${col}$2:${col}${n + 1}", True)}</c:val>'
+                + ('<c:smooth val="0"/>' if self.kind == 'line' else '') + '</c:ser>')
+        return ''.join(out)
+
+    @staticmethod
+    def _title(text, rot=None):
+        body = f'<a:bodyPr rot="{rot}" vert="horz"/>' if rot is not None else '<a:bodyPr/>'
+        return (f'<c:title><c:tx><c:rich>{body}<a:p><a:r><a:t>{escape(text)}</a:t></a:r></a:p></c:rich></c:tx>'
+                f'<c:overlay val="0"/></c:title>')
+
+    def chart_xml(self):
+        if self.kind == 'line':
+            plot = (f'<c:lineChart><c:grouping val="standard"/><c:varyColors val="0"/>{self._series_xml()}'
+                    f'<c:marker val="1"/><c:axId val="1"/><c:axId val="2"/></c:lineChart>')
+        else:
+            layout = '<c:gapWidth val="100"/><c:overlap val="100"/>' if self.overlap else '<c:gapWidth val="150"/>'
+            plot = (f'<c:barChart><c:barDir val="col"/><c:grouping val="clustered"/><c:varyColors val="0"/>'
+                    f'{self._series_xml()}{layout}<c:axId val="1"/><c:axId val="2"/></c:barChart>')
+        rot = _rotation(self.rotation)
+        tick_text = (f'<c:txPr><a:bodyPr rot="{rot}" vert="horz"/><a:lstStyle/><a:p><a:pPr><a:defRPr/></a:pPr>'
+                     f'<a:endParaRPr lang="en-US"/></a:p></c:txPr>') if rot else ''
+        cat_ax = ('<c:catAx><c:axId val="1"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+                  '<c:delete val="0"/><c:axPos val="b"/>'
+                  + (self._title(self.xlabel) if self.xlabel else '')
+                  + '<c:numFmt formatCode="General" sourceLinked="0"/><c:majorTickMark val="out"/>'
+                  '<c:minorTickMark val="none"/><c:tickLblPos val="nextTo"/>' + tick_text
+                  + '<c:crossAx val="2"/><c:crosses val="autoZero"/><c:auto val="1"/><c:lblAlgn val="ctr"/>'
+                  '<c:lblOffset val="100"/><c:noMultiLvlLbl val="0"/></c:catAx>')
+        val_ax = ('<c:valAx><c:axId val="2"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+                  '<c:delete val="0"/><c:axPos val="l"/><c:majorGridlines/>'
+                  + (self._title(self.ylabel, -5400000) if self.ylabel else '')
+                  + '<c:numFmt formatCode="General" sourceLinked="1"/><c:majorTickMark val="out"/>'
+                  '<c:minorTickMark val="none"/><c:tickLblPos val="nextTo"/><c:crossAx val="1"/>'
+                  '<c:crosses val="autoZero"/><c:crossBetween val="between"/></c:valAx>')
+        legend = '<c:legend><c:legendPos val="r"/><c:overlay val="0"/></c:legend>' if len(self.series) > 1 else ''
+        return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<c:chartSpace xmlns:c="{C_NS}" xmlns:a="{A_NS}" xmlns:r="{R_NS}">'
+                f'<c:roundedCorners val="0"/><c:chart>'
+                + (self._title(self.title) + '<c:autoTitleDeleted val="0"/>' if self.title
+                   else '<c:autoTitleDeleted val="1"/>')
+                + f'<c:plotArea><c:layout/>{plot}{cat_ax}{val_ax}</c:plotArea>{legend}'
+                f'<c:plotVisOnly val="1"/><c:dispBlanksAs val="gap"/></c:chart>'
+                f'<c:externalData r:id="rId1"><c:autoUpdate val="0"/></c:externalData>'
+                f'</c:chartSpace>').encode('utf-8')
+
+    # --- embedded workbook --------------------------------------------------
+
+    def workbook(self):
+        """The chart's table as a minimal .xlsx (categories in A, one column per series)."""
+        def cell(ref, value):
+            if isinstance(value, str):
+                return f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+            return f'<c r="{ref}"><v>{value}</v></c>' if value is not None else ''
+
+        rows = [[''] + [name for name, _, _ in self.series]]
+        rows += [[category] + [values[i] for _, values, _ in self.series]
+                 for i, category in enumerate(self.categories)]
+        sheet_rows = ''.join(
+            f'<row r="{r + 1}">' + ''.join(cell(f'{_column(c)}{r + 1}', v) for c, v in enumerate(row)) + '</row>'
+            for r, row in enumerate(rows))
+        ss = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+        files = {
+            '[Content_Types].xml':
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/worksheets/sheet1.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/></Types>',
+            '_rels/.rels':
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{RT.OFFICE_DOCUMENT}" Target="xl/workbook.xml"/></Relationships>',
+            'xl/workbook.xml':
+                f'<workbook xmlns="{ss}" xmlns:r="{R_NS}"><sheets>'
+                '<sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>',
+            'xl/_rels/workbook.xml.rels':
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{R_NS}/worksheet" Target="worksheets/sheet1.xml"/></Relationships>',
+            'xl/worksheets/sheet1.xml': f'<worksheet xmlns="{ss}"><sheetData>{sheet_rows}</sheetData></worksheet>',
+        }
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as z:
+            for name, xml in files.items():
+                z.writestr(name, '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + xml)
+        return buffer.getvalue()
+
+    # --- document -----------------------------------------------------------
+
+    def add_to(self, doc, width):
+        """Append the chart to `doc` in its own paragraph, `width` wide (a docx Length)."""
+        package = doc.part.package
+        chart_part = Part(package.next_partname('/word/charts/chart%d.xml'), CT.DML_CHART, self.chart_xml(), package)
+        workbook_part = Part(package.next_partname('/word/embeddings/Microsoft_Excel_Sheet%d.xlsx'),
+                             CT.SML_SHEET, self.workbook(), package)
+        chart_part.relate_to(workbook_part, RT.PACKAGE)  # rId1, as chart_xml() refers to it
+        rid = doc.part.relate_to(chart_part, RT.CHART)
+        shape_id = doc.part.next_id
+        cx, cy = int(width), int(width * self.aspect)
+        drawing = parse_xml(
+            f'<w:drawing {nsdecls("w", "wp", "a", "r")}><wp:inline distT="0" distB="0" distL="0" distR="0">'
+            f'<wp:extent cx="{cx}" cy="{cy}"/><wp:effectExtent l="0" t="0" r="0" b="0"/>'
+            f'<wp:docPr id="{shape_id}" name="Chart {shape_id}"/><wp:cNvGraphicFramePr/>'
+            f'<a:graphic><a:graphicData uri="{C_NS}"><c:chart xmlns:c="{C_NS}" r:id="{rid}"/>'
+            f'</a:graphicData></a:graphic></wp:inline></w:drawing>')
+        run = doc.add_paragraph().add_run()
+        run._r.append(drawing)
+        return run
+
+
+def bar_chart(labels, values, title=None, ylabel=None, color=None, rotation=0, figsize=(8, 5)):
+    """Single-series column chart (plt.bar equivalent)."""
+    return NativeChart('bar', labels, [('Value', values, color)], title=title, ylabel=ylabel,
+                       rotation=rotation, aspect=figsize[1] / figsize[0])
+
+
+def minmax_chart(data_subset, title, overlap=False):
+    """Min/max columns of a {property: (min, max)} dict, as render.minmax_bar draws them."""
+    labels = list(data_subset)
+    mins = [data_subset[k][0] for k in labels]
+    maxs = [data_subset[k][1] for k in labels]
+    series = [('Max', maxs, 'skyblue'), ('Min', mins, 'orange')] if overlap else \
+        [('Min', mins, 'orange'), ('Max', maxs, 'skyblue')]
+    return NativeChart('bar', labels, series, title=title, rotation=45, overlap=overlap)
+
+
+def line_chart(data, x, y, hue, title=None, xlabel=None, ylabel=None):
+    """One line per `hue` level through the mean `y` at each `x` (sns.lineplot equivalent), from long-form data.
+
+    x runs as on seaborn's axis: in category order when `data[x]` is
+    categorical, sorted when numeric, in order of appearance otherwise
+    (labels like '72 hrs', '4 days' have no sort order of their own).
+    """
+    means = data.groupby([x, hue], observed=True, sort=False)[y].mean().unstack(hue)
+    if data[x].dtype.name == 'category':
+        order = data[x].cat.remove_unused_categories().cat.categories
+    elif data[x].dtype.kind in 'iufmM':
+        order = sorted(data[x].dropna().unique())
+    else:
+        order = data[x].dropna().unique()
+    means = means.reindex(index=order, columns=data[hue].unique())
+    return NativeChart('line', means.index, [(name, means[name].tolist(), None) for name in means.columns],
+                       title=title, xlabel=xlabel if xlabel is not None else x,
+                       ylabel=ylabel if ylabel is not None else y)
+
+
+def add_figure(doc, figure, width):
+    """Add a chart to `doc`: a NativeChart as a chart part, anything else (path or buffer) as a picture."""
+    if isinstance(figure, NativeChart):
+        return figure.add_to(doc, width)
+    return doc.add_picture(figure, width=width)
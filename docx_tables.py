@@ -0,0 +1,69 @@
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+
+def _format(value, spec):
+    if spec is None:
+        return str(value)
+    if callable(spec):
+        return spec(value)
+    return spec.format(value)
+
+
+def add_dataframe_table(doc, df, formats=None, float_format=None, style=None,
+                        index=False, index_label=''):
+    """Write a whole DataFrame as a DOCX table in one pass.
+
+    The header row is created through python-docx (so the table grid, widths
+    and style are the usual ones); the body rows are rendered as one XML
+    string and appended at once instead of calling add_row() per row.
+
+    formats: {column: "{:.4f}" or callable}. Columns without an entry use
+    float_format for float values and str() otherwise.
+    """
+    formats = formats or {}
+    columns = list(df.columns)
+    headers = ([index_label] if index else []) + [str(c) for c in columns]
+
+    table = doc.add_table(rows=1, cols=len(headers))
+    if style is not None:
+        table.style = style
+    for cell, text in zip(table.rows[0].cells, headers):
+        cell.text = text
+
+    # Per-column formatter, resolved once
+    specs = []
+    for col in columns:
+        if col in formats:
+            specs.append(formats[col])
+        elif float_format is not None and df[col].dtype.kind == 'f':
+            specs.append(float_format)
+        else:
+            specs.append(None)
+
+    # Format column by column (no per-row boxing), then transpose into rows
+    values = [df[col].tolist() for col in columns]
+    if index:
+        specs = [formats.get(index_label)] + specs
+        values = [df.index.tolist()] + values
+
+    # Give every body cell the same width as its header cell
+    tc_props = []
+    for tc in table._tbl.tr_lst[0].tc_lst:
+        width = tc.width
+        tc_props.append(f'<w:tcPr><w:tcW w:w="{width.twips}" w:type="dxa"/></w:tcPr>' if width is not None else '')
+
+    columns_xml = [
+        [f'<w:tc>{pr}<w:p><w:r><w:t xml:space="preserve">{escape(_format(v, spec))}</w:t></w:r></w:p></w:tc>' for v in col]
+        for col, spec, pr in zip(values, specs, tc_props)
+    ]
+    body = ['<w:tr>' + ''.join(cells) + '</w:tr>' for cells in zip(*columns_xml)]
+
+    if body:
+        fragment = parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(body)}</w:tbl>')
+        tbl = table._tbl
+        for tr in fragment.findall(qn('w:tr')):
+            tbl.append(tr)
+    return table
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+from scipy.special import fdtrc
+
+# Two-way (A x B) ANOVA with Type II sums of squares.
+#
+# The design is reduced once to the A x B incidence matrix N (cell counts)
+# plus per-level and per-cell sums. Every model the table needs is then
+# fitted without forming the dummy-coded design:
+#   - A only, B only, A x B (cell means): residual SS straight from bincount
+#   - A + B (additive): the normal equations reduced to the b x b Schur
+#     complement  C = diag(n_B) - N' diag(1 / n_A) N
+# so the cost grows with the number of time points only through N, and
+# hundreds of sampling times stay cheap as long as B (treatments) is small.
+#
+# With one observation per cell (the fermentation tables) the interaction
+# has no degrees of freedom left to test against; it is then used as the
+# error term, which is the randomized-block / repeated-measures analysis
+# with time as the block.
+
+
+def _within_ss(codes, k, y):
+    n = np.bincount(codes, minlength=k)
+    mean = np.bincount(codes, weights=y, minlength=k) / np.where(n > 0, n, 1)
+    dev = y - mean[codes]
+    return float(dev @ dev)
+
+
+def twoway_anova(data, factor_a, factor_b, value_col, interaction=None):
+    """ANOVA table for value_col ~ factor_a + factor_b (+ factor_a:factor_b).
+
+    interaction=None tests the interaction when some cell has replicates
+    and otherwise pools it into the residual; True/False force it.
+    Returns a DataFrame indexed by source with 'Sum Sq', 'df', 'Mean Sq',
+    'F' and 'p-value' columns (Type II sums of squares, equal to Type I/III
+    for balanced designs).
+    """
+    a_codes, a_levels = pd.factorize(data[factor_a])
+    b_codes, b_levels = pd.factorize(data[factor_b])
+    y = data[value_col].to_numpy(dtype=float)
+    y = y - y.mean()  # every model has an intercept; centring keeps y'y small
+    a, b, total = len(a_levels), len(b_levels), len(y)
+
+    n_a = np.bincount(a_codes, minlength=a).astype(float)
+    n_b = np.bincount(b_codes, minlength=b).astype(float)
+    s_a = np.bincount(a_codes, weights=y, minlength=a)
+    s_b = np.bincount(b_codes, weights=y, minlength=b)
+    cell = a_codes * b + b_codes
+    incidence = np.bincount(cell, minlength=a * b).reshape(a, b).astype(float)
+    n_cells = int((incidence > 0).sum())
+
+    # Additive fit y = alpha_A + beta_B via the Schur complement on B
+    schur = np.diag(n_b) - incidence.T @ (incidence / n_a[:, None])
+    rhs = s_b - incidence.T @ (s_a / n_a)
+    beta = np.linalg.lstsq(schur, rhs, rcond=None)[0]
+    alpha = (s_a - incidence @ beta) / n_a
+    rank_b = np.linalg.matrix_rank(schur)
+    rss_additive = float(y @ y - alpha @ s_a - beta @ s_b)
+    df_additive = total - a - rank_b
+
+    rss_a = _within_ss(a_codes, a, y)
+    rss_b = _within_ss(b_codes, b, y)
+    rss_cells = _within_ss(cell, a * b, y)
+    df_cells = total - n_cells
+
+    if interaction is None:
+        interaction = df_cells > 0
+    rows = {
+        str(factor_a): (max(rss_b - rss_additive, 0.0), a - 1),
+        str(factor_b): (max(rss_a - rss_additive, 0.0), rank_b),
+    }
+    if interaction:
+        rows[f'{factor_a} × {factor_b}'] = (max(rss_additive - rss_cells, 0.0), df_additive - df_cells)
+        rows['Residual'] = (rss_cells, df_cells)
+    else:
+        rows['Residual'] = (rss_additive, df_additive)
+
+    table = pd.DataFrame.from_dict(rows, orient='index', columns=['Sum Sq', 'df'])
+    table['df'] = table['df'].astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table['Mean Sq'] = table['Sum Sq'] / table['df']
+        residual_ms = table.loc['Residual', 'Mean Sq']
+        table['F'] = table['Mean Sq'] / residual_ms
+    table['p-value'] = fdtrc(table['df'], table.loc['Residual', 'df'], table['F'])
+    table.loc['Residual', ['F', 'p-value']] = np.nan
+    table.index.name = 'Source'
+    return table
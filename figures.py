@@ -0,0 +1,108 @@
+import io
+import os
+import zlib
+from pathlib import Path
+
+# Figures reach the DOCX as in-memory buffers: a chart is saved once into a
+# BytesIO and doc.add_picture() reads that buffer, so there is no write and
+# re-read through the filesystem, and two runs that use the same file name
+# (bar_chart.png from plat.py and ggg.py, box_plot.* ...) can no longer
+# embed each other's pictures. A copy is still written to the usual path
+# unless SAP_FIGURE_COPIES=0 (cli.py --no-figure-files).
+#
+# Report charts are rendered for the size they are embedded at: a chart that
+# goes in at Inches(5) gets exactly 5 * EMBED_DPI pixels across, whatever its
+# figsize (the layout is unchanged, only the resolution), in the format that
+# suits its kind. Set SAP_EMBED_DPI=0 to keep each chart's own dpi instead.
+#
+# With SAP_NATIVE_CHARTS=1 (cli.py --native-charts) simple bar, min/max bar
+# and line charts are not drawn at all but written as editable Word charts
+# (docx_charts.py); the other kinds are still rendered here.
+
+FIGURE_COPIES = os.environ.get('SAP_FIGURE_COPIES', '1') != '0'
+NATIVE_CHARTS = os.environ.get('SAP_NATIVE_CHARTS', '0') != '0'
+EMBED_DPI = float(os.environ.get('SAP_EMBED_DPI', '150'))
+# Also render each chart the old way (its own dpi, JPEG) to record the bytes
+# saved; doubles chart time, so only `cli.py image-savings` turns it on.
+# Sizes are compared as stored in the DOCX (deflated in the zip), where a
+# matplotlib JPEG shrinks by a third or more and a PNG not at all.
+IMAGE_SAVINGS = os.environ.get('SAP_IMAGE_SAVINGS', '0') != '0'
+
+# Format per chart kind: ('png', palette colours) or ('jpeg', quality). The
+# report charts are flat fills, lines and text on white, so an adaptive
+# palette PNG is smaller in the DOCX than JPEG at any quality and has no
+# ringing around text; lines and translucent fills keep more colours for
+# their antialiased edges. Continuous-tone kinds would take ('jpeg', 85).
+CHART_FORMATS = {
+    'bar': ('png', 64),
+    'minmax': ('png', 64),
+    'box': ('png', 64),
+    'hist': ('png', 64),
+    'scatter': ('png', 64),
+    'line': ('png', 128),
+    'radar': ('png', 128),
+}
+
+# One record per embedded chart image (embed_figure() calls and
+# chart_cache hits); profiling.RunProfile.finish() adds them to the run
+# profile. Charts rendered in render.render_all()'s pool send their records
+# back with the image. Long-lived processes (service workers) clear it per job.
+EMBEDDED = []
+
+
+def image_format(path):
+    """Image format implied by a file name ('x.jpeg' -> 'jpeg'; no suffix -> 'png')."""
+    return Path(path).suffix.lstrip('.').lower() or 'png'
+
+
+def embed_path(path, kind):
+    """`path` with the suffix of the format `kind` is embedded in ('bar_chart.jpeg', 'bar' -> 'bar_chart.png')."""
+    fmt = CHART_FORMATS[kind][0]
+    return path if image_format(path) == fmt else Path(path).with_suffix('.' + fmt)
+
+
+def keep(data, path, copy=None):
+    """Image bytes as a BytesIO for add_picture(); also written to `path` when copies are on."""
+    if FIGURE_COPIES if copy is None else copy:
+        Path(path).write_bytes(data)
+    return io.BytesIO(data)
+
+
+def embed_figure(fig, path, kind, embed_width=None, dpi=None, copy=None):
+    """fig rendered for an `embed_width`-inch picture (default: its own width); returns the buffer.
+
+    The format comes from CHART_FORMATS[kind]; the copy goes to embed_path(path, kind).
+    `dpi` is the chart's own resolution, used when SAP_EMBED_DPI=0 (default: the figure's).
+    """
+    fmt, setting = CHART_FORMATS[kind]
+    own_dpi = dpi or fig.dpi
+    if EMBED_DPI:
+        dpi = (embed_width or fig.get_figwidth()) * EMBED_DPI / fig.get_figwidth()
+    else:
+        dpi = own_dpi
+    buffer = io.BytesIO()
+    if fmt == 'jpeg':
+        fig.savefig(buffer, format='jpeg', dpi=dpi, pil_kwargs={'quality': setting, 'optimize': True})
+    else:
+        from PIL import Image  # matplotlib's own dependency
+        # raw RGBA straight into the palette encoder: no truecolor PNG to encode and decode again
+        fig.savefig(buffer, format='rgba', dpi=dpi)
+        size = tuple(int(d * dpi) for d in fig.get_size_inches())  # what the Agg canvas allocates
+        image = Image.frombuffer('RGBA', size, buffer.getbuffer(), 'raw', 'RGBA', 0, 1)
+        image = image.convert('RGB').quantize(setting, method=Image.Quantize.FASTOCTREE)
+        buffer = io.BytesIO()
+        image.save(buffer, format='png', optimize=True)
+    data = buffer.getvalue()
+
+    path = embed_path(path, kind)
+    width, height = fig.get_size_inches()
+    record = {'path': str(path), 'kind': kind, 'format': fmt, 'embed_width_in': embed_width,
+              'pixels': [round(width * dpi), round(height * dpi)], 'bytes': len(data)}
+    if IMAGE_SAVINGS:
+        legacy = io.BytesIO()
+        fig.savefig(legacy, format='jpeg', dpi=own_dpi)
+        record['legacy_pixels'] = [round(width * own_dpi), round(height * own_dpi)]
+        record['stored_bytes'] = len(zlib.compress(data))
+        record['legacy_stored_bytes'] = len(zlib.compress(legacy.getvalue()))
+    EMBEDDED.append(record)
+    return keep(data, path, copy)
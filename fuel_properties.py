@@ -0,0 +1,167 @@
+from pathlib import Path
+
+import numpy as np
+
+import figures
+from render import minmax_bar, radar, render_all
+
+# One fuel-property report per feedstock, from {feedstock: {property: (min, max)}}
+# tables. All tables are stacked into a single (feedstock, property, min/max)
+# array, so category subsets and radar midpoints are one indexing/mean over
+# every feedstock at once. Chart jobs for all feedstocks go through one
+# process pool, then the DOCX reports are assembled in parallel as well.
+
+PICTURE_WIDTH = 5.5  # inches; charts are rendered for this width
+
+# Report sections: (heading, properties)
+CATEGORIES = [
+    ("Thermal Properties", ["Flash point", "Boiling point", "Freezing point", "Autoignition temp."]),
+    ("Performance Indicators", ["Octane number", "Calorific value"]),
+    ("Physical Characteristics", ["Density", "Viscosity", "Vapor pressure"]),
+]
+
+# Wording and file names of the existing reports (ethb.py / ethp.py)
+REPORTS = {
+    'banana': dict(
+        title="Banana Sap Property Analysis",
+        radar_title="Radar Chart of Banana Sap Properties",
+        prefix='banana_', overlap=False, docx='banana_sap_analysis.docx',
+        summary="This report visualizes the key physical and chemical properties of banana sap, highlighting its "
+                "potential as a biofuel based on performance, thermal behavior, and physical traits."),
+    'plantain': dict(
+        title="Bioethanol Property Analysis",
+        radar_title="Radar Chart of Bioethanol Properties",
+        prefix='', overlap=True, docx='bioethanol_analysis.docx',
+        summary="This report visualizes the key physical and chemical properties of bioethanol, highlighting its "
+                "suitability as a fuel based on performance, thermal behavior, and physical traits."),
+}
+
+
+def report_spec(feedstock):
+    """Report wording for `feedstock`; feedstocks without an entry in REPORTS get a generic one."""
+    if feedstock in REPORTS:
+        return REPORTS[feedstock]
+    name = feedstock.replace('_', ' ')
+    return dict(
+        title=f"{name.title()} Property Analysis",
+        radar_title=f"Radar Chart of {name.title()} Properties",
+        prefix=f'{feedstock}_', overlap=False, docx=f'{feedstock}_fuel_properties.docx',
+        summary=f"This report visualizes the key physical and chemical properties of {name}, highlighting its "
+                f"potential as a biofuel based on performance, thermal behavior, and physical traits.")
+
+
+def load_ranges(tables):
+    """Stack range tables into (feedstocks, properties, ranges[F, P, 2]).
+
+    Properties are the union in first-seen order; a property missing from a
+    feedstock's table is NaN there and left out of its charts.
+    """
+    feedstocks = list(tables)
+    properties = list(dict.fromkeys(p for table in tables.values() for p in table))
+    column = {p: j for j, p in enumerate(properties)}
+    ranges = np.full((len(feedstocks), len(properties), 2), np.nan)
+    for i, feedstock in enumerate(feedstocks):
+        for prop, bounds in tables[feedstock].items():
+            ranges[i, column[prop]] = bounds
+    return feedstocks, properties, ranges
+
+
+def summarize(properties, ranges):
+    """Radar midpoints [F, P] and each category's (properties, ranges[F, k, 2])."""
+    column = {p: j for j, p in enumerate(properties)}
+    midpoints = ranges.mean(axis=2)
+    subsets = []
+    for heading, names in CATEGORIES:
+        names = [p for p in names if p in column]
+        subsets.append((heading, names, ranges[:, [column[p] for p in names]]))
+    return midpoints, subsets
+
+
+def _as_dict(names, rows):
+    return {p: (lo, hi) for p, (lo, hi) in zip(names, rows) if not np.isnan(lo)}
+
+
+def chart_jobs(feedstocks, properties, ranges, out_dir='.'):
+    """Render jobs for every feedstock, plus each feedstock's [(heading, path)] sections."""
+    out_dir = Path(out_dir)
+    midpoints, subsets = summarize(properties, ranges)
+    jobs, sections = [], {}
+    for i, feedstock in enumerate(feedstocks):
+        spec = report_spec(feedstock)
+        sections[feedstock] = []
+        for heading, names, sub in subsets:
+            data_subset = _as_dict(names, sub[i])
+            if not data_subset:
+                continue
+            path = str(out_dir / f"{spec['prefix']}{heading.split()[0].lower()}.png")
+            jobs.append((minmax_bar, dict(data_subset=data_subset, title=heading, filename=path,
+                                          overlap=spec['overlap'], embed_width=PICTURE_WIDTH)))
+            sections[feedstock].append((heading, path))
+        present = ~np.isnan(midpoints[i])
+        path = str(out_dir / f"{spec['prefix']}radar.png")
+        jobs.append((radar, dict(data=_as_dict(properties, ranges[i]), title=spec['radar_title'],
+                                 filename=path, values=midpoints[i, present], embed_width=PICTURE_WIDTH)))
+        sections[feedstock].append(("Radar Chart Overview", path))
+    return jobs, sections
+
+
+def chart_figures(jobs, max_workers=None):
+    """{filename: image} for chart_jobs() output; min/max bars are NativeCharts when figures.NATIVE_CHARTS is on."""
+    native = {}
+    if figures.NATIVE_CHARTS:
+        from docx_charts import minmax_chart
+        native = {kwargs['filename']: minmax_chart(kwargs['data_subset'], kwargs['title'], kwargs['overlap'])
+                  for func, kwargs in jobs if func is minmax_bar}
+    rendered = [(func, kwargs) for func, kwargs in jobs if kwargs['filename'] not in native]
+    return dict(zip((kwargs['filename'] for _, kwargs in rendered), render_all(rendered, max_workers)), **native)
+
+
+def report_document(feedstock, sections):
+    """One feedstock's Document from its [(heading, image)] sections (image: path, buffer or NativeChart)."""
+    from docx import Document
+    from docx.shared import Inches
+    from docx_charts import add_figure
+    spec = report_spec(feedstock)
+    doc = Document()
+    doc.add_heading(spec['title'], 0)
+    for heading, image in sections:
+        doc.add_heading(heading, level=1)
+        add_figure(doc, image, Inches(PICTURE_WIDTH))
+    doc.add_paragraph(spec['summary'])
+    return doc
+
+
+def build_report(feedstock, sections, out_dir='.'):
+    """Assemble and save one feedstock's DOCX; returns the path."""
+    path = str(Path(out_dir) / report_spec(feedstock)['docx'])
+    report_document(feedstock, sections).save(path)
+    return path
+
+
+def run(tables, out_dir='.', max_workers=None, profile=None, overview=None):
+    """Charts and DOCX report for every feedstock in `tables`; returns {feedstock: docx path}.
+
+    `overview` (a .pdf or image path) also draws every feedstock's normalized
+    midpoint profile as paged radar small multiples (radar_batch.RadarGrid).
+    """
+    def stage(name, output=()):
+        if profile is not None:
+            profile.stage(name, output=output)
+
+    stage('data load')
+    feedstocks, properties, ranges = load_ranges(tables)
+    jobs, sections = chart_jobs(feedstocks, properties, ranges, out_dir)
+
+    stage('charts', output=[kwargs['filename'] for _, kwargs in jobs])
+    images = chart_figures(jobs, max_workers)
+
+    if overview is not None:
+        from radar_batch import RadarGrid
+        stage('chart: overview', output=overview)
+        RadarGrid(properties).render(ranges.mean(axis=2), overview, names=feedstocks,
+                                     title="Fuel property profiles (normalized midpoints)")
+
+    stage('docx', output=[str(Path(out_dir) / report_spec(f)['docx']) for f in feedstocks])
+    report_jobs = [(build_report, dict(feedstock=f, sections=[(h, images[p]) for h, p in sections[f]], out_dir=out_dir))
+                   for f in feedstocks]
+    return dict(zip(feedstocks, render_all(report_jobs, max_workers)))
@@ -0,0 +1,74 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+FERMENTATION_COLUMNS = ['Time Point', 'Sample Type', 'Viable Cell Count', 'pH', 'Temperature']
+CATEGORICAL_COLUMNS = ['Time Point', 'Sample Type']
+
+# Hours per unit, keyed by the lower-cased unit as written in the exports
+TIME_UNITS = {
+    'min': 1 / 60, 'mins': 1 / 60, 'minute': 1 / 60, 'minutes': 1 / 60,
+    'h': 1, 'hr': 1, 'hrs': 1, 'hour': 1, 'hours': 1,
+    'd': 24, 'day': 24, 'days': 24,
+    'wk': 168, 'week': 168, 'weeks': 168,
+}
+_TIME_RE = re.compile(r'^\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]+)\s*$')
+
+
+def parse_time_point(text):
+    """Convert a label such as '72 hrs' or '4 days' to hours (NaN if unparseable)."""
+    match = _TIME_RE.match(str(text))
+    if not match or match.group(2).lower() not in TIME_UNITS:
+        return np.nan
+    return float(match.group(1)) * TIME_UNITS[match.group(2).lower()]
+
+
+def _iter_chunks(path, chunksize, columns):
+    path = Path(path)
+    if path.suffix.lower() in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def _compact(chunk):
+    for col in CATEGORICAL_COLUMNS:
+        chunk[col] = chunk[col].astype(str).astype('category')
+    for col in chunk.columns.difference(CATEGORICAL_COLUMNS):
+        chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+    return chunk
+
+
+def load_fermentation(path, chunksize=1_000_000, columns=FERMENTATION_COLUMNS):
+    """Stream a fermentation time-course CSV or Parquet file in chunks.
+
+    'Sample Type' and 'Time Point' come back as categoricals (Time Point
+    ordered by duration) and a numeric 'Hours' column is added.
+    """
+    chunks = [_compact(chunk) for chunk in _iter_chunks(path, chunksize, columns)]
+    if not chunks:
+        return pd.DataFrame(columns=columns + ['Hours'])
+
+    data = {}
+    for col in columns:
+        parts = [chunk[col] for chunk in chunks]
+        if col in CATEGORICAL_COLUMNS:
+            data[col] = pd.Series(union_categoricals(parts))
+        else:
+            data[col] = pd.concat(parts, ignore_index=True)
+    data = pd.DataFrame(data)
+
+    # Parse each distinct label once, then order the categories by duration
+    time_point = data['Time Point'].cat
+    hours = pd.Series([parse_time_point(c) for c in time_point.categories], index=time_point.categories)
+    hours = hours.sort_values(kind='stable')
+    data['Time Point'] = time_point.reorder_categories(hours.index, ordered=True)
+    codes = data['Time Point'].cat.codes.to_numpy()
+    data['Hours'] = np.where(codes >= 0, hours.to_numpy()[codes], np.nan)
+    return data
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+
+class Moments:
+    """One-pass, mergeable count/mean/M2/M3/M4/min/max per column.
+
+    Feed chunks with update() (DataFrame or 2-D array, NaNs skipped as pandas
+    does) and combine partial results from other processes with merge(); both
+    use Pébay's pairwise update, so merged results equal a single pass over
+    all the data. skew()/kurtosis() default to scipy's biased estimators
+    (plat.py); bias=False gives the adjusted ones pandas' skew()/kurt() use.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+        self.m4 = np.zeros(k)
+        self.min = np.full(k, np.nan)
+        self.max = np.full(k, np.nan)
+
+    @classmethod
+    def from_chunks(cls, chunks, columns=None):
+        acc = None
+        for chunk in chunks:
+            if acc is None:
+                acc = cls(columns if columns is not None else chunk.columns)
+            acc.update(chunk)
+        return acc
+
+    def update(self, chunk):
+        if isinstance(chunk, pd.DataFrame):
+            values = chunk[self.columns].to_numpy(dtype=float)
+        else:
+            values = np.asarray(chunk, dtype=float).reshape(len(chunk), -1)
+        mask = ~np.isnan(values)
+        n = mask.sum(axis=0).astype(float)
+        if not n.any():
+            return self
+        filled = np.where(mask, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = filled.sum(axis=0) / n
+        dev = np.where(mask, values - mean, 0.0)
+        dev2 = dev * dev
+        other = Moments(self.columns)
+        other.n = n
+        other.mean = np.where(n > 0, mean, 0.0)
+        other.m2 = dev2.sum(axis=0)
+        other.m3 = (dev2 * dev).sum(axis=0)
+        other.m4 = (dev2 * dev2).sum(axis=0)
+        with np.errstate(invalid='ignore'):
+            other.min = np.where(n > 0, np.nanmin(np.where(mask, values, np.inf), axis=0), np.nan)
+            other.max = np.where(n > 0, np.nanmax(np.where(mask, values, -np.inf), axis=0), np.nan)
+        return self.merge(other)
+
+    def merge(self, other):
+        na, nb = self.n, other.n
+        n = na + nb
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = other.mean - self.mean
+            d_n = np.where(n > 0, delta / n, 0.0)
+            mean = self.mean + d_n * nb
+            m2 = self.m2 + other.m2 + delta * d_n * na * nb
+            m3 = (self.m3 + other.m3 + delta * d_n ** 2 * na * nb * (na - nb)
+                  + 3 * d_n * (na * other.m2 - nb * self.m2))
+            m4 = (self.m4 + other.m4 + delta * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+                  + 6 * d_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+                  + 4 * d_n * (na * other.m3 - nb * self.m3))
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    def var(self, ddof=1):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.n > ddof, self.m2 / (self.n - ddof), np.nan)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof))
+
+    def skew(self, bias=True):
+        n = self.n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            g1 = np.sqrt(n) * self.m3 / self.m2 ** 1.5
+            if bias:
+                return g1
+            adjusted = g1 * np.sqrt(n * (n - 1)) / (n - 2)
+            return np.where(n < 3, np.nan, np.where(self.m2 == 0, 0.0, adjusted))
+
+    def kurtosis(self, bias=True):
+        """Excess (Fisher) kurtosis."""
+        n = self.n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            g2 = n * self.m4 / self.m2 ** 2 - 3
+            if bias:
+                return g2
+            adjusted = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+            return np.where(n < 4, np.nan, np.where(self.m2 == 0, 0.0, adjusted))
+
+    def describe(self):
+        """Per-column table matching bbb.py/ggg.py (pandas conventions)."""
+        return pd.DataFrame({
+            'mean': np.where(self.n > 0, self.mean, np.nan),
+            'std': self.std(ddof=1),
+            'min': self.min,
+            'max': self.max,
+            'Skewness': self.skew(bias=False),
+            'Kurtosis': self.kurtosis(bias=False),
+        }, index=self.columns)
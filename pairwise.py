@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+from scipy.special import fdtrc, stdtr
+
+
+# Group once: per-group size, mean and sample variance from a single pass
+def group_moments(data, group_col, value_col):
+    labels, n, mean, var = group_moments_multi(data, group_col, [value_col])
+    return labels, n[:, 0], mean[:, 0], var[:, 0]
+
+
+# Same for a block of response columns. Applying the group-indicator
+# matrix G (N x k) to every column at once, G'Y, is one bincount over
+# (group, response) cells; counts, sums and within-group sums of squares of
+# all responses come from three such passes, so the grouping is done once.
+# NaNs are left out per response. Arrays are (groups x responses).
+def group_moments_multi(data, group_col, value_cols):
+    codes, labels = pd.factorize(data[group_col])
+    if (codes < 0).any():
+        raise ValueError(f"{(codes < 0).sum()} row(s) have no {group_col!r} (NaN); drop or label them first")
+    k = len(labels)
+    values = data[list(value_cols)].to_numpy(dtype=float)
+    r = values.shape[1]
+    cells = (codes[:, None] * r + np.arange(r)).ravel()
+
+    def indicator_sum(block):
+        return np.bincount(cells, weights=block.ravel(), minlength=k * r).reshape(k, r)
+
+    present = ~np.isnan(values)
+    if present.all():
+        n = np.repeat(np.bincount(codes, minlength=k)[:, None], r, axis=1).astype(float)
+    else:
+        n = indicator_sum(present.astype(float))
+        values = np.where(present, values, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = indicator_sum(values) / n
+        dev = np.where(present, values - mean[codes], 0.0)
+        var = indicator_sum(dev * dev) / (n - 1)
+    return np.asarray(labels), n, mean, var
+
+
+# All (i, j) pairs of groups in one broadcasted pass.
+# equal_var=True gives Student's t (same as scipy's ttest_ind default),
+# equal_var=False gives Welch's t.
+def pairwise_ttests(data, group_col, value_col, equal_var=True):
+    return pairwise_ttests_multi(data, group_col, [value_col], equal_var).drop(columns='Response')
+
+
+def _ttests(n, mean, var, i, j, equal_var):
+    n1, n2 = n[i], n[j]
+    v1, v2 = var[i], var[j]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if equal_var:
+            dof = n1 + n2 - 2
+            # within-group sums of squares: a one-observation group adds 0, not NaN (as in scipy)
+            ss1, ss2 = np.where(n1 > 1, (n1 - 1) * v1, 0.0), np.where(n2 > 1, (n2 - 1) * v2, 0.0)
+            pooled = (ss1 + ss2) / dof
+            se = np.sqrt(pooled * (1 / n1 + 1 / n2))
+        else:
+            a, b = v1 / n1, v2 / n2
+            se = np.sqrt(a + b)
+            dof = (a + b) ** 2 / (a ** 2 / (n1 - 1) + b ** 2 / (n2 - 1))
+        t_stat = (mean[i] - mean[j]) / se
+    return t_stat, 2 * stdtr(dof, -np.abs(t_stat))
+
+
+# Every pair for every response column; one tidy row per (response, pair)
+def pairwise_ttests_multi(data, group_col, value_cols, equal_var=True):
+    value_cols = list(value_cols)
+    labels, n, mean, var = group_moments_multi(data, group_col, value_cols)
+    i, j = np.triu_indices(len(labels), k=1)
+    t_stat, p_val = _ttests(n, mean, var, i, j, equal_var)  # (pairs x responses)
+
+    return pd.DataFrame({
+        'Response': np.repeat(value_cols, len(i)),
+        'Group 1': np.tile(labels[i], len(value_cols)),
+        'Group 2': np.tile(labels[j], len(value_cols)),
+        't-statistic': t_stat.T.ravel(),
+        'p-value': p_val.T.ravel()
+    })
+
+
+# One-way ANOVA from the same per-group moments (matches scipy's f_oneway)
+def oneway_anova(data, group_col, value_col):
+    table = oneway_anova_multi(data, group_col, [value_col])
+    return table['F'].iloc[0], table['p-value'].iloc[0]
+
+
+# One-way ANOVA of every response column at once; one row per response
+def oneway_anova_multi(data, group_col, value_cols):
+    value_cols = list(value_cols)
+    _, n, mean, var = group_moments_multi(data, group_col, value_cols)
+    k, total = (n > 0).sum(axis=0), n.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        grand_mean = np.nansum(n * mean, axis=0) / total
+        ss_between = np.nansum(n * (mean - grand_mean) ** 2, axis=0)
+        ss_within = np.nansum((n - 1) * var, axis=0)
+        df_between, df_within = k - 1, total - k
+        f_stat = (ss_between / df_between) / (ss_within / df_within)
+    return pd.DataFrame({
+        'Response': value_cols,
+        'F': f_stat,
+        'p-value': fdtrc(df_between, df_within, f_stat),
+        'df between': df_between,
+        'df within': df_within.astype(int),
+    })
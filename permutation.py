@@ -0,0 +1,190 @@
+from itertools import combinations
+from math import comb, factorial, prod
+
+import numpy as np
+import pandas as pd
+
+# Permutation tests for one-way designs: the omnibus test (statistic
+# equivalent to the one-way F) and every pairwise comparison (|mean
+# difference|, equivalent to Student's |t| under permutation).
+#
+# Permutations are index matrices of shape (block, m) and statistics are
+# evaluated for a whole block with matrix operations. Pairs with the same
+# (n1, n2) sizes share the same shuffled blocks, so k treatments with equal
+# replicates cost one stream of shuffles, not k(k-1)/2. When every distinct
+# assignment can be enumerated (<= exact_limit) the test is exact; otherwise
+# Monte Carlo blocks are drawn until z * SE(p) <= precision for every test
+# still running, or max_perm is reached. Pairwise statistics gather a
+# (pairs, block, m) array; pairs are taken in chunks that keep it under
+# chunk_bytes and exact splits are walked block_size at a time, so memory
+# stays flat however many treatments there are.
+
+EXACT_LIMIT = 50_000
+BLOCK_SIZE = 2_000
+CHUNK_BYTES = 64 * 2**20
+Z = 2.576  # 99% two-sided
+
+
+def _all_splits(m, n1):
+    """Every way to pick the n1 'group 1' positions out of m, as (count, m) index arrays."""
+    first = np.array(list(combinations(range(m), n1)), dtype=np.intp).reshape(-1, n1)
+    mask = np.ones((len(first), m), dtype=bool)
+    np.put_along_axis(mask, first, False, axis=1)
+    rest = np.nonzero(mask)[1].reshape(len(first), m - n1)
+    return np.hstack([first, rest])
+
+
+def _all_assignments(sizes):
+    """Every distinct assignment of len = sum(sizes) positions to groups of `sizes`."""
+    if len(sizes) == 1:
+        return np.arange(sizes[0], dtype=np.intp)[None]
+    m = sum(sizes)
+    head = _all_splits(m, sizes[0])
+    tail = _all_assignments(sizes[1:])
+    # positions left after the first group, re-indexed by the tail assignments
+    return np.concatenate([
+        np.hstack([np.broadcast_to(h[:sizes[0]], (len(tail), sizes[0])), h[sizes[0]:][tail]])
+        for h in head
+    ])
+
+
+def _n_assignments(sizes):
+    return factorial(sum(sizes)) // prod(factorial(s) for s in sizes)
+
+
+def _shuffles(rng, block, m):
+    return rng.permuted(np.broadcast_to(np.arange(m, dtype=np.intp), (block, m)), axis=1)
+
+
+def _resolved(count, done, precision):
+    p = (count + 1) / (done + 1)
+    return Z * np.sqrt(p * (1 - p) / done) <= precision
+
+
+def _omnibus_stat(sample, starts, sizes):
+    """sum_g n_g * mean_g**2 per row; monotone in F because the total SS is fixed."""
+    sums = np.add.reduceat(sample, starts, axis=-1)
+    return (sums * sums / sizes).sum(axis=-1)
+
+
+def omnibus_permutation(values, codes, k, precision=0.001, max_perm=1_000_000, exact_limit=EXACT_LIMIT,
+                        block_size=BLOCK_SIZE, rng=None):
+    """Permutation p-value of the one-way F over group codes 0..k-1."""
+    rng = np.random.default_rng(rng)
+    order = np.argsort(codes, kind='stable')
+    values = values[order]
+    sizes = np.bincount(codes, minlength=k)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    observed = _omnibus_stat(values, starts, sizes)
+    tol = 1e-12 * max(1.0, abs(observed))
+
+    if _n_assignments(sizes) <= exact_limit:
+        stats = _omnibus_stat(values[_all_assignments(list(sizes))], starts, sizes)
+        return float(np.mean(stats >= observed - tol)), len(stats), True
+
+    count = done = 0
+    while done < max_perm:
+        block = min(block_size, max_perm - done)
+        stats = _omnibus_stat(values[_shuffles(rng, block, len(values))], starts, sizes)
+        count += int((stats >= observed - tol).sum())
+        done += block
+        if _resolved(count, done, precision):
+            break
+    return (count + 1) / (done + 1), done, False
+
+
+def _count_extreme(pooled, observed, tol, index, n1, chunk_bytes):
+    """Per pair (row of pooled), how many rows of `index` give |mean difference| >= observed."""
+    rows = max(1, chunk_bytes // (index.size * pooled.itemsize))
+    count = np.empty(len(pooled), dtype=np.int64)
+    for start in range(0, len(pooled), rows):
+        chunk = slice(start, start + rows)
+        shuffled = pooled[chunk][:, index]  # (rows, block, m)
+        stats = np.abs(shuffled[..., :n1].mean(axis=-1) - shuffled[..., n1:].mean(axis=-1))
+        count[chunk] = (stats >= (observed[chunk] - tol[chunk])[:, None]).sum(axis=1)
+    return count
+
+
+def pairwise_permutation(groups, precision=0.001, max_perm=1_000_000, exact_limit=EXACT_LIMIT,
+                         block_size=BLOCK_SIZE, rng=None, chunk_bytes=CHUNK_BYTES):
+    """Two-sided permutation p-values for |mean difference| of every pair.
+
+    `groups` is a list of 1-D arrays. Returns (i, j, difference, p, n_perm,
+    exact) arrays in np.triu_indices order.
+    """
+    rng = np.random.default_rng(rng)
+    k = len(groups)
+    i, j = np.triu_indices(k, k=1)
+    sizes = np.array([len(g) for g in groups])
+    means = np.array([np.mean(g) for g in groups])
+    diff = means[i] - means[j]
+    p = np.full(len(i), np.nan)
+    n_perm = np.zeros(len(i), dtype=np.int64)
+    exact = np.zeros(len(i), dtype=bool)
+
+    # Pairs with equal (n1, n2) share one stream of shuffled index blocks
+    keys = {}
+    for pair, key in enumerate(zip(sizes[i], sizes[j])):
+        keys.setdefault(key, []).append(pair)
+    for (n1, n2), pairs in keys.items():
+        pairs = np.array(pairs)
+        m = n1 + n2
+        pooled = np.stack([np.concatenate([groups[i[q]], groups[j[q]]]) for q in pairs])  # (pairs, m)
+        observed = np.abs(diff[pairs])
+        tol = 1e-12 * np.maximum(1.0, observed)
+
+        if comb(m, n1) <= exact_limit:
+            splits = _all_splits(m, n1)
+            count = np.zeros(len(pairs), dtype=np.int64)
+            for start in range(0, len(splits), block_size):
+                count += _count_extreme(pooled, observed, tol, splits[start:start + block_size], n1, chunk_bytes)
+            p[pairs] = count / len(splits)
+            n_perm[pairs] = len(splits)
+            exact[pairs] = True
+            continue
+
+        count = np.zeros(len(pairs), dtype=np.int64)
+        done = np.zeros(len(pairs), dtype=np.int64)
+        active = np.ones(len(pairs), dtype=bool)
+        while active.any():
+            block = int(min(block_size, max_perm - done[active].max()))
+            index = _shuffles(rng, block, m)
+            idx = np.flatnonzero(active)
+            count[idx] += _count_extreme(pooled[idx], observed[idx], tol[idx], index, n1, chunk_bytes)
+            done[idx] += block
+            active[idx] = ~(_resolved(count[idx], done[idx], precision) | (done[idx] >= max_perm))
+        p[pairs] = (count + 1) / (done + 1)
+        n_perm[pairs] = done
+    return i, j, diff, p, n_perm, exact
+
+
+def permutation_tests(data, group_col, value_col, precision=0.001, max_perm=1_000_000,
+                      exact_limit=EXACT_LIMIT, block_size=BLOCK_SIZE, seed=0, chunk_bytes=CHUNK_BYTES):
+    """Omnibus and pairwise permutation tests of value_col across group_col.
+
+    Returns {'omnibus': {'p': ..., 'n_perm': ..., 'exact': ...},
+    'pairwise': DataFrame}; the pairwise table follows pairwise.py (group
+    order of first appearance, 'Group 1' / 'Group 2' columns).
+    Monte Carlo p-values use (count + 1) / (n + 1).
+    """
+    codes, labels = pd.factorize(data[group_col])
+    labels = np.asarray(labels)
+    values = data[value_col].to_numpy(dtype=float)
+    omnibus_rng, pairwise_rng = np.random.SeedSequence(seed).spawn(2)
+
+    p, n_perm, exact = omnibus_permutation(values, codes, len(labels), precision, max_perm, exact_limit,
+                                           block_size, np.random.default_rng(omnibus_rng))
+    groups = [values[codes == g] for g in range(len(labels))]
+    i, j, diff, pair_p, pair_n, pair_exact = pairwise_permutation(
+        groups, precision, max_perm, exact_limit, block_size, np.random.default_rng(pairwise_rng), chunk_bytes)
+    return {
+        'omnibus': {'p': float(p), 'n_perm': int(n_perm), 'exact': bool(exact)},
+        'pairwise': pd.DataFrame({
+            'Group 1': labels[i],
+            'Group 2': labels[j],
+            'Difference': diff,
+            'p-value': pair_p,
+            'Permutations': pair_n,
+            'Exact': pair_exact,
+        }),
+    }
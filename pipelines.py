@@ -0,0 +1,104 @@
+import runpy
+import sys
+from pathlib import Path
+
+# Stage functions behind cli.py. Heavy libraries (pandas, scipy, matplotlib,
+# seaborn, sklearn, python-docx) are imported inside the stage that needs
+# them, never at module level, so a stats-only run does not pay for plotting
+# or DOCX imports.
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# Full report scripts per analysis and feedstock
+SCRIPTS = {
+    'fermentation': {'banana': 'banana.py', 'plantain': 'plantain.py'},
+    'fuel-properties': {'banana': 'ethb.py', 'plantain': 'ethp.py'},
+    'composition': {'banana': 'deb.py', 'plantain': 'psap.py'},
+    'physicochemical-regression': {'banana': 'bbb.py', 'plantain': 'ggg.py'},
+}
+
+
+def run_script(script, args=()):
+    """Run one of the report scripts as if invoked as `python script args...`."""
+    saved_argv = sys.argv
+    sys.argv = [script, *map(str, args)]
+    try:
+        runpy.run_path(str(REPO_DIR / script), run_name='__main__')
+    finally:
+        sys.argv = saved_argv
+
+
+def load_fermentation_data(feedstock='banana', path=None):
+    import pandas as pd
+    if path is not None:
+        from loaders import load_fermentation
+        return load_fermentation(path)
+    from datasets import FERMENTATION
+    return pd.DataFrame(FERMENTATION[feedstock])
+
+
+def fermentation_stats(data, value_col='Viable Cell Count', group_col='Sample Type', n_boot=0, seed=0,
+                       permutation=False):
+    """Descriptive stats, one-way ANOVA and pairwise t-tests (no scipy.stats).
+
+    n_boot > 0 adds bootstrap CIs (bootstrap.bootstrap_anova) under 'bootstrap';
+    permutation=True adds permutation.permutation_tests under 'permutation'.
+    """
+    from pairwise import oneway_anova, oneway_anova_multi, pairwise_ttests
+    desc_stats = data.groupby(group_col, observed=True)[value_col].agg(['mean', 'std', 'min', 'max'])
+    f_stat, p_val = oneway_anova(data, group_col, value_col)
+    results = {
+        'desc_stats': desc_stats,
+        'anova': {'F': float(f_stat), 'p': float(p_val)},
+        'ttests': pairwise_ttests(data, group_col, value_col),
+        'responses': oneway_anova_multi(
+            data, group_col, [c for c in data.select_dtypes('number').columns if c != 'Hours']),
+    }
+    if 'Time Point' in data.columns:
+        from factorial import twoway_anova
+        results['twoway'] = twoway_anova(data, 'Time Point', group_col, value_col)
+    if n_boot:
+        from bootstrap import bootstrap_anova
+        results['bootstrap'] = bootstrap_anova(data, group_col, value_col, n_boot=n_boot, seed=seed)
+    if permutation:
+        from permutation import permutation_tests
+        results['permutation'] = permutation_tests(data, group_col, value_col, seed=seed)
+    return results
+
+
+def fuel_property_reports(tables, out_dir='.', max_workers=None, overview=None):
+    """Fuel-property charts and DOCX for every {feedstock: {property: (min, max)}} table."""
+    from fuel_properties import run
+    from profiling import RunProfile
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    profile = RunProfile('fuel_properties')
+    reports = run(tables, out_dir, max_workers, profile=profile, overview=overview)
+    profile.finish()
+    return reports
+
+
+def composition_metrics(compositions=None):
+    import pandas as pd
+    from derived_metrics import derive_metrics
+    if compositions is None:
+        from datasets import BANANA_SAP_COMPOSITION
+        compositions = [BANANA_SAP_COMPOSITION]
+    return derive_metrics(pd.DataFrame(compositions))
+
+
+def physicochemical_stats(df, target='Ethanol yield'):
+    """Descriptive stats (streaming Moments), correlation and OLS fit (batched_ols, no sklearn)."""
+    from batched_ols import batched_ols
+    from moments import Moments
+    desc_stats = Moments(df.columns).update(df).describe()
+
+    features = [c for c in df.columns if c != target]
+    fit = batched_ols(df, target, features).iloc[0]
+    return {
+        'desc_stats': desc_stats,
+        'corr_matrix': df.corr(),
+        'fit': fit,
+        'coefficients': {f: fit[f'coef: {f}'] for f in features},
+        'intercept': float(fit['intercept']),
+        'r2': float(fit['R²']) if fit['status'] == 'ok' else None,
+    }
@@ -1,112 +1,152 @@
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy.stats import f_oneway, ttest_ind
+from scipy.stats import f_oneway
 from docx import Document
 from docx.shared import Inches
+from docx_tables import add_dataframe_table
+from docx_charts import add_figure, line_chart
+from figures import NATIVE_CHARTS, embed_figure
+from loaders import load_fermentation
+from datasets import PLANTAIN_FERMENTATION
+from pairwise import oneway_anova_multi, pairwise_ttests
+from permutation import permutation_tests
+from factorial import twoway_anova
+from profiling import RunProfile
+from results_store import fermentation_rows, record_run
 
-# Step 1: Load the data
-data = pd.DataFrame({
-    'Time Point': ['72 hrs']*6 + ['4 days']*6 + ['5 days']*6 + ['6 days']*6,
-    'Sample Type': ['Blank', 'Untreated', 'Acid treatment', 'Alkaline treatment', 'Enzyme', 'Acid w/o organism']*4,
-    'Viable Cell Count': [
-        0.000, 1.692, 1.747, 1.600, 1.557, 1.277,
-        0.000, 1.752, 1.931, 1.810, 1.627, 1.422,
-        0.000, 1.810, 1.985, 1.892, 1.714, 1.623,
-        0.000, 1.943, 1.742, 1.648, 1.557, 1.610
-    ],
-    'pH': [
-        7.0, 6.2, 5.5, 8.7, 6.4, 5.7,
-        7.0, 5.8, 5.2, 7.6, 6.1, 5.1,
-        7.0, 6.2, 5.5, 8.7, 6.4, 5.7,
-        7.0, 5.9, 5.3, 8.1, 6.1, 5.5
-    ],
-    'Temperature': [30]*24
-})
+profile = RunProfile('plantain')
+profile.stage('data load')
+
+# Step 1: Load the data (a CSV/Parquet export path may be given on the command line)
+data = pd.DataFrame(PLANTAIN_FERMENTATION)
+
+if len(sys.argv) > 1:
+    data = load_fermentation(sys.argv[1])
 
 # Step 2: Descriptive statistics
-desc_stats = data.groupby('Sample Type')['Viable Cell Count'].agg(['mean', 'std', 'min', 'max'])
+profile.stage('descriptive stats')
+desc_stats = data.groupby('Sample Type', observed=True)['Viable Cell Count'].agg(['mean', 'std', 'min', 'max'])
 
 # Step 3: ANOVA
-groups = [data[data['Sample Type'] == sample]['Viable Cell Count'] for sample in data['Sample Type'].unique()]
+profile.stage('anova')
+groups = [values for _, values in data.groupby('Sample Type', observed=True, sort=False)['Viable Cell Count']]
 anova_result = f_oneway(*groups)
 
-# Step 4: Pairwise t-tests
-sample_types = data['Sample Type'].unique()
-ttest_results = []
-for i in range(len(sample_types)):
-    for j in range(i+1, len(sample_types)):
-        group1 = data[data['Sample Type'] == sample_types[i]]['Viable Cell Count']
-        group2 = data[data['Sample Type'] == sample_types[j]]['Viable Cell Count']
-        t_stat, p_val = ttest_ind(group1, group2)
-        ttest_results.append({
-            'Group 1': sample_types[i],
-            'Group 2': sample_types[j],
-            't-statistic': round(t_stat, 3),
-            'p-value': round(p_val, 5)
-        })
-ttest_df = pd.DataFrame(ttest_results)
-
-# Step 5: Plotting
+# Step 4: One-way ANOVA of every measured response (grouping done once)
+profile.stage('anova: all responses')
+responses = [c for c in data.select_dtypes('number').columns if c != 'Hours']
+responses_anova = oneway_anova_multi(data, 'Sample Type', responses)
+
+# Step 5: Two-way ANOVA (time x treatment; interaction pooled as error when unreplicated)
+profile.stage('two-way anova')
+twoway = twoway_anova(data, 'Time Point', 'Sample Type', 'Viable Cell Count')
+
+# Step 6: Pairwise t-tests (all pairs in one vectorised pass)
+profile.stage('t-tests')
+ttests = pairwise_ttests(data, 'Sample Type', 'Viable Cell Count')
+ttest_df = ttests.round({'t-statistic': 3, 'p-value': 5})
+
+# Step 7: Permutation tests (pairs share shuffled label blocks; exact where enumerable)
+profile.stage('permutation tests')
+perm = permutation_tests(data, 'Sample Type', 'Viable Cell Count', seed=0)
+perm_df = perm['pairwise'][['Group 1', 'Group 2', 'Difference', 'p-value', 'Permutations']]
+perm_df = perm_df.round({'Difference': 3, 'p-value': 5})
+
+# Step 8: Plotting
 sns.set(style="whitegrid")
 
 # Line plot
-plt.figure(figsize=(8, 5))
-sns.lineplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type', marker='o')
-plt.title('Viable Cell Count Over Time')
-plt.tight_layout()
-plt.savefig('plantain_line.jpeg')
-plt.close()
+profile.stage('chart: plantain_line', output='plantain_line.png')
+if NATIVE_CHARTS:
+    line_img = line_chart(data, 'Time Point', 'Viable Cell Count', 'Sample Type', title='Viable Cell Count Over Time')
+else:
+    plt.figure(figsize=(8, 5))
+    sns.lineplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type', marker='o')
+    plt.title('Viable Cell Count Over Time')
+    plt.tight_layout()
+    line_img = embed_figure(plt.gcf(), 'plantain_line.png', 'line', embed_width=5)
+    plt.close()
 
 # Bar chart
+profile.stage('chart: plantain_bar', output='plantain_bar.png')
 plt.figure(figsize=(8, 5))
 sns.barplot(data=data, x='Time Point', y='Viable Cell Count', hue='Sample Type')
 plt.title('Bar Chart of Cell Counts')
 plt.tight_layout()
-plt.savefig('plantain_bar.jpeg')
+bar_img = embed_figure(plt.gcf(), 'plantain_bar.png', 'bar', embed_width=5)
 plt.close()
 
 # Box plot
+profile.stage('chart: plantain_box', output='plantain_box.png')
 plt.figure(figsize=(8, 5))
 sns.boxplot(data=data, x='Sample Type', y='Viable Cell Count')
 plt.title('Box Plot of Cell Counts by Treatment')
 plt.xticks(rotation=45)
 plt.tight_layout()
-plt.savefig('plantain_box.jpeg')
+box_img = embed_figure(plt.gcf(), 'plantain_box.png', 'box', embed_width=5)
 plt.close()
 
-# Step 6: Export to DOCX
+# Step 9: Export to DOCX
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading('Statistical Analysis of Plantain Sap Fermentation', 0)
 
+profile.stage('docx: Descriptive Statistics')
 doc.add_heading('Descriptive Statistics', level=1)
 for idx, row in desc_stats.iterrows():
     doc.add_paragraph(f"{idx}: Mean={row['mean']:.3f}, Std={row['std']:.3f}, Min={row['min']:.3f}, Max={row['max']:.3f}")
 
+profile.stage('docx: ANOVA Result')
 doc.add_heading('ANOVA Result', level=1)
 doc.add_paragraph(f"F-statistic: {anova_result.statistic:.3f}, p-value: {anova_result.pvalue:.5f}")
 
+profile.stage('docx: ANOVA Across Measured Responses')
+doc.add_heading('ANOVA Across Measured Responses', level=1)
+add_dataframe_table(doc, responses_anova, formats={
+    'F': lambda v: 'n/a (no variation)' if pd.isna(v) else f'{v:.3f}',
+    'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+})
+
+profile.stage('docx: Two-Way ANOVA')
+doc.add_heading('Two-Way ANOVA (Time Point × Sample Type)', level=1)
+if 'Time Point × Sample Type' not in twoway.index:
+    doc.add_paragraph('One observation per time point and sample type: the interaction is the error term.')
+add_dataframe_table(doc, twoway.reset_index(), formats={
+    'Sum Sq': '{:.4f}', 'Mean Sq': '{:.4f}',
+    'F': lambda v: '' if pd.isna(v) else f'{v:.3f}',
+    'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+})
+
+profile.stage('docx: Pairwise T-Test Results')
 doc.add_heading('Pairwise T-Test Results', level=1)
-table = doc.add_table(rows=1, cols=4)
-hdr_cells = table.rows[0].cells
-hdr_cells[0].text = 'Group 1'
-hdr_cells[1].text = 'Group 2'
-hdr_cells[2].text = 't-statistic'
-hdr_cells[3].text = 'p-value'
-for _, row in ttest_df.iterrows():
-    row_cells = table.add_row().cells
-    row_cells[0].text = row['Group 1']
-    row_cells[1].text = row['Group 2']
-    row_cells[2].text = str(row['t-statistic'])
-    row_cells[3].text = str(row['p-value'])
+add_dataframe_table(doc, ttest_df)
 
+profile.stage('docx: Permutation Test Results')
+doc.add_heading('Permutation Test Results', level=1)
+omnibus = perm['omnibus']
+doc.add_paragraph(f"Omnibus (one-way F): p={omnibus['p']:.5f} "
+                  f"({'exact, ' if omnibus['exact'] else 'Monte Carlo, '}{omnibus['n_perm']:,} permutations)")
+add_dataframe_table(doc, perm_df)
+
+profile.stage('docx: Graphs')
 doc.add_heading('Graphs', level=1)
 doc.add_paragraph('Line Plot:')
-doc.add_picture('plantain_line.jpeg', width=Inches(5))
+add_figure(doc, line_img, Inches(5))
 doc.add_paragraph('Bar Chart:')
-doc.add_picture('plantain_bar.jpeg', width=Inches(5))
+add_figure(doc, bar_img, Inches(5))
 doc.add_paragraph('Box Plot:')
-doc.add_picture('plantain_box.jpeg', width=Inches(5))
+add_figure(doc, box_img, Inches(5))
 
+profile.stage('save', output='Plantain_Sap_Analysis.docx')
 doc.save('Plantain_Sap_Analysis.docx')
+
+# Step 10: Keep the numbers for trend queries (results.sqlite, one transaction)
+profile.stage('results db')
+record_run('plantain', 'plantain', fermentation_rows({
+    'desc_stats': desc_stats, 'responses': responses_anova, 'ttests': ttests, 'twoway': twoway,
+    'permutation': perm,
+}), started=profile.started, source=sys.argv[1] if len(sys.argv) > 1 else None)
+profile.finish()
@@ -1,79 +1,64 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import skew, kurtosis
 from docx import Document
 from docx.shared import Inches
+from chart_templates import BarTemplate, RadarTemplate, BoxTemplate, HistogramTemplate
+from moments import Moments
+from profiling import RunProfile
+from sample_store import open_store
+
+profile = RunProfile('plat')
+profile.stage('data load')
 
 # Data
+sample = open_store().record('plantain-ethanol-1', feedstock='plantain', with_units=False)
 data = {
-    'Property': ['Ethanol concentration', 'Ethanol yield', 'pH', 'Density', 'Viscosity', 'Total Acidity'],
-    'Value': [36.50, 0.62, 5.6, 0.98, 1.70, 0.4]
+    'Property': list(sample),
+    'Value': list(sample.values())
 }
 df = pd.DataFrame(data)
 
 # Descriptive statistics
-mean_val = np.mean(df['Value'])
-std_val = np.std(df['Value'])
-skew_val = skew(df['Value'])
-kurt_val = kurtosis(df['Value'])
-
-# Bar Chart
-plt.figure(figsize=(8, 5))
-plt.bar(df['Property'], df['Value'], color='skyblue')
-plt.title('Physicochemical Properties of Plantain Sap')
-plt.ylabel('Value')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('bar_chart.jpeg')
-plt.close()
-
-# Radar Chart (Corrected)
-labels = df['Property']
-values = df['Value'].tolist()
-angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-
-# Close the loop
-values += values[:1]
-angles += angles[:1]
-
-fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
-ax.plot(angles, values, 'o-', linewidth=2)
-ax.fill(angles, values, alpha=0.25)
-ax.set_thetagrids(np.degrees(angles[:-1]), labels)
-ax.set_title('Radar Chart of Plantain Sap Properties')
-plt.savefig('radar_chart.jpeg')
-plt.close()
-
-# Box Plot
-plt.figure(figsize=(6, 4))
-plt.boxplot(df['Value'], vert=False)
-plt.title('Box Plot of Plantain Sap Values')
-plt.xlabel('Value')
-plt.tight_layout()
-plt.savefig('box_plot.jpeg')
-plt.close()
-
-# Histogram
-plt.figure(figsize=(6, 4))
-plt.hist(df['Value'], bins=6, color='lightgreen', edgecolor='black')
-plt.title('Histogram of Plantain Sap Values')
-plt.xlabel('Value')
-plt.ylabel('Frequency')
-plt.tight_layout()
-plt.savefig('histogram.jpeg')
-plt.close()
+profile.stage('descriptive stats')
+moments = Moments(['Value']).update(df)
+mean_val = moments.mean[0]
+std_val = moments.std(ddof=0)[0]
+skew_val = moments.skew()[0]
+kurt_val = moments.kurtosis()[0]
+
+# Charts (one styled template per chart kind)
+profile.stage('chart: bar_chart', output='bar_chart.png')
+bar_img = BarTemplate(ylabel='Value', rotation=45, embed_width=5).render(
+    df['Property'], df['Value'], 'bar_chart.png',
+    title='Physicochemical Properties of Plantain Sap', color='skyblue')
+
+profile.stage('chart: radar_chart', output='radar_chart.png')
+radar_img = RadarTemplate(embed_width=5).render(
+    df['Property'], df['Value'].to_numpy(), 'radar_chart.png',
+    title='Radar Chart of Plantain Sap Properties', fmt='o-')
+
+profile.stage('chart: box_plot', output='box_plot.png')
+box_img = BoxTemplate(xlabel='Value', embed_width=5).render(
+    df['Value'], 'box_plot.png', title='Box Plot of Plantain Sap Values', vert=False)
+
+profile.stage('chart: histogram', output='histogram.png')
+hist_img = HistogramTemplate(xlabel='Value', ylabel='Frequency', embed_width=5).render(
+    df['Value'], 'histogram.png', title='Histogram of Plantain Sap Values',
+    bins=6, color='lightgreen', edgecolor='black')
 
 # Academic-style Report
+profile.stage('docx: setup')
 doc = Document()
 doc.add_heading('Statistical Analysis of Physicochemical Properties of Plantain Sap', 0)
 
+profile.stage('docx: Abstract')
 doc.add_heading('Abstract', level=1)
 doc.add_paragraph(
     "This study presents a statistical evaluation of the physicochemical properties of plantain sap, "
     "highlighting its potential for industrial applications such as biofuel production and food processing."
 )
 
+profile.stage('docx: Methodology')
 doc.add_heading('Methodology', level=1)
 doc.add_paragraph(
     "Six key physicochemical parameters were analyzed: ethanol concentration, ethanol yield, pH, density, "
@@ -81,17 +66,19 @@ doc.add_paragraph(
     "kurtosis were computed. Visualizations were generated to aid interpretation."
 )
 
+profile.stage('docx: Results')
 doc.add_heading('Results', level=1)
 doc.add_paragraph(f"Mean Value: {mean_val:.2f}")
 doc.add_paragraph(f"Standard Deviation: {std_val:.2f}")
 doc.add_paragraph(f"Skewness: {skew_val:.2f}")
 doc.add_paragraph(f"Kurtosis: {kurt_val:.2f}")
 
-doc.add_picture('bar_chart.jpeg', width=Inches(5))
-doc.add_picture('radar_chart.jpeg', width=Inches(5))
-doc.add_picture('box_plot.jpeg', width=Inches(5))
-doc.add_picture('histogram.jpeg', width=Inches(5))
+doc.add_picture(bar_img, width=Inches(5))
+doc.add_picture(radar_img, width=Inches(5))
+doc.add_picture(box_img, width=Inches(5))
+doc.add_picture(hist_img, width=Inches(5))
 
+profile.stage('docx: Discussion')
 doc.add_heading('Discussion', level=1)
 doc.add_paragraph(
     "The ethanol concentration (36.50) significantly exceeds other values, contributing to a positive skewness "
@@ -100,10 +87,13 @@ doc.add_paragraph(
     "distribution than normal. The radar chart visually confirms ethanol concentration as the dominant trait."
 )
 
+profile.stage('docx: Conclusion')
 doc.add_heading('Conclusion', level=1)
 doc.add_paragraph(
     "Plantain sap exhibits physicochemical characteristics favorable for fermentation and biofuel production. "
     "Future studies should compare these findings with other fruit saps and explore optimization strategies."
 )
 
+profile.stage('save', output='Plantain_Sap_Analysis.docx')
 doc.save('Plantain_Sap_Analysis.docx')
+profile.finish()
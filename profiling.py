@@ -0,0 +1,102 @@
+import cProfile
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, peak RSS is reported as None
+    resource = None
+
+# Per-stage run profile. Scripts mark stage boundaries with
+# profile.stage('name', output=...); each stage records wall time, CPU time,
+# how far it raised the process's peak RSS (ru_maxrss only ever grows, so
+# 0 means the stage stayed under an earlier peak) and the byte size of the
+# files it wrote, and finish() writes the
+# lot as JSON to $SAP_PROFILE_DIR (default ./profiles), with the size and
+# resolution of every chart embedded through figures.embed_figure().
+# Set SAP_CPROFILE_STAGE to a stage name to also dump a cProfile .prof for it.
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _size(paths):
+    return sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+
+
+class RunProfile:
+    def __init__(self, run_name, profile_dir=None, cprofile_stage=None):
+        self.run_name = run_name
+        self.profile_dir = Path(profile_dir or os.environ.get('SAP_PROFILE_DIR', 'profiles'))
+        self.cprofile_stage = cprofile_stage or os.environ.get('SAP_CPROFILE_STAGE')
+        self.started = datetime.now()
+        self.stages = []
+        self._current = None
+        self._run_wall = time.perf_counter()
+        self._run_cpu = time.process_time()
+
+    def stage(self, name, output=()):
+        """End the current stage and start `name`; `output` is the file(s) it writes."""
+        self._end_stage()
+        outputs = [str(output)] if isinstance(output, (str, os.PathLike)) else [str(p) for p in output]
+        profiler = None
+        if name == self.cprofile_stage:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        self._current = (name, outputs, time.perf_counter(), time.process_time(), _peak_rss_bytes(), profiler)
+
+    def _end_stage(self):
+        if self._current is None:
+            return
+        name, outputs, wall, cpu, peak, profiler = self._current
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        record = {
+            'stage': name,
+            'wall_s': wall,
+            'cpu_s': cpu,
+            'peak_rss_growth_bytes': None if peak is None else _peak_rss_bytes() - peak,
+            'output_bytes': _size(outputs),
+            'outputs': outputs,
+        }
+        if profiler is not None:
+            profiler.disable()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            slug = re.sub(r'[^\w.-]+', '_', name)  # stage names like 'chart: bar' -> valid on Windows too
+            prof_path = self.profile_dir / f"{self._stem()}_{slug}.prof"
+            profiler.dump_stats(prof_path)
+            record['cprofile'] = str(prof_path)
+        self.stages.append(record)
+        self._current = None
+
+    def _stem(self):
+        return f"{self.run_name}_{self.started:%Y%m%dT%H%M%S}_{os.getpid()}"
+
+    def finish(self):
+        """Close the last stage and write the JSON profile; returns its path."""
+        self._end_stage()
+        report = {
+            'run': self.run_name,
+            'started': self.started.isoformat(timespec='seconds'),
+            'argv': sys.argv,
+            'wall_s': time.perf_counter() - self._run_wall,
+            'cpu_s': time.process_time() - self._run_cpu,
+            'peak_rss_bytes': _peak_rss_bytes(),
+            'stages': self.stages,
+        }
+        figures = sys.modules.get('figures')  # not imported here: runs without charts never load it
+        if figures is not None and figures.EMBEDDED:
+            report['images'] = figures.EMBEDDED
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        path = self.profile_dir / f"{self._stem()}.json"
+        path.write_text(json.dumps(report, indent=2))
+        return path
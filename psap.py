@@ -1,45 +1,53 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.oxml.ns import qn
+from chart_cache import cached_chart
+from docx_charts import add_figure
+from docx_tables import add_dataframe_table
+from profiling import RunProfile
+from sample_store import open_store
+
+profile = RunProfile('psap')
+profile.stage('data load')
 
 # === Step 1: Plantain Sap Data Setup ===
 
+sample = open_store().record('plantain-sap-1', feedstock='plantain')
+
+# Report label -> stored assay
+proximate_assays = {'Moisture': 'Moisture (%)', 'Protein': 'Protein (%)', 'Fat/Lipid': 'Fat/Lipid (%)',
+                    'Fibre': 'Fibre (%)', 'Ash': 'Ash (%)', 'Carbohydrate': 'Carbohydrate (%)'}
+bioethanol_assays = {'Energy': 'Energy (kcal/100g)', 'Lignin': 'Lignin (%)', 'Hemicellulose': 'Hemicellulose (%)',
+                     'Cellulose': 'Cellulose (%)', 'Sugar': 'Sugar (%)'}
+
 proximate_data = pd.DataFrame({
-    'Component': ['Moisture', 'Protein', 'Fat/Lipid', 'Fibre', 'Ash', 'Carbohydrate'],
-    'Value (%)': [95.62, 1.63, 0.25, 0.0, 0.15, 2.34]
+    'Component': list(proximate_assays),
+    'Value (%)': [sample[k] for k in proximate_assays.values()]
 })
 
 bioethanol_data = pd.DataFrame({
-    'Component': ['Energy', 'Lignin', 'Hemicellulose', 'Cellulose', 'Sugar'],
-    'Value': [18.13, 0.01, 0.52, 0.61, 5.13]
+    'Component': list(bioethanol_assays),
+    'Value': [sample[k] for k in bioethanol_assays.values()]
 })
 
 # === Step 2: Generate Graphs ===
 
 # Proximate composition chart
-plt.figure(figsize=(8, 5))
-plt.bar(proximate_data['Component'], proximate_data['Value (%)'], color='mediumseagreen')
-plt.title('Proximate Composition of Plantain Sap')
-plt.ylabel('Percentage (%)')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('plantain_proximate_composition.jpeg')
-plt.close()
+profile.stage('chart: plantain_proximate_composition', output='plantain_proximate_composition.png')
+proximate_img = cached_chart('plantain_proximate_composition.png', embed_width=5.5, kind='bar', data=dict(zip(proximate_data['Component'], proximate_data['Value (%)'])),
+                             title='Proximate Composition of Plantain Sap', ylabel='Percentage (%)', color='mediumseagreen',
+                             figsize=(8, 5), rotation=45, dpi=None)
 
 # Bioethanol metrics chart
-plt.figure(figsize=(8, 5))
-plt.bar(bioethanol_data['Component'], bioethanol_data['Value'], color='coral')
-plt.title('Bioethanol-Relevant Metrics from Plantain Sap')
-plt.ylabel('Value')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('plantain_bioethanol_metrics.jpeg')
-plt.close()
+profile.stage('chart: plantain_bioethanol_metrics', output='plantain_bioethanol_metrics.png')
+bioethanol_img = cached_chart('plantain_bioethanol_metrics.png', embed_width=5.5, kind='bar', data=dict(zip(bioethanol_data['Component'], bioethanol_data['Value'])),
+                              title='Bioethanol-Relevant Metrics from Plantain Sap', ylabel='Value', color='coral',
+                              figsize=(8, 5), rotation=45, dpi=None)
 
 # === Step 3: Create DOCX Report ===
 
+profile.stage('docx: setup')
 doc = Document()
 
 # Set default font to Times New Roman, 12 pt, black
@@ -53,34 +61,21 @@ style.element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
 doc.add_heading('Analysis of Plantain Sap Composition for Bioethanol Production', 0)
 
 # Proximate Composition Table
+profile.stage('docx: Proximate Composition')
 doc.add_heading('Proximate Composition', level=1)
-table1 = doc.add_table(rows=1, cols=2)
-table1.style = 'Table Grid'
-hdr_cells = table1.rows[0].cells
-hdr_cells[0].text = 'Component'
-hdr_cells[1].text = 'Value (%)'
-for i, row in proximate_data.iterrows():
-    cells = table1.add_row().cells
-    cells[0].text = row['Component']
-    cells[1].text = str(row['Value (%)'])
-
-doc.add_picture('plantain_proximate_composition.jpeg', width=Inches(5.5))
+add_dataframe_table(doc, proximate_data, style='Table Grid')
+
+add_figure(doc, proximate_img, Inches(5.5))
 
 # Bioethanol Metrics Table
+profile.stage('docx: Bioethanol-Relevant Metrics')
 doc.add_heading('Bioethanol-Relevant Metrics', level=1)
-table2 = doc.add_table(rows=1, cols=2)
-table2.style = 'Table Grid'
-hdr_cells = table2.rows[0].cells
-hdr_cells[0].text = 'Component'
-hdr_cells[1].text = 'Value'
-for i, row in bioethanol_data.iterrows():
-    cells = table2.add_row().cells
-    cells[0].text = row['Component']
-    cells[1].text = str(row['Value'])
-
-doc.add_picture('plantain_bioethanol_metrics.jpeg', width=Inches(5.5))
+add_dataframe_table(doc, bioethanol_data, style='Table Grid')
+
+add_figure(doc, bioethanol_img, Inches(5.5))
 
 # Discussion Section
+profile.stage('docx: Discussion')
 doc.add_heading('Discussion', level=1)
 doc.add_paragraph(
     "The proximate composition of plantain sap reveals an exceptionally high moisture content (95.62%), "
@@ -97,8 +92,11 @@ doc.add_paragraph(
 )
 
 # References
+profile.stage('docx: References')
 doc.add_heading('References', level=1)
 doc.add_paragraph("1. Rakhonde MG, Waghmare GM, Garud HS. (2019). Production of bioethanol from banana scuitched sap. International Journal of Chemical Studies, 7(1): 2369–2371. https://www.chemijournal.com/archives/2019/vol7issue1/PartAO/7-1-556-203.pdf")
 doc.add_paragraph("2. Wani S, Patil D. (2025). Nutritional and Biological Analysis of Nutrient-dense Banana Sap Water. International Journal of Environmental and Agriculture Research. https://ijoear.com/assets/articles_menuscripts/file/IJOEAR-JUL-2025-2.pdf")
 
+profile.stage('save', output='plantain_sap_analysis.docx')
 doc.save('plantain_sap_analysis.docx')
+profile.finish()
@@ -0,0 +1,169 @@
+from pathlib import Path
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection, PolyCollection
+
+# Radar charts for whole batches of profiles. Closed polygons for every sample
+# come out of one NumPy expression, and a page of small multiples is one
+# PolyCollection + LineCollection on a plain equal-aspect Axes (the polar
+# grid is drawn as line segments too), so a page costs about as much as a
+# single radar chart whatever the number of cells. Axis labels are written
+# once per page on the first cell; all cells share the same spoke order.
+
+RING_STEPS = 64
+
+
+def radar_angles(n_properties):
+    """Spoke angles, same order and start as RadarTemplate (0 rad, counter-clockwise)."""
+    return np.linspace(0, 2 * np.pi, n_properties, endpoint=False)
+
+
+def radar_radii(values, normalize=True):
+    """Scale values[S, P] to radii in [0, 1].
+
+    normalize=True scales each property to the batch min-max, so properties
+    with different units (octane ~100, density ~0.8) are comparable;
+    otherwise every value is divided by the batch max. Missing values go to
+    the centre.
+    """
+    values = np.asarray(values, dtype=float)
+    if normalize:
+        lo = np.nanmin(values, axis=0)
+        span = np.nanmax(values, axis=0) - lo
+        flat = np.where(np.isnan(values), np.nan, 0.5)  # a property with one value sits mid-way
+        radii = np.where(span > 0, (values - lo) / np.where(span > 0, span, 1), flat)
+    else:
+        radii = np.clip(values / np.nanmax(values), 0, 1)
+    return np.nan_to_num(radii)
+
+
+def radar_polygons(radii):
+    """Closed polygon vertices (S, P + 1, 2) around the origin for radii[S, P]."""
+    radii = np.asarray(radii, dtype=float)
+    angles = radar_angles(radii.shape[1])
+    xy = radii[..., None] * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    return np.concatenate([xy, xy[:, :1]], axis=1)
+
+
+def _guides(n_properties, centers, rings):
+    """Ring and spoke segments around every centre, for one LineCollection."""
+    theta = np.linspace(0, 2 * np.pi, RING_STEPS + 1)
+    circle = np.stack([np.cos(theta), np.sin(theta)], axis=-1)
+    ring = circle[None] * (np.arange(1, rings + 1) / rings)[:, None, None]
+    tips = radar_polygons(np.ones((1, n_properties)))[0, :-1]
+    spokes = np.stack([np.zeros_like(tips), tips], axis=1)
+    segments = [ring[None] + centers[:, None, None], spokes[None] + centers[:, None, None]]
+    return [s for group in segments for s in group.reshape(-1, *group.shape[2:])]
+
+
+def _page_paths(path, n_pages):
+    path = str(path)
+    if '{page' not in path:
+        p = Path(path)
+        path = str(p.with_name(f"{p.stem}_{{page:03d}}{p.suffix}"))
+    return [path.format(page=i + 1) for i in range(n_pages)]
+
+
+class RadarGrid:
+    """Paged small-multiples radar charts, nrows x ncols cells per page.
+
+    The page Figure is built once and reused; render() only swaps the
+    polygon collections and cell titles.
+    """
+
+    def __init__(self, labels, nrows=6, ncols=8, cell_inches=1.5, rings=4,
+                 color='green', alpha=0.25, linewidth=1, dpi=100):
+        self.labels = list(labels)
+        self.nrows, self.ncols = nrows, ncols
+        self.color, self.alpha, self.linewidth = color, alpha, linewidth
+        self.dpi = dpi
+        self.rings = rings
+        self.fig = Figure(figsize=(ncols * cell_inches, nrows * cell_inches + 0.4))
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0, 0, 1, nrows * cell_inches / (nrows * cell_inches + 0.4)])
+        self.ax.set_axis_off()
+        self.ax.set_aspect('equal')
+        # Cell pitch 2.8 radius units leaves room for spoke labels and the cell title
+        col, row = np.meshgrid(np.arange(ncols), np.arange(nrows))
+        self.centers = np.column_stack([col.ravel() * 2.8, -row.ravel() * 2.8])
+        self.ax.set_xlim(-2.0, (ncols - 1) * 2.8 + 1.4)
+        self.ax.set_ylim(-(nrows - 1) * 2.8 - 1.5, 1.3)
+        tips = radar_polygons(np.full((1, len(self.labels)), 1.12))[0, :-1]
+        for (x, y), label in zip(tips, self.labels):
+            self.ax.text(x, y, label, fontsize=5, ha='center', va='center', color='0.3')
+        self._artists = []
+
+    def _clear(self):
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+
+    def _draw_page(self, polygons, names, title):
+        self._clear()
+        centers = self.centers[:len(polygons)]
+        guides = LineCollection(_guides(len(self.labels), centers, self.rings), colors='0.85', linewidths=0.5)
+        shapes = polygons + centers[:, None]
+        fills = PolyCollection(shapes, facecolors=self.color, edgecolors='none', alpha=self.alpha)
+        edges = LineCollection(shapes, colors=self.color, linewidths=self.linewidth)
+        self._artists += [self.ax.add_collection(guides), self.ax.add_collection(fills),
+                          self.ax.add_collection(edges)]
+        if names is not None:
+            for (x, y), name in zip(centers, names):
+                self._artists.append(self.ax.text(x, y - 1.25, str(name), fontsize=6, ha='center', va='top'))
+        if title is not None:
+            self._artists.append(self.fig.suptitle(title, fontsize=10))
+
+    def render(self, values, path, names=None, title=None, normalize=True):
+        """Draw every row of values[S, P] (P = len(labels)); returns the written path(s).
+
+        A .pdf path gets all pages in one file; otherwise one image per page,
+        named from `path` with {page} (or a _001 suffix added).
+        """
+        polygons = radar_polygons(radar_radii(values, normalize))
+        per_page = self.nrows * self.ncols
+        n_pages = max(1, -(-len(polygons) // per_page))
+        pages = [slice(i * per_page, (i + 1) * per_page) for i in range(n_pages)]
+        names = None if names is None else list(names)
+
+        def page_title(i):
+            if n_pages == 1:
+                return title
+            return f"{title or 'Radar profiles'} ({i + 1}/{n_pages})"
+
+        if str(path).lower().endswith('.pdf'):
+            with PdfPages(path) as pdf:
+                for i, page in enumerate(pages):
+                    self._draw_page(polygons[page], names and names[page], page_title(i))
+                    pdf.savefig(self.fig)
+            return [str(path)]
+        paths = _page_paths(path, n_pages)
+        for i, (page, page_path) in enumerate(zip(pages, paths)):
+            self._draw_page(polygons[page], names and names[page], page_title(i))
+            self.fig.savefig(page_path, dpi=self.dpi)
+        return paths
+
+
+def radar_overlay(labels, values, path, title=None, normalize=True, color='green', alpha=0.08,
+                  linewidth=0.8, rings=4, figsize=(6, 6), dpi=100):
+    """All profiles of values[S, P] overlaid on one radar (one LineCollection)."""
+    labels = list(labels)
+    polygons = radar_polygons(radar_radii(values, normalize))
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0.08, 0.08, 0.84, 0.84])
+    ax.set_axis_off()
+    ax.set_aspect('equal')
+    ax.set_xlim(-1.3, 1.3)
+    ax.set_ylim(-1.3, 1.3)
+    ax.add_collection(LineCollection(_guides(len(labels), np.zeros((1, 2)), rings), colors='0.85', linewidths=0.5))
+    ax.add_collection(LineCollection(polygons, colors=color, alpha=alpha, linewidths=linewidth))
+    tips = radar_polygons(np.full((1, len(labels)), 1.12))[0, :-1]
+    for (x, y), label in zip(tips, labels):
+        ax.text(x, y, label, fontsize=8, ha='center', va='center')
+    if title is not None:
+        fig.suptitle(title)
+    fig.savefig(path, dpi=dpi)
+    return str(path)
@@ -0,0 +1,185 @@
+import re
+
+import numpy as np
+
+# Sorted-endpoint index over {property: (min, max)} range tables (the
+# ethb.py / ethp.py / datasets.FUEL_PROPERTIES shape), for screening large
+# feedstock catalogs:
+#
+#     index = RangeIndex.from_tables(catalog)
+#     index.query([('Octane number', 'min', '>=', 95),
+#                  ('Flash point', 'max', '<=', 15),
+#                  ('Autoignition temp.', 'overlaps', (360, 365))])
+#
+# Every condition reduces to bounds on the min or max endpoint of one
+# property. Each endpoint column is kept sorted, so the number of rows
+# passing any single bound is a searchsorted away; the query walks the most
+# selective bound's slice and checks the remaining bounds on those rows only.
+# Inserts go to an unsorted tail that is scanned directly and merged into the
+# sorted columns once it grows past REBUILD_FRACTION of the index.
+
+REBUILD_FRACTION = 0.1
+MIN_TAIL = 256
+ENDPOINTS = {'min': 0, 'max': 1}
+INTERVAL_RELATIONS = ('overlaps', 'within', 'contains')
+OPS = ('>=', '<=', '>', '<', '==')
+
+
+def _endpoint_bounds(condition):
+    """Split a condition into (property, endpoint, op, value) bounds."""
+    prop, relation, *rest = condition
+    if relation in ENDPOINTS:
+        op, value = rest
+        if op not in OPS:
+            raise ValueError(f"unknown operator {op!r}, expected one of {OPS}")
+        return [(prop, ENDPOINTS[relation], op, float(value))]
+    if relation not in INTERVAL_RELATIONS:
+        raise ValueError(f"unknown relation {relation!r}")
+    (bounds,) = rest
+    lo, hi = (bounds, bounds) if np.isscalar(bounds) else bounds
+    if relation == 'overlaps':    # range shares at least one point with [lo, hi]
+        return [(prop, 0, '<=', float(hi)), (prop, 1, '>=', float(lo))]
+    if relation == 'within':      # range lies inside [lo, hi]
+        return [(prop, 0, '>=', float(lo)), (prop, 1, '<=', float(hi))]
+    return [(prop, 0, '<=', float(lo)), (prop, 1, '>=', float(hi))]  # contains
+
+
+def parse_condition(text):
+    """Parse 'Octane number: min >= 95' or 'Autoignition temp.: overlaps 360 365'."""
+    match = re.match(r'^\s*(.+?)\s*:\s*(min|max)\s*(>=|<=|==|>|<)\s*(\S+)\s*$', text)
+    if match:
+        prop, endpoint, op, value = match.groups()
+        return (prop, endpoint, op, float(value))
+    match = re.match(r'^\s*(.+?)\s*:\s*(overlaps|within|contains)\s+(\S+)(?:\s+(\S+))?\s*$', text)
+    if match:
+        prop, relation, lo, hi = match.groups()
+        return (prop, relation, (float(lo), float(hi if hi is not None else lo)))
+    raise ValueError(f"cannot parse condition {text!r}")
+
+
+def _compare(values, op, value):
+    if op == '>=':
+        return values >= value
+    if op == '<=':
+        return values <= value
+    if op == '>':
+        return values > value
+    if op == '<':
+        return values < value
+    return values == value
+
+
+class RangeIndex:
+    def __init__(self, properties):
+        self.properties = list(properties)
+        self._column = {p: j for j, p in enumerate(self.properties)}
+        self.names = []
+        self._ranges = np.empty((0, len(self.properties), 2))
+        self._order = np.empty((len(self.properties), 2, 0), dtype=np.intp)
+        self._sorted = np.empty((len(self.properties), 2, 0))
+        self._valid = np.zeros((len(self.properties), 2), dtype=np.intp)
+        self._tail = []
+
+    @classmethod
+    def from_tables(cls, tables, properties=None):
+        """Bulk-load {name: {property: (min, max)}}; missing properties are NaN and never match."""
+        if properties is None:
+            properties = dict.fromkeys(p for table in tables.values() for p in table)
+        index = cls(properties)
+        ranges = np.full((len(tables), len(index.properties), 2), np.nan)
+        for i, table in enumerate(tables.values()):
+            for prop, bounds in table.items():
+                ranges[i, index._column[prop]] = bounds
+        index.bulk_load(list(tables), ranges)
+        return index
+
+    def column(self, prop):
+        """Column of `prop`; ValueError listing the known properties if it is not indexed."""
+        try:
+            return self._column[prop]
+        except KeyError:
+            raise ValueError(f"unknown property {prop!r}; indexed properties: {', '.join(self.properties)}") from None
+
+    def bulk_load(self, names, ranges):
+        """Append rows of ranges[N, P, 2] (properties in self.properties order) and re-sort once."""
+        ranges = np.asarray(ranges, dtype=float)
+        self._flush_tail()
+        self.names.extend(names)
+        self._ranges = np.concatenate([self._ranges, ranges])
+        self._rebuild()
+
+    def insert(self, name, table):
+        """Add one {property: (min, max)} profile; it is queryable immediately."""
+        row = np.full((len(self.properties), 2), np.nan)
+        for prop, bounds in table.items():
+            row[self.column(prop)] = bounds
+        self.names.append(name)
+        self._tail.append(row)
+        if len(self._tail) > max(MIN_TAIL, REBUILD_FRACTION * len(self._ranges)):
+            self._flush_tail()
+            self._rebuild()
+
+    def __len__(self):
+        return len(self.names)
+
+    def _flush_tail(self):
+        if self._tail:
+            self._ranges = np.concatenate([self._ranges, np.stack(self._tail)])
+            self._tail = []
+
+    def _rebuild(self):
+        # (property, endpoint, row) sort order; NaNs sort last and are cut off by _valid
+        columns = self._ranges.transpose(1, 2, 0)
+        self._order = np.argsort(columns, axis=2, kind='stable')
+        self._sorted = np.take_along_axis(columns, self._order, axis=2)
+        self._valid = (~np.isnan(columns)).sum(axis=2)
+
+    def _slice(self, j, endpoint, op, value):
+        values = self._sorted[j, endpoint, :self._valid[j, endpoint]]
+        if op == '>=':
+            return np.searchsorted(values, value, 'left'), len(values)
+        if op == '>':
+            return np.searchsorted(values, value, 'right'), len(values)
+        if op == '<=':
+            return 0, np.searchsorted(values, value, 'right')
+        if op == '<':
+            return 0, np.searchsorted(values, value, 'left')
+        return np.searchsorted(values, value, 'left'), np.searchsorted(values, value, 'right')
+
+    def query_ids(self, conditions):
+        """Row ids (insertion order) of profiles meeting every condition."""
+        bounds = [b for c in conditions for b in _endpoint_bounds(c)]
+        n_sorted = len(self._ranges)
+        bounds = [(self.column(prop), endpoint, op, value) for prop, endpoint, op, value in bounds]
+        if not bounds:
+            return np.arange(len(self.names))
+
+        # Walk the narrowest sorted slice, then check the other bounds on it
+        slices = [self._slice(*b) for b in bounds]
+        best = int(np.argmin([stop - start for start, stop in slices]))
+        j, endpoint, _, _ = bounds[best]
+        start, stop = slices[best]
+        ids = np.sort(self._order[j, endpoint, start:stop])
+        candidates = self._ranges[ids]
+        keep = np.ones(len(ids), dtype=bool)
+        for k, (j, endpoint, op, value) in enumerate(bounds):
+            if k != best:
+                keep &= _compare(candidates[:, j, endpoint], op, value)
+        ids = ids[keep]
+
+        if self._tail:
+            tail = np.stack(self._tail)
+            keep = np.ones(len(tail), dtype=bool)
+            for j, endpoint, op, value in bounds:
+                keep &= _compare(tail[:, j, endpoint], op, value)
+            ids = np.concatenate([ids, n_sorted + np.flatnonzero(keep)])
+        return ids
+
+    def query(self, conditions):
+        """Names of profiles meeting every condition, in insertion order.
+
+        Conditions are (property, 'min' | 'max', op, value) with op one of
+        >=, <=, >, <, ==, or (property, 'overlaps' | 'within' | 'contains',
+        (lo, hi)) where a scalar stands for the point range (x, x).
+        """
+        return [self.names[i] for i in self.query_ids(conditions)]
@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from figures import EMBEDDED, embed_figure
+
+# Chart jobs are plain (function, kwargs) pairs so they can be pickled to
+# worker processes. Every job builds its own Figure (no pyplot state) and
+# returns the image as a BytesIO (figures.embed_figure, sized for an
+# `embed_width`-inch picture; `filename` is written too when figure copies
+# are on). Pool workers hand their figures.EMBEDDED records back with the
+# result, so the parent's run profile lists every chart.
+
+
+def _new_figure(figsize, **subplot_kw):
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, **subplot_kw)
+    return fig, ax
+
+
+def minmax_bar(data_subset, title, filename, overlap=False, embed_width=None):
+    """Min/max bar chart of a {property: (min, max)} dict.
+
+    overlap=False draws the bars side by side (ethb.py style),
+    overlap=True draws Max behind Min on the same slot (ethp.py style).
+    """
+    labels = list(data_subset.keys())
+    mins = [data_subset[k][0] for k in labels]
+    maxs = [data_subset[k][1] for k in labels]
+    x = np.arange(len(labels))
+
+    fig, ax = _new_figure((8, 5))
+    if overlap:
+        ax.bar(x, maxs, color='skyblue', label='Max')
+        ax.bar(x, mins, color='orange', label='Min')
+    else:
+        ax.bar(x - 0.2, mins, width=0.4, color='orange', label='Min')
+        ax.bar(x + 0.2, maxs, width=0.4, color='skyblue', label='Max')
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45)
+    ax.set_title(title)
+    ax.legend()
+    fig.tight_layout()
+    return embed_figure(fig, filename, 'minmax', embed_width)
+
+
+def radar(data, title, filename, color='green', values=None, embed_width=None):
+    """Radar chart of the midpoint of each (min, max) range.
+
+    `values` may carry midpoints the caller already computed (in `data` order).
+    """
+    labels = list(data.keys())
+    if values is None:
+        values = np.array([(data[k][0] + data[k][1]) / 2 for k in labels])
+    values = np.asarray(values, dtype=float)
+    angles = np.arange(len(labels)) / len(labels) * 2 * np.pi
+    values = np.append(values, values[0])
+    angles = np.append(angles, angles[0])
+
+    fig, ax = _new_figure((6, 6), polar=True)
+    ax.plot(angles, values, color=color, linewidth=2)
+    ax.fill(angles, values, color=color, alpha=0.25)
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(labels)
+    ax.set_title(title)
+    fig.tight_layout()
+    return embed_figure(fig, filename, 'radar', embed_width)
+
+
+def _run(job):
+    func, kwargs = job
+    return func(**kwargs)
+
+
+def _run_recorded(job):
+    start = len(EMBEDDED)
+    result = _run(job)
+    records = EMBEDDED[start:]
+    del EMBEDDED[start:]  # the worker lives on for the next job
+    return result, records
+
+
+def render_all(jobs, max_workers=None):
+    """Render independent chart jobs in a process pool.
+
+    Returns the job results (images) in the same order as `jobs`. max_workers=1
+    renders in-process, which is cheaper than a pool for one or two charts.
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) < 2:
+        return [_run(job) for job in jobs]
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for result, records in pool.map(_run_recorded, jobs):
+            EMBEDDED.extend(records)
+            results.append(result)
+    return results
@@ -0,0 +1,223 @@
+import math
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+
+# SQLite store of every number a run reports, one row per value:
+#
+#   runs(run_id, started, script, feedstock, source)
+#   results(run_id, started, feedstock, analysis, response, treatment, metric, value)
+#
+# e.g. ('anova', 'pH', '', 'F', 12.3) or ('t-test', 'Viable Cell Count',
+# 'Blank vs Acid treatment', 'p-value', 0.0004). 'started' (unix seconds) and
+# 'feedstock' are copied from runs into results so that trend queries are
+# answered from one index range scan without a join. A run's rows are
+# written with executemany inside one transaction; the database is in WAL
+# mode so report scripts running side by side do not block readers.
+
+RESULTS_DB = Path(os.environ.get('SAP_RESULTS_DB', 'results.sqlite'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id    INTEGER PRIMARY KEY,
+    started   REAL NOT NULL,
+    script    TEXT NOT NULL,
+    feedstock TEXT NOT NULL,
+    source    TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id    INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    started   REAL NOT NULL,
+    feedstock TEXT NOT NULL,
+    analysis  TEXT NOT NULL,
+    response  TEXT NOT NULL DEFAULT '',
+    treatment TEXT NOT NULL DEFAULT '',
+    metric    TEXT NOT NULL,
+    value     REAL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS runs_feedstock ON runs(feedstock, started);
+-- covering index for trend queries: no table lookups
+CREATE INDEX IF NOT EXISTS results_metric
+    ON results(metric, analysis, feedstock, started, run_id, response, treatment, value);
+CREATE INDEX IF NOT EXISTS results_feedstock ON results(feedstock, started);
+CREATE INDEX IF NOT EXISTS results_treatment ON results(treatment, metric, started);
+CREATE INDEX IF NOT EXISTS results_run ON results(run_id);
+"""
+
+
+def _timestamp(when):
+    if when is None:
+        return time.time()
+    if isinstance(when, datetime):
+        return when.timestamp()
+    if isinstance(when, str):
+        return datetime.fromisoformat(when).timestamp()
+    return float(when)
+
+
+def _float(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+# --- Rows from analysis outputs ---------------------------------------------
+
+def table_rows(analysis, table, by='treatment', response='', treatment=''):
+    """(analysis, response, treatment, metric, value) for every numeric cell.
+
+    The index label goes into the `by` column ('treatment' or 'response');
+    each numeric column becomes a metric.
+    """
+    rows = []
+    numeric = table.select_dtypes('number')
+    for label, values in numeric.iterrows():
+        keys = {'response': response, 'treatment': treatment, by: str(label)}
+        rows.extend((analysis, keys['response'], keys['treatment'], metric, value)
+                    for metric, value in values.items())
+    return rows
+
+
+def _pairs(table):
+    """Index a 'Group 1' / 'Group 2' table by 'A vs B'."""
+    label = table['Group 1'].astype(str) + ' vs ' + table['Group 2'].astype(str)
+    return table.drop(columns=['Group 1', 'Group 2']).set_index(label)
+
+
+def fermentation_rows(results, value_col='Viable Cell Count'):
+    """Rows for a pipelines.fermentation_stats()-shaped results dict."""
+    rows = table_rows('descriptive', results['desc_stats'], response=value_col)
+    rows += table_rows('anova', results['responses'].set_index('Response'), by='response')
+    rows += table_rows('t-test', _pairs(results['ttests']), response=value_col)
+    if 'twoway' in results:
+        rows += table_rows('two-way anova', results['twoway'], response=value_col)
+    if 'bootstrap' in results:
+        boot = results['bootstrap']
+        rows += table_rows('bootstrap', boot['means'], response=value_col)
+        rows += table_rows('bootstrap', _pairs(boot['differences']), response=value_col)
+        rows += [('bootstrap', value_col, '', metric, boot['F'][metric]) for metric in ('F', 'CI low', 'CI high')]
+    if 'permutation' in results:
+        perm = results['permutation']
+        rows.append(('permutation', value_col, '', 'p-value', perm['omnibus']['p']))
+        rows += table_rows('permutation', _pairs(perm['pairwise']).drop(columns='Exact'), response=value_col)
+    return rows
+
+
+def regression_rows(fit, target, desc_stats=None):
+    """Rows for one batched_ols fit (intercept, R², coef: / se: per feature) and optional descriptive stats."""
+    rows = [('regression', target, '', key, value) for key, value in fit.items() if key != 'status']
+    if desc_stats is not None:
+        rows += table_rows('descriptive', desc_stats, by='response')
+    return rows
+
+
+def derived_rows(derived):
+    """Rows for derive_metrics() output: a Series (one sample) or a DataFrame (response = sample label)."""
+    if derived.ndim == 1:
+        return [('derived metrics', '', '', metric, value) for metric, value in derived.items()]
+    return table_rows('derived metrics', derived, by='response')
+
+
+# --- Store --------------------------------------------------------------------
+
+class ResultsStore:
+    def __init__(self, path=None):
+        self.path = Path(path or RESULTS_DB)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA foreign_keys=ON')
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.execute('PRAGMA optimize')  # keeps the planner's index statistics current
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_run(self, script, feedstock, rows, started=None, source=None):
+        """Store one run and its (analysis, response, treatment, metric, value) rows in a single transaction."""
+        started = _timestamp(started)
+        with self.db:
+            run_id = self.db.execute(
+                'INSERT INTO runs (started, script, feedstock, source) VALUES (?, ?, ?, ?)',
+                (started, script, feedstock, source)).lastrowid
+            self.db.executemany(
+                'INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                ((run_id, started, feedstock, analysis, response or '', treatment or '', metric, _float(value))
+                 for analysis, response, treatment, metric, value in rows))
+        return run_id
+
+    def runs(self, feedstock=None, script=None, since=None, until=None):
+        import pandas as pd
+        where, params = self._where(feedstock=feedstock, script=script, since=since, until=until)
+        frame = pd.read_sql_query(f'SELECT * FROM runs{where} ORDER BY started', self.db, params=params)
+        frame['started'] = pd.to_datetime(frame['started'], unit='s')
+        return frame
+
+    def trend(self, metric, analysis=None, feedstock=None, response=None, treatment=None, since=None, until=None):
+        """Long table of one metric across runs, oldest first."""
+        import pandas as pd
+        where, params = self._where(metric=metric, analysis=analysis, feedstock=feedstock, response=response,
+                                    treatment=treatment, since=since, until=until)
+        columns = ['run_id', 'started', 'feedstock', 'analysis', 'response', 'treatment', 'value']
+        cursor = self.db.execute(
+            f"SELECT {', '.join(columns)} FROM results{where} ORDER BY started, run_id", params)
+        frame = pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+        frame['started'] = pd.to_datetime(frame['started'], unit='s')
+        return frame
+
+    def trend_table(self, metric, columns='treatment', **filters):
+        """One row per run (run_id, started), one column per distinct `columns` value.
+
+        When a run has several values under one `columns` value (e.g. the
+        t-test and permutation p-values of the same pair), the columns are
+        widened to 'analysis / response / treatment' labels, keeping the
+        parts that vary; a ValueError is raised if even those collide.
+        """
+        frame = self.trend(metric, **filters)
+        if frame.duplicated(['run_id', columns]).any():
+            parts = [c for c in ('analysis', 'response', 'treatment') if c == columns or frame[c].nunique() > 1]
+            label = frame[parts].apply(lambda row: ' / '.join(part for part in row if part), axis=1)
+            frame = frame.assign(**{columns: label})
+            if frame.duplicated(['run_id', columns]).any():
+                raise ValueError(f"several {metric!r} values per run share a column; filter by analysis, "
+                                 f"response or treatment")
+        table = frame.groupby(['run_id', 'started', columns], sort=False)['value'].first().unstack(columns)
+        table = table.reindex(columns=frame[columns].unique())
+        table.columns.name = None
+        return table.reset_index().sort_values(['started', 'run_id'], ignore_index=True)
+
+    @staticmethod
+    def _where(since=None, until=None, **equals):
+        clauses, params = [], []
+        for column, value in equals.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            else:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('started >= ?')
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append('started <= ?')
+            params.append(_timestamp(until))
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+
+def record_run(script, feedstock, rows, started=None, source=None, path=None):
+    """Open the results database ($SAP_RESULTS_DB, default ./results.sqlite), store one run, close it."""
+    with ResultsStore(path) as store:
+        return store.record_run(script, feedstock, rows, started, source)
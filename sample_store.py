@@ -0,0 +1,242 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+# Columnar on-disk store of assay values, one row per (sample, assay):
+#
+#   sample_store/
+#     manifest.json            row count, each feedstock's row range, and
+#                              the seed hash (or 'imported')
+#     value.npy                float64
+#     date.npy                 datetime64[D], NaT when the sampling date is unknown
+#     sample_id.npy, feedstock.npy, dataset.npy, assay.npy, unit.npy
+#                              int32 codes into <column>.labels.npy
+#
+# Files are opened with np.load(mmap_mode='r'), so a query only pages in the
+# columns it names and, within them, the rows it selects. Rows are sorted by
+# feedstock, then date, then sample: a feedstock is a contiguous row range
+# kept in the manifest and a date range inside it is two binary searches, so
+# neither selection reads the whole store. Within a sample rows keep the
+# order they were written in.
+#
+# A store seeded from datasets.py records a hash of that file; open_store()
+# rebuilds it when datasets.py (or SEED_VERSION, for changes to seed_frame)
+# has changed since. Stores imported from a file are never rebuilt.
+
+SEED_VERSION = 1
+STORE_DIR = Path(os.environ.get('SAP_SAMPLE_STORE', 'sample_store'))
+LABEL_COLUMNS = ['sample_id', 'feedstock', 'dataset', 'assay', 'unit']
+COLUMNS = LABEL_COLUMNS + ['value', 'date']
+_UNIT_RE = re.compile(r'^(.*?) \((.+)\)$')
+
+
+def split_label(label):
+    """'Energy (kcal/100g)' -> ('Energy', 'kcal/100g'); no unit -> (label, '')."""
+    match = _UNIT_RE.match(label)
+    return match.groups() if match else (label, '')
+
+
+def join_label(assay, unit):
+    return f'{assay} ({unit})' if unit else assay
+
+
+def seed_hash():
+    """Hash of the datasets.py the seed rows come from."""
+    import datasets
+    source = Path(datasets.__file__).read_bytes()
+    return hashlib.sha256(b'%d\n' % SEED_VERSION + source).hexdigest()
+
+
+def seed_frame():
+    """The measurements in datasets.py as store rows (sampling dates unknown)."""
+    import pandas as pd
+    import datasets as ds
+    rows = []
+
+    def add(sample_id, feedstock, dataset, values):
+        for key, value in values.items():
+            if dataset == 'composition':
+                assay, unit = split_label(key)
+            else:
+                assay, unit = key, ds.UNITS.get(key.split(':')[0], '')
+            rows.append((sample_id, feedstock, dataset, assay, unit, float(value)))
+
+    add('banana-sap-1', 'banana', 'composition', ds.BANANA_SAP_COMPOSITION)
+    add('banana-sap-2', 'banana', 'composition', ds.BANANA_SAP_COMPOSITION_B)
+    add('plantain-sap-1', 'plantain', 'composition', ds.PLANTAIN_SAP_COMPOSITION)
+    for feedstock, table in ds.PHYSICOCHEMICAL.items():
+        for i in range(len(next(iter(table.values())))):
+            add(f'{feedstock}-ethanol-{i + 1}', feedstock, 'physicochemical', {k: v[i] for k, v in table.items()})
+    for feedstock, table in ds.FUEL_PROPERTIES.items():
+        add(f'{feedstock}-fuel-1', feedstock, 'fuel-properties',
+            {f'{prop}: {bound}': value for prop, bounds in table.items() for bound, value in zip(('min', 'max'), bounds)})
+
+    frame = pd.DataFrame(rows, columns=COLUMNS[:-1])
+    frame['date'] = pd.NaT
+    return frame
+
+
+def write_store(frame, path=None, seed=None):
+    """Write a long DataFrame with COLUMNS ('date' optional) as a store; replaces any existing one.
+
+    `seed` is the seed_hash() the rows were built from; without it the store counts as imported.
+    """
+    import pandas as pd
+    path = Path(path or STORE_DIR)
+    tmp = path.with_name(f'{path.name}.tmp{os.getpid()}')
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    codes, labels = {}, {}
+    for col in LABEL_COLUMNS:
+        values = frame[col].fillna('') if col == 'unit' else frame[col]
+        codes[col], labels[col] = pd.factorize(values.astype(str))
+    if 'date' in frame:
+        dates = pd.to_datetime(frame['date']).to_numpy().astype('datetime64[D]')
+    else:
+        dates = np.full(len(frame), np.datetime64('NaT'), dtype='datetime64[D]')
+    day = dates.view(np.int64)
+    day = np.where(np.isnat(dates), np.iinfo(np.int64).max, day)  # unknown dates last, as np.sort does
+    order = np.lexsort((codes['sample_id'], day, codes['feedstock']))  # stable: keeps row order within a sample
+
+    for col in LABEL_COLUMNS:
+        np.save(tmp / f'{col}.npy', codes[col][order].astype(np.int32))
+        np.save(tmp / f'{col}.labels.npy', np.asarray(labels[col], dtype=str))
+    np.save(tmp / 'value.npy', frame['value'].to_numpy(dtype=float)[order])
+    np.save(tmp / 'date.npy', dates[order])
+
+    stops = np.cumsum(np.bincount(codes['feedstock'], minlength=len(labels['feedstock'])))
+    starts = stops - np.bincount(codes['feedstock'], minlength=len(labels['feedstock']))
+    manifest = {
+        'rows': len(frame),
+        'columns': COLUMNS,
+        'feedstocks': {name: [int(a), int(b)] for name, a, b in zip(labels['feedstock'], starts, stops)},
+    }
+    manifest.update({'seed': seed} if seed else {'imported': True})
+    (tmp / 'manifest.json').write_text(json.dumps(manifest, indent=1))
+    shutil.rmtree(path, ignore_errors=True)
+    tmp.rename(path)
+    return path
+
+
+class SampleStore:
+    """Read side of the store; see the module comment for the layout."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or STORE_DIR)
+        self.manifest = json.loads((self.path / 'manifest.json').read_text())
+        self._mapped = {}
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    @property
+    def feedstocks(self):
+        return list(self.manifest['feedstocks'])
+
+    def column(self, name):
+        """Memory-mapped column (int32 codes for the label columns)."""
+        if name not in self._mapped:
+            self._mapped[name] = np.load(self.path / f'{name}.npy', mmap_mode='r')
+        return self._mapped[name]
+
+    def labels(self, name):
+        return self.column(f'{name}.labels')
+
+    def _slices(self, feedstock=None, start=None, end=None):
+        ranges = self.manifest['feedstocks']
+        if feedstock is None:
+            names = list(ranges)
+        else:
+            names = [feedstock] if isinstance(feedstock, str) else list(feedstock)
+        slices = []
+        for name in names:
+            if name not in ranges:
+                continue
+            lo, hi = ranges[name]
+            if start is not None or end is not None:
+                dates = self.column('date')[lo:hi]
+                first = np.searchsorted(dates, np.datetime64(start, 'D')) if start is not None else 0
+                last = np.searchsorted(dates, np.datetime64(end, 'D'), side='right') if end is not None \
+                    else np.searchsorted(dates, np.datetime64('NaT'))  # a date filter drops unknown dates
+                lo, hi = lo + int(first), lo + int(last)
+            if hi > lo:
+                slices.append(slice(lo, hi))
+        return slices
+
+    def _gather(self, columns, feedstock, start, end, equals):
+        slices = self._slices(feedstock, start, end)
+        keep = [None] * len(slices)
+        for col, wanted in equals.items():
+            wanted = [wanted] if isinstance(wanted, str) else list(wanted)
+            wanted_codes = np.flatnonzero(np.isin(self.labels(col), wanted))
+            for i, rows in enumerate(slices):
+                hit = np.isin(self.column(col)[rows], wanted_codes)
+                keep[i] = hit if keep[i] is None else keep[i] & hit
+        out = {}
+        for col in columns:
+            data = self.column(col)
+            parts = [data[rows] if k is None else data[rows][k] for rows, k in zip(slices, keep)]
+            out[col] = np.concatenate(parts) if parts else np.asarray(data[:0])
+        return out
+
+    def take(self, columns=None, feedstock=None, start=None, end=None, **equals):
+        """Selected rows as {column: ndarray}; label columns come back as strings.
+
+        feedstock: a name or list of names; start/end: inclusive dates;
+        equals: label column -> value or list of values (e.g. dataset='composition').
+        """
+        data = self._gather(list(columns or COLUMNS), feedstock, start, end, equals)
+        return {col: np.asarray(self.labels(col))[values] if col in LABEL_COLUMNS else values
+                for col, values in data.items()}
+
+    def select(self, columns=None, feedstock=None, start=None, end=None, **equals):
+        """Same as take(), as a DataFrame with categorical label columns."""
+        import pandas as pd
+        data = self._gather(list(columns or COLUMNS), feedstock, start, end, equals)
+        for col in data.keys() & set(LABEL_COLUMNS):
+            used, codes = np.unique(data[col], return_inverse=True)
+            data[col] = pd.Categorical.from_codes(codes, np.asarray(self.labels(col))[used])
+        return pd.DataFrame(data)
+
+    def record(self, sample_id, feedstock=None, with_units=True):
+        """One sample as {assay: value}, e.g. {'Moisture (%)': 95.81, ...} in stored order."""
+        data = self.take(['assay', 'unit', 'value'], feedstock, sample_id=sample_id)
+        names = [join_label(a, u) if with_units else a for a, u in zip(data['assay'], data['unit'])]
+        return dict(zip(names, data['value'].tolist()))
+
+    def wide(self, feedstock, dataset, with_units=True):
+        """A dataset as a samples x assays DataFrame (assays in stored order)."""
+        import pandas as pd
+        data = self.take(['sample_id', 'assay', 'unit', 'value'], feedstock, dataset=dataset)
+        names = [join_label(a, u) if with_units else a for a, u in zip(data['assay'], data['unit'])]
+        table = pd.DataFrame({'sample_id': data['sample_id'], 'assay': names, 'value': data['value']})
+        wide = table.pivot(index='sample_id', columns='assay', values='value')
+        wide = wide.reindex(index=pd.unique(table['sample_id']), columns=pd.unique(table['assay']))
+        wide.columns.name = None
+        return wide
+
+
+def _stale(path):
+    manifest = path / 'manifest.json'
+    if not manifest.exists():
+        return True
+    manifest = json.loads(manifest.read_text())
+    return not manifest.get('imported') and manifest.get('seed') != seed_hash()
+
+
+def open_store(path=None):
+    """Open the store, building it from datasets.py the first time and whenever datasets.py changed."""
+    path = Path(path or STORE_DIR)
+    if _stale(path):
+        try:
+            write_store(seed_frame(), path, seed=seed_hash())
+        except OSError:
+            if not (path / 'manifest.json').exists():  # not just another process building it too
+                raise
+    return SampleStore(path)
@@ -1,45 +1,53 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.oxml.ns import qn
+from chart_cache import cached_chart
+from docx_charts import add_figure
+from docx_tables import add_dataframe_table
+from profiling import RunProfile
+from sample_store import open_store
+
+profile = RunProfile('sap')
+profile.stage('data load')
 
 # === Step 1: Sample Data Setup ===
 
+sample = open_store().record('banana-sap-2', feedstock='banana')
+
+# Report label -> stored assay
+proximate_assays = {'Moisture': 'Moisture (%)', 'Fibre': 'Fibre (%)', 'Ash': 'Ash (%)', 'Protein': 'Protein (%)',
+                    'Fat': 'Fat/Lipid (%)', 'Carbohydrate': 'Carbohydrate (%)'}
+bioethanol_assays = {'Energy Content': 'Energy (MJ/kg)', 'Lignin': 'Lignin (%)', 'Cellulose': 'Cellulose (%)',
+                     'Hemicellulose': 'Hemicellulose (%)', 'Reducing Sugars': 'Sugar (%)'}
+
 proximate_data = pd.DataFrame({
-    'Component': ['Moisture', 'Fibre', 'Ash', 'Protein', 'Fat', 'Carbohydrate'],
-    'Value (%)': [85.2, 3.1, 1.2, 1.5, 0.3, 8.7]
+    'Component': list(proximate_assays),
+    'Value (%)': [sample[k] for k in proximate_assays.values()]
 })
 
 bioethanol_data = pd.DataFrame({
-    'Component': ['Energy Content', 'Lignin', 'Cellulose', 'Hemicellulose', 'Reducing Sugars'],
-    'Value': [16.5, 12.3, 25.4, 18.7, 9.8]
+    'Component': list(bioethanol_assays),
+    'Value': [sample[k] for k in bioethanol_assays.values()]
 })
 
 # === Step 2: Generate Graphs ===
 
 # Proximate composition chart
-plt.figure(figsize=(8, 5))
-plt.bar(proximate_data['Component'], proximate_data['Value (%)'], color='skyblue')
-plt.title('Proximate Composition of Banana Sap')
-plt.ylabel('Percentage (%)')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('proximate_composition.jpeg')
-plt.close()
+profile.stage('chart: proximate_composition', output='proximate_composition.png')
+proximate_img = cached_chart('proximate_composition.png', embed_width=5.5, kind='bar', data=dict(zip(proximate_data['Component'], proximate_data['Value (%)'])),
+                             title='Proximate Composition of Banana Sap', ylabel='Percentage (%)', color='skyblue',
+                             figsize=(8, 5), rotation=45, dpi=None)
 
 # Bioethanol metrics chart
-plt.figure(figsize=(8, 5))
-plt.bar(bioethanol_data['Component'], bioethanol_data['Value'], color='orange')
-plt.title('Bioethanol-Relevant Metrics from Banana Sap')
-plt.ylabel('Value')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('bioethanol_metrics.jpeg')
-plt.close()
+profile.stage('chart: bioethanol_metrics', output='bioethanol_metrics.png')
+bioethanol_img = cached_chart('bioethanol_metrics.png', embed_width=5.5, kind='bar', data=dict(zip(bioethanol_data['Component'], bioethanol_data['Value'])),
+                              title='Bioethanol-Relevant Metrics from Banana Sap', ylabel='Value', color='orange',
+                              figsize=(8, 5), rotation=45, dpi=None)
 
 # === Step 3: Create DOCX Report ===
 
+profile.stage('docx: setup')
 doc = Document()
 
 # Set default font to Times New Roman, 12 pt, black
@@ -53,34 +61,21 @@ style.element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
 doc.add_heading('Analysis of Banana Sap Composition for Bioethanol Production', 0)
 
 # Proximate Composition Table
+profile.stage('docx: Proximate Composition')
 doc.add_heading('Proximate Composition', level=1)
-table1 = doc.add_table(rows=1, cols=2)
-table1.style = 'Table Grid'
-hdr_cells = table1.rows[0].cells
-hdr_cells[0].text = 'Component'
-hdr_cells[1].text = 'Value (%)'
-for i, row in proximate_data.iterrows():
-    cells = table1.add_row().cells
-    cells[0].text = row['Component']
-    cells[1].text = str(row['Value (%)'])
-
-doc.add_picture('proximate_composition.jpeg', width=Inches(5.5))
+add_dataframe_table(doc, proximate_data, style='Table Grid')
+
+add_figure(doc, proximate_img, Inches(5.5))
 
 # Bioethanol Metrics Table
+profile.stage('docx: Bioethanol-Relevant Metrics')
 doc.add_heading('Bioethanol-Relevant Metrics', level=1)
-table2 = doc.add_table(rows=1, cols=2)
-table2.style = 'Table Grid'
-hdr_cells = table2.rows[0].cells
-hdr_cells[0].text = 'Component'
-hdr_cells[1].text = 'Value'
-for i, row in bioethanol_data.iterrows():
-    cells = table2.add_row().cells
-    cells[0].text = row['Component']
-    cells[1].text = str(row['Value'])
-
-doc.add_picture('bioethanol_metrics.jpeg', width=Inches(5.5))
+add_dataframe_table(doc, bioethanol_data, style='Table Grid')
+
+add_figure(doc, bioethanol_img, Inches(5.5))
 
 # Discussion Section
+profile.stage('docx: Discussion')
 doc.add_heading('Discussion', level=1)
 doc.add_paragraph(
     "The proximate composition of banana sap reveals a high moisture content (85.2%), "
@@ -93,4 +88,6 @@ doc.add_paragraph(
     "strategies may be necessary to overcome lignin barriers."
 )
 
+profile.stage('save', output='banana_sap_analysis.docx')
 doc.save('banana_sap_analysis.docx')
+profile.finish()
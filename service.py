@@ -0,0 +1,325 @@
+"""Local report service: queue analysis payloads over HTTP, get DOCX back.
+
+    python service.py --port 8765 --workers 4 --queue-size 256
+    python cli.py serve --port 8765
+
+    POST /jobs/fermentation       {"title": ..., "table": {"Time Point": [...], "Sample Type": [...], ...}}
+    POST /jobs/composition        {"title": ..., "compositions": [{"Moisture (%)": ..., ...}, ...]}
+    POST /jobs/fuel-properties    {"feedstock": "cassava", "ranges": {"Octane number": [90, 110], ...}}
+        -> 202 {"job": id, "status": "queued"}; add ?wait=1 to get the DOCX in the response
+        -> 503 + Retry-After when the queue is full
+    GET  /jobs/<id>               -> {"job", "kind", "status", "error", "submitted", "finished"}
+    GET  /jobs/<id>/report        -> the DOCX once status is "done" (409 before)
+    GET  /health                  -> queue depth and worker count
+
+Standard library only (asyncio streams, a minimal HTTP/1.1 reader). Jobs go
+through a bounded asyncio.Queue to a fixed ProcessPoolExecutor, so hundreds
+of concurrent submissions share `--workers` long-lived processes; when the
+queue is full new submissions are refused instead of piling up in memory.
+Workers start from a forkserver where available: a plain fork would hand
+every client socket open at that moment to the worker, and the connection
+would then never see EOF after the server closes it. Binds to 127.0.0.1 by
+default.
+"""
+import argparse
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+MAX_BODY_BYTES = 32 * 2**20
+MAX_FINISHED_JOBS = 1000
+STREAM_CHUNK = 64 * 1024
+STATUS_TEXT = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               409: 'Conflict', 413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+# --- Report builders (run inside the worker processes) ----------------------
+
+def _save(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def fermentation_report(payload):
+    import pandas as pd
+    from docx import Document
+    from docx_tables import add_dataframe_table
+    from pipelines import fermentation_stats
+    data = pd.DataFrame(payload['table'])
+    results = fermentation_stats(data)
+    doc = Document()
+    doc.add_heading(payload.get('title', 'Statistical Analysis of Sap Fermentation'), 0)
+    doc.add_heading('Descriptive Statistics', level=1)
+    add_dataframe_table(doc, results['desc_stats'].reset_index(), float_format='{:.3f}')
+    doc.add_heading('ANOVA Result', level=1)
+    doc.add_paragraph(f"F-statistic: {results['anova']['F']:.3f}, p-value: {results['anova']['p']:.5f}")
+    doc.add_heading('ANOVA Across Measured Responses', level=1)
+    add_dataframe_table(doc, results['responses'], formats={
+        'F': lambda v: 'n/a (no variation)' if pd.isna(v) else f'{v:.3f}',
+        'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+    })
+    if 'twoway' in results:
+        doc.add_heading('Two-Way ANOVA (Time Point × Sample Type)', level=1)
+        add_dataframe_table(doc, results['twoway'].reset_index(), formats={
+            'Sum Sq': '{:.4f}', 'Mean Sq': '{:.4f}',
+            'F': lambda v: '' if pd.isna(v) else f'{v:.3f}',
+            'p-value': lambda v: '' if pd.isna(v) else f'{v:.5f}',
+        })
+    doc.add_heading('Pairwise T-Test Results', level=1)
+    add_dataframe_table(doc, results['ttests'], formats={'t-statistic': '{:.3f}', 'p-value': '{:.5f}'})
+    return _save(doc)
+
+
+def composition_report(payload):
+    from docx import Document
+    from docx_tables import add_dataframe_table
+    from pipelines import composition_metrics
+    compositions = payload['compositions']
+    if isinstance(compositions, dict):
+        compositions = [compositions]
+    derived = composition_metrics(compositions)
+    doc = Document()
+    doc.add_heading(payload.get('title', 'Sap Composition and Bioethanol Metrics'), 0)
+    doc.add_heading('Derived Metrics', level=1)
+    add_dataframe_table(doc, derived.T.reset_index().rename(columns={'index': 'Metric'}), float_format='{:.4g}')
+    return _save(doc)
+
+
+def fuel_properties_report(payload):
+    from fuel_properties import chart_figures, chart_jobs, load_ranges, report_document
+    feedstock = payload.get('feedstock', 'sample')
+    feedstocks, properties, ranges = load_ranges({feedstock: payload['ranges']})
+    jobs, sections = chart_jobs(feedstocks, properties, ranges)
+    # rendered in this worker (already inside the pool); the images never leave memory (figure copies are off here)
+    images = chart_figures(jobs, max_workers=1)
+    return _save(report_document(feedstock, [(heading, images[path]) for heading, path in sections[feedstock]]))
+
+
+BUILDERS = {
+    'fermentation': fermentation_report,
+    'composition': composition_report,
+    'fuel-properties': fuel_properties_report,
+}
+REQUIRED = {'fermentation': 'table', 'composition': 'compositions', 'fuel-properties': 'ranges'}
+
+
+def _init_worker():
+    import figures
+    figures.FIGURE_COPIES = False  # reports go back over HTTP; nothing is written to disk
+
+
+def _build(kind, payload):
+    import figures
+    try:
+        return BUILDERS[kind](payload)
+    finally:
+        figures.EMBEDDED.clear()  # no run profile here; don't let the records pile up across jobs
+
+
+# --- Job bookkeeping --------------------------------------------------------
+
+class Job:
+    def __init__(self, kind, payload):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload
+        self.status = 'queued'
+        self.error = None
+        self.result = None
+        self.submitted = time.time()
+        self.finished = None
+        self.done = asyncio.Event()
+
+    def describe(self):
+        return {'job': self.id, 'kind': self.kind, 'status': self.status, 'error': self.error,
+                'submitted': self.submitted, 'finished': self.finished}
+
+
+class ReportService:
+    def __init__(self, workers=None, queue_size=256):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs = OrderedDict()
+        self.pool = None
+        self._consumers = []
+
+    async def start(self):
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        mp_context=multiprocessing.get_context(method))
+        self._consumers = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self.pool.shutdown(cancel_futures=True)
+
+    def submit(self, kind, payload):
+        """Queue a job; raises asyncio.QueueFull when the service is saturated."""
+        job = Job(kind, payload)
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        self._forget_old()
+        return job
+
+    def _forget_old(self):
+        finished = [jid for jid, job in self.jobs.items() if job.done.is_set()]
+        for jid in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[jid]
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            job.status = 'running'
+            try:
+                job.result = await loop.run_in_executor(self.pool, _build, job.kind, job.payload)
+                job.status = 'done'
+            except Exception as exc:  # reported to the client through the job status
+                job.status = 'failed'
+                job.error = f'{type(exc).__name__}: {exc}'
+            finally:
+                job.payload = None
+                job.finished = time.time()
+                job.done.set()
+                self.queue.task_done()
+
+    # --- HTTP ---------------------------------------------------------------
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                status, headers, body = await self._route(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except ValueError as exc:
+                status, headers, body = _json(400, {'error': str(exc)})
+            except Exception as exc:  # any other failure still gets a response
+                status, headers, body = _json(500, {'error': f'{type(exc).__name__}: {exc}'})
+            head = [f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}',
+                    f'Content-Length: {len(body)}', 'Connection: close']
+            head += [f'{k}: {v}' for k, v in headers.items()]
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+            for start in range(0, len(body), STREAM_CHUNK):
+                writer.write(body[start:start + STREAM_CHUNK])
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, reader):
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        if not request_line:
+            raise ConnectionError('empty request')
+        method, target, _ = request_line.split(' ', 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_BYTES:
+            return _json(413, {'error': f'body larger than {MAX_BODY_BYTES} bytes'})
+        body = await reader.readexactly(length) if length else b''
+
+        url = urlsplit(target)
+        parts = [p for p in url.path.split('/') if p]
+        query = parse_qs(url.query)
+
+        if parts == ['health'] and method == 'GET':
+            return _json(200, {'queued': self.queue.qsize(), 'queue_size': self.queue.maxsize,
+                               'workers': self.workers, 'jobs': len(self.jobs)})
+        if len(parts) == 2 and parts[0] == 'jobs' and method == 'POST':
+            return await self._submit(parts[1], body, query)
+        if len(parts) in (2, 3) and parts[0] == 'jobs' and method == 'GET':
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return _json(404, {'error': 'unknown job'})
+            if len(parts) == 2:
+                return _json(200, job.describe())
+            if parts[2] == 'report':
+                return _report(job)
+        if parts and parts[0] in ('jobs', 'health'):
+            return _json(405, {'error': f'{method} not allowed here'})
+        return _json(404, {'error': 'not found'})
+
+    async def _submit(self, kind, body, query):
+        if kind not in BUILDERS:
+            return _json(404, {'error': f'unknown job kind {kind!r}', 'kinds': list(BUILDERS)})
+        try:
+            payload = json.loads(body or b'{}')
+        except json.JSONDecodeError as exc:
+            return _json(400, {'error': f'invalid JSON: {exc}'})
+        if not isinstance(payload, dict) or REQUIRED[kind] not in payload:
+            return _json(400, {'error': f'{kind} payload needs a {REQUIRED[kind]!r} field'})
+        try:
+            job = self.submit(kind, payload)
+        except asyncio.QueueFull:
+            status, headers, body = _json(503, {'error': 'queue full, retry later'})
+            headers['Retry-After'] = '1'
+            return status, headers, body
+        if query.get('wait', ['0'])[0] not in ('0', ''):
+            await job.done.wait()
+            return _report(job)
+        status, headers, body = _json(202, job.describe())
+        headers['Location'] = f'/jobs/{job.id}'
+        return status, headers, body
+
+
+def _json(status, obj):
+    return status, {'Content-Type': 'application/json'}, json.dumps(obj).encode()
+
+
+def _report(job):
+    if job.status == 'done':
+        return 200, {'Content-Type': DOCX_TYPE,
+                     'Content-Disposition': f'attachment; filename="{job.kind}_{job.id}.docx"'}, job.result
+    if job.status == 'failed':
+        return _json(500, job.describe())
+    return _json(409, job.describe())
+
+
+async def serve(host='127.0.0.1', port=8765, workers=None, queue_size=256, ready=None):
+    service = ReportService(workers, queue_size)
+    await service.start()
+    server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--queue-size', type=int, default=256, help="queued jobs before 503s")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size,
+                          ready=lambda s: print(f"serving on {', '.join(str(x.getsockname()) for x in s.sockets)}")))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from batched_ols import batched_ols
+
+FEATURES = ['pH', 'Density', 'Viscosity']
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    sizes = {'banana': 40, 'plantain': 25, 'single': 1, 'constant': 6}
+    frame = pd.DataFrame({
+        'Feedstock': np.repeat(list(sizes), list(sizes.values())),
+        **{f: rng.normal(size=sum(sizes.values())) for f in FEATURES},
+    })
+    frame.loc[frame['Feedstock'] == 'constant', 'Density'] = 1.0  # rank deficient
+    frame['Ethanol'] = (2 + frame[FEATURES].to_numpy() @ [0.5, -1.0, 3.0]
+                        + rng.normal(scale=0.3, size=len(frame)))
+    return frame
+
+
+def _lstsq(group):
+    X = np.column_stack([np.ones(len(group)), group[FEATURES].to_numpy()])
+    y = group['Ethanol'].to_numpy()
+    beta, ssr, _, _ = np.linalg.lstsq(X, y, rcond=None)
+    dof = len(y) - X.shape[1]
+    se = np.sqrt(ssr[0] / dof * np.diag(np.linalg.inv(X.T @ X)))
+    r2 = 1 - ssr[0] / ((y - y.mean()) ** 2).sum()
+    return beta, se, r2
+
+
+def test_matches_lstsq_per_group():
+    data = _data()
+    fits = batched_ols(data, 'Ethanol', FEATURES, group_cols='Feedstock')
+    for name in ('banana', 'plantain'):
+        beta, se, r2 = _lstsq(data[data['Feedstock'] == name])
+        fit = fits.loc[name]
+        assert fit['status'] == 'ok' and fit['rank'] == 3
+        np.testing.assert_allclose([fit['intercept']] + [fit[f'coef: {f}'] for f in FEATURES], beta, rtol=1e-9)
+        np.testing.assert_allclose([fit['se: intercept']] + [fit[f'se: {f}'] for f in FEATURES], se, rtol=1e-9)
+        np.testing.assert_allclose(fit['R²'], r2, rtol=1e-9)
+
+
+def test_rank_deficient_groups_get_nan():
+    fits = batched_ols(_data(), 'Ethanol', FEATURES, group_cols='Feedstock')
+    for name in ('single', 'constant'):
+        fit = fits.loc[name]
+        assert fit['status'] == 'rank deficient'
+        assert fit[['intercept', 'R²'] + [f'coef: {f}' for f in FEATURES]].isna().all()
+
+
+def test_ungrouped_fit():
+    data = _data()
+    data = data[data['Feedstock'] == 'banana']
+    beta, _, _ = _lstsq(data)
+    fit = batched_ols(data, 'Ethanol', FEATURES).iloc[0]
+    np.testing.assert_allclose([fit['intercept']] + [fit[f'coef: {f}'] for f in FEATURES], beta, rtol=1e-9)
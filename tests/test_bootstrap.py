@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+import bootstrap
+from bootstrap import _group_stats, bootstrap_anova
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    groups = {'Blank': 4, 'Acid treatment': 6, 'Alkaline treatment': 5}
+    return pd.DataFrame({'Sample Type': np.repeat(list(groups), list(groups.values())),
+                         'Viable Cell Count': rng.normal(7, 1, sum(groups.values()))}).sample(frac=1, random_state=1)
+
+
+def test_group_stats_match_scipy_per_replicate():
+    rng = np.random.default_rng(2)
+    sizes = np.array([4, 6, 5])
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    sample = rng.normal(size=(20, sizes.sum()))
+    means, f_stat = _group_stats(sample, starts, sizes)
+    for row, m, f in zip(sample, means, f_stat):
+        blocks = np.split(row, np.cumsum(sizes)[:-1])
+        np.testing.assert_allclose(m, [b.mean() for b in blocks], rtol=1e-12)
+        np.testing.assert_allclose(f, stats.f_oneway(*blocks).statistic, rtol=1e-10)
+
+
+def test_observed_statistics_and_stratification():
+    data = _data()
+    result = bootstrap_anova(data, 'Sample Type', 'Viable Cell Count', n_boot=2000, max_workers=1)
+    grouped = data.groupby('Sample Type', sort=False)['Viable Cell Count']
+    means = result['means']
+    assert list(means.index) == list(data['Sample Type'].unique())
+    np.testing.assert_allclose(means['mean'], grouped.mean().loc[means.index], rtol=1e-12)
+    np.testing.assert_allclose(result['F']['F'], stats.f_oneway(*(g for _, g in grouped)).statistic, rtol=1e-10)
+    # resamples stay inside their own group, so the mean CIs do too
+    assert (means['CI low'] >= grouped.min().loc[means.index]).all()
+    assert (means['CI high'] <= grouped.max().loc[means.index]).all()
+    assert (means['CI low'] <= means['mean']).all() and (means['mean'] <= means['CI high']).all()
+    diffs = result['differences']
+    np.testing.assert_allclose(diffs['Difference'],
+                               means['mean'].loc[diffs['Group 1']].to_numpy() - means['mean'].loc[diffs['Group 2']])
+
+
+def test_results_do_not_depend_on_worker_count(monkeypatch):
+    monkeypatch.setattr(bootstrap, 'CHUNK_CELLS', 15 * 300)  # 300 replicates per chunk: several chunks
+    data = _data()
+    one = bootstrap_anova(data, 'Sample Type', 'Viable Cell Count', n_boot=1000, seed=7, max_workers=1)
+    two = bootstrap_anova(data, 'Sample Type', 'Viable Cell Count', n_boot=1000, seed=7, max_workers=2)
+    pd.testing.assert_frame_equal(one['means'], two['means'])
+    pd.testing.assert_frame_equal(one['differences'], two['differences'])
+    assert one['F'] == two['F']
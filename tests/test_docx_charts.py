@@ -0,0 +1,53 @@
+import io
+import zipfile
+
+import pandas as pd
+from docx import Document
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.shared import Inches
+from lxml import etree
+
+from docx_charts import C_NS, add_figure, bar_chart, line_chart, minmax_chart
+
+
+def _line_data(time_points):
+    return pd.DataFrame({'Time Point': time_points * 2,
+                         'Sample Type': ['Fresh'] * len(time_points) + ['Stored'] * len(time_points),
+                         'Viable Cell Count': range(2 * len(time_points))})
+
+
+def test_line_chart_x_order():
+    # rows arrive out of order: numeric x still runs sorted, categorical x in category order
+    chart = line_chart(_line_data([24, 0, 48]), 'Time Point', 'Viable Cell Count', 'Sample Type')
+    assert chart.categories == ['0', '24', '48']
+    assert chart.series == [('Fresh', [1.0, 0.0, 2.0], None), ('Stored', [4.0, 3.0, 5.0], None)]
+    data = _line_data(['Day 7', 'Day 0', 'Day 14'])
+    data['Time Point'] = pd.Categorical(data['Time Point'], ['Day 0', 'Day 7', 'Day 14', 'Day 30'])
+    assert line_chart(data, 'Time Point', 'Viable Cell Count', 'Sample Type').categories == ['Day 0', 'Day 7', 'Day 14']
+    # plain labels keep the order they appear in, as seaborn draws them
+    assert line_chart(_line_data(['72 hrs', '4 days']), 'Time Point', 'Viable Cell Count',
+                      'Sample Type').categories == ['72 hrs', '4 days']
+
+
+def test_native_charts_round_trip():
+    charts = [bar_chart(['Moisture', 'Sugar'], [95.8, 5.1], title='Composition', ylabel='%'),
+              minmax_chart({'Density': (0.78, 0.81), 'Viscosity': (1.1, 1.5)}, 'Physical'),
+              line_chart(_line_data([0, 24]), 'Time Point', 'Viable Cell Count', 'Sample Type')]
+    doc = Document()
+    for chart in charts:
+        add_figure(doc, chart, Inches(6))
+    buffer = io.BytesIO()
+    doc.save(buffer)
+
+    reopened = Document(io.BytesIO(buffer.getvalue()))
+    chart_parts = [rel.target_part for rel in reopened.part.rels.values() if rel.reltype == RT.CHART]
+    assert [part.content_type for part in chart_parts] == [CT.DML_CHART] * 3
+    assert len(reopened.element.body.findall(f'.//{{{C_NS}}}chart')) == 3
+    for part in chart_parts:
+        assert etree.fromstring(part.blob).tag == f'{{{C_NS}}}chartSpace'
+        workbook, = [rel.target_part for rel in part.rels.values() if rel.reltype == RT.PACKAGE]
+        assert workbook.content_type == CT.SML_SHEET
+        assert workbook.partname.startswith('/word/embeddings/')
+        with zipfile.ZipFile(io.BytesIO(workbook.blob)) as xlsx:
+            assert xlsx.testzip() is None
+            assert 'xl/worksheets/sheet1.xml' in xlsx.namelist()
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datasets import BANANA_FERMENTATION
+from factorial import twoway_anova
+
+sm = pytest.importorskip('statsmodels.formula.api')
+anova_lm = pytest.importorskip('statsmodels.stats.anova').anova_lm
+
+
+def _statsmodels(data, formula):
+    table = anova_lm(sm.ols(formula, data=data).fit(), typ=2)
+    return table[['sum_sq', 'df', 'F', 'PR(>F)']].to_numpy()
+
+
+def _ours(table):
+    return table[['Sum Sq', 'df', 'F', 'p-value']].to_numpy(dtype=float)
+
+
+def test_unbalanced_replicated_design_matches_statsmodels():
+    rng = np.random.default_rng(0)
+    cells = [(t, s) for t in ['0 h', '24 h', '48 h', '72 h'] for s in ['Blank', 'Acid', 'Alkaline']]
+    rows = [(t, s, rng.normal(7 + 0.01 * len(t) + (s == 'Acid'), 1))
+            for t, s in cells for _ in range(rng.integers(1, 5))]
+    data = pd.DataFrame(rows, columns=['Time', 'Treatment', 'y'])
+    table = twoway_anova(data, 'Time', 'Treatment', 'y')
+    assert list(table.index) == ['Time', 'Treatment', 'Time × Treatment', 'Residual']
+    np.testing.assert_allclose(_ours(table), _statsmodels(data, 'y ~ C(Time) * C(Treatment)'), rtol=1e-8)
+
+
+def test_unreplicated_table_pools_interaction_like_additive_model():
+    data = pd.DataFrame(BANANA_FERMENTATION).rename(columns={'Time Point': 'Time', 'Sample Type': 'Treatment',
+                                                             'Viable Cell Count': 'y'})
+    table = twoway_anova(data, 'Time', 'Treatment', 'y')
+    assert list(table.index) == ['Time', 'Treatment', 'Residual']
+    np.testing.assert_allclose(_ours(table), _statsmodels(data, 'y ~ C(Time) + C(Treatment)'), rtol=1e-8)
+
+
+def test_forced_additive_model_with_a_missing_cell():
+    rng = np.random.default_rng(1)
+    rows = [(t, s, rng.normal()) for t in range(5) for s in 'ABC' for _ in range(2) if (t, s) != (4, 'C')]
+    data = pd.DataFrame(rows, columns=['Time', 'Treatment', 'y'])
+    table = twoway_anova(data, 'Time', 'Treatment', 'y', interaction=False)
+    np.testing.assert_allclose(_ours(table), _statsmodels(data, 'y ~ C(Time) + C(Treatment)'), rtol=1e-8)
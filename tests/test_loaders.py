@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datasets import BANANA_FERMENTATION
+from loaders import load_fermentation, parse_time_point
+
+
+@pytest.mark.parametrize('text, hours', [('72 hrs', 72), ('4 days', 96), ('30 min', 0.5), ('1.5 h', 1.5),
+                                         ('2 Weeks', 336), ('later', np.nan), ('5 fortnights', np.nan)])
+def test_parse_time_point(text, hours):
+    assert parse_time_point(text) == pytest.approx(hours, nan_ok=True)
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet'])
+def test_chunked_load_matches_one_read(tmp_path, suffix):
+    frame = pd.DataFrame(BANANA_FERMENTATION)
+    frame.loc[3, 'pH'] = np.nan
+    path = tmp_path / f'fermentation{suffix}'
+    if suffix == '.csv':
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path, index=False)
+
+    # chunks of 5 rows: most chunks see only some of the labels
+    data = load_fermentation(path, chunksize=5)
+    expected = frame[['Time Point', 'Sample Type', 'Viable Cell Count', 'pH', 'Temperature']]
+    pd.testing.assert_frame_equal(data.drop(columns='Hours').astype({'Time Point': str, 'Sample Type': str}),
+                                  expected.astype({'Viable Cell Count': float, 'pH': float, 'Temperature': float}),
+                                  check_dtype=False)
+    assert data['Time Point'].cat.ordered
+    assert list(data['Time Point'].cat.categories) == ['72 hrs', '4 days', '5 days', '6 days']
+    assert set(data['Sample Type'].cat.categories) == set(frame['Sample Type'])
+    np.testing.assert_array_equal(data['Hours'], frame['Time Point'].map(parse_time_point))
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_text('Time Point,Sample Type,Viable Cell Count,pH,Temperature\n')
+    assert list(load_fermentation(path).columns) == ['Time Point', 'Sample Type', 'Viable Cell Count', 'pH',
+                                                     'Temperature', 'Hours']
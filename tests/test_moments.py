@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from moments import Moments
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'pH': rng.normal(5, 0.3, 200), 'Density': rng.gamma(2.0, size=200),
+                          'Viscosity': rng.exponential(size=200)})
+    frame.loc[rng.choice(200, 15, replace=False), 'Viscosity'] = np.nan
+    return frame
+
+
+def test_chunked_describe_matches_pandas():
+    frame = _frame()
+    acc = Moments.from_chunks(frame.iloc[i:i + 37] for i in range(0, len(frame), 37))
+    table = acc.describe()
+    expected = pd.DataFrame({'mean': frame.mean(), 'std': frame.std(), 'min': frame.min(), 'max': frame.max(),
+                             'Skewness': frame.skew(), 'Kurtosis': frame.kurt()})
+    pd.testing.assert_frame_equal(table, expected, rtol=1e-10)
+
+
+def test_biased_estimators_match_scipy():
+    frame = _frame()
+    acc = Moments(frame.columns).update(frame)
+    np.testing.assert_allclose(acc.skew(), stats.skew(frame, nan_policy='omit'), rtol=1e-10)
+    np.testing.assert_allclose(acc.kurtosis(), stats.kurtosis(frame, nan_policy='omit'), rtol=1e-10)
+
+
+def test_merge_equals_single_pass():
+    frame = _frame()
+    halves = [Moments(frame.columns).update(part) for part in (frame.iloc[:50], frame.iloc[50:])]
+    merged = halves[0].merge(halves[1])
+    single = Moments(frame.columns).update(frame)
+    for attr in ('n', 'mean', 'm2', 'm3', 'm4', 'min', 'max'):
+        np.testing.assert_allclose(getattr(merged, attr), getattr(single, attr), rtol=1e-10)
+
+
+def test_all_nan_and_constant_columns():
+    frame = pd.DataFrame({'empty': [np.nan] * 4, 'constant': [2.0] * 4})
+    table = Moments(frame.columns).update(frame).describe()
+    assert table.loc['empty'].isna().all()
+    assert table.loc['constant', ['std', 'Skewness', 'Kurtosis']].tolist() == [0.0, 0.0, 0.0]
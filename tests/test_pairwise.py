@@ -0,0 +1,61 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from pairwise import group_moments, oneway_anova_multi, pairwise_ttests, pairwise_ttests_multi
+
+
+def _data():
+    # unequal group sizes, a one-observation group and NaN responses
+    return pd.DataFrame({
+        'Group': ['A', 'A', 'B', 'C', 'C', 'C', 'D', 'D', 'D', 'D', 'D'],
+        'x': [1, 2, 3, 4, 5, 7, 2.5, 6, 1, 3, 8],
+        'y': [0.3, np.nan, 1.2, 0.8, 0.7, np.nan, 2.0, 1.1, 1.9, np.nan, 1.4],
+    })
+
+
+def _scipy_pairs(data, column, equal_var):
+    groups = [s.dropna().to_numpy() for _, s in data.groupby('Group', sort=False)[column]]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # Welch with one observation: NaN, with a warning
+        return [stats.ttest_ind(groups[a], groups[b], equal_var=equal_var)
+                for a, b in zip(*np.triu_indices(len(groups), k=1))]
+
+
+@pytest.mark.parametrize('equal_var', [True, False])
+def test_pairwise_ttests_match_scipy(equal_var):
+    data = _data()
+    table = pairwise_ttests_multi(data, 'Group', ['x', 'y'], equal_var=equal_var)
+    for column in ('x', 'y'):
+        rows = table[table['Response'] == column]
+        expected = _scipy_pairs(data, column, equal_var)
+        np.testing.assert_allclose(rows['t-statistic'], [r.statistic for r in expected], rtol=1e-10)
+        np.testing.assert_allclose(rows['p-value'], [r.pvalue for r in expected], rtol=1e-10)
+
+
+def test_student_t_with_one_observation_is_finite():
+    # [1, 2] vs [3] and [3] vs [4, 5, 7], the cases scipy answers
+    table = pairwise_ttests(_data(), 'Group', 'x').set_index(['Group 1', 'Group 2'])
+    assert table.loc[('A', 'B'), 't-statistic'] == pytest.approx(-1.7320508, rel=1e-6)
+    assert table.loc[('A', 'B'), 'p-value'] == pytest.approx(1 / 3, rel=1e-6)
+    assert table.loc[('B', 'C'), 't-statistic'] == pytest.approx(-1.3228757, rel=1e-6)
+    assert table.loc[('B', 'C'), 'p-value'] == pytest.approx(0.3169, abs=1e-4)
+
+
+def test_oneway_anova_matches_scipy():
+    data = _data()
+    table = oneway_anova_multi(data, 'Group', ['x', 'y'])
+    expected = [stats.f_oneway(*(s.dropna() for _, s in data.groupby('Group', sort=False)[column]))
+                for column in ('x', 'y')]
+    np.testing.assert_allclose(table['F'], [r.statistic for r in expected], rtol=1e-10)
+    np.testing.assert_allclose(table['p-value'], [r.pvalue for r in expected], rtol=1e-10)
+
+
+def test_missing_group_label_raises():
+    data = _data()
+    data.loc[0, 'Group'] = np.nan
+    with pytest.raises(ValueError, match='NaN'):
+        group_moments(data, 'Group', 'x')
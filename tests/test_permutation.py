@@ -0,0 +1,45 @@
+import tracemalloc
+
+import numpy as np
+
+from permutation import pairwise_permutation
+
+
+def _peak_bytes(func):
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_exact_many_groups_stays_under_memory_cap():
+    # 100 treatments x 8 replicates: 4,950 pairs x 12,870 splits x 16 values,
+    # about 8 GB if gathered in one go
+    rng = np.random.default_rng(0)
+    groups = [rng.normal(size=8) for _ in range(100)]
+    (i, j, diff, p, n_perm, exact), peak = _peak_bytes(
+        lambda: pairwise_permutation(groups, rng=0, chunk_bytes=16 * 2**20))
+    assert peak < 128 * 2**20
+    assert len(p) == 4950 and exact.all() and (n_perm == 12870).all()
+    assert ((p > 0) & (p <= 1)).all()
+
+
+def test_monte_carlo_many_groups_stays_under_memory_cap():
+    rng = np.random.default_rng(1)
+    groups = [rng.normal(size=10) for _ in range(60)]
+    (i, j, diff, p, n_perm, exact), peak = _peak_bytes(
+        lambda: pairwise_permutation(groups, max_perm=4000, rng=0, chunk_bytes=8 * 2**20))
+    assert peak < 64 * 2**20
+    assert not exact.any() and (n_perm <= 4000).all()
+
+
+def test_chunking_does_not_change_p_values():
+    rng = np.random.default_rng(2)
+    for size in (5, 10):  # exact, Monte Carlo
+        groups = [rng.normal(size=size) + shift for shift in np.linspace(0, 1, 8)]
+        whole = pairwise_permutation(groups, max_perm=10_000, rng=3)
+        chunked = pairwise_permutation(groups, max_perm=10_000, rng=3, chunk_bytes=1)
+        np.testing.assert_array_equal(whole[3], chunked[3])
+        np.testing.assert_array_equal(whole[4], chunked[4])
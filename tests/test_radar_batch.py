@@ -0,0 +1,48 @@
+import re
+
+import numpy as np
+
+from radar_batch import RadarGrid, radar_angles, radar_overlay, radar_polygons, radar_radii
+
+
+def test_radii_brute_force():
+    values = np.array([[90.0, 0.80, np.nan], [100.0, 0.70, 12.0], [95.0, 0.75, 12.0]])
+    expected = [[0.0, 1.0, 0.0], [1.0, 0.0, 0.5], [0.5, 0.5, 0.5]]  # constant column: mid, missing: centre
+    np.testing.assert_allclose(radar_radii(values), expected)
+    np.testing.assert_allclose(radar_radii(values, normalize=False), np.nan_to_num(values / 100.0))
+
+
+def test_polygons_match_polar_conversion():
+    rng = np.random.default_rng(0)
+    radii = rng.random((4, 7))
+    polygons = radar_polygons(radii)
+    assert polygons.shape == (4, 8, 2)
+    # same spokes as the single-chart radar in render.py
+    angles = np.arange(7) / 7 * 2 * np.pi
+    np.testing.assert_allclose(radar_angles(7), angles)
+    for s in range(4):
+        for p in range(7):
+            r, a = radii[s, p], angles[p]
+            np.testing.assert_allclose(polygons[s, p], [r * np.cos(a), r * np.sin(a)], atol=1e-12)
+        np.testing.assert_array_equal(polygons[s, -1], polygons[s, 0])
+
+
+def test_grid_pages(tmp_path):
+    rng = np.random.default_rng(1)
+    values = rng.random((13, 5))
+    grid = RadarGrid(list('ABCDE'), nrows=2, ncols=3, dpi=20)
+    paths = grid.render(values, tmp_path / 'profiles.png', names=[f's{i}' for i in range(13)], title='Batch')
+    assert [p.rsplit('/', 1)[-1] for p in paths] == ['profiles_001.png', 'profiles_002.png', 'profiles_003.png']
+    assert all((tmp_path / p).stat().st_size > 0 for p in paths)
+    # the last page holds one cell: 3 collections, its name and the page title
+    assert len(grid._artists) == 5
+    assert grid.fig._suptitle.get_text() == 'Batch (3/3)'
+
+    pdf = tmp_path / 'profiles.pdf'
+    assert grid.render(values, pdf) == [str(pdf)]
+    assert len(re.findall(rb'/Type\s*/Page\b(?!s)', pdf.read_bytes())) == 3
+
+
+def test_overlay(tmp_path):
+    path = radar_overlay(list('ABCD'), np.random.default_rng(2).random((50, 4)), tmp_path / 'overlay.png', dpi=20)
+    assert (tmp_path / 'overlay.png').stat().st_size > 0 and path.endswith('overlay.png')
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+import range_index
+from range_index import RangeIndex, parse_condition
+
+PROPERTIES = ['Octane number', 'Flash point', 'Density']
+
+
+def _catalog(n, seed):
+    rng = np.random.default_rng(seed)
+    catalog = {}
+    for i in range(n):
+        # integer endpoints so == and ties between bounds actually occur
+        lows = rng.integers(0, 20, size=len(PROPERTIES))
+        table = {p: (float(lo), float(lo + rng.integers(0, 5))) for p, lo in zip(PROPERTIES, lows)}
+        if i % 7 == 0:
+            del table['Density']  # missing: never matches
+        catalog[f'sample {i}'] = table
+    return catalog
+
+
+def _brute_force(catalog, conditions):
+    def meets(table, condition):
+        prop, relation, *rest = condition
+        if prop not in table:
+            return False
+        lo, hi = table[prop]
+        if relation in ('min', 'max'):
+            op, value = rest
+            x = lo if relation == 'min' else hi
+            return {'>=': x >= value, '<=': x <= value, '>': x > value, '<': x < value, '==': x == value}[op]
+        a, b = rest[0]
+        return {'overlaps': lo <= b and hi >= a, 'within': lo >= a and hi <= b,
+                'contains': lo <= a and hi >= b}[relation]
+    return [name for name, table in catalog.items() if all(meets(table, c) for c in conditions)]
+
+
+def _conditions(seed, count=200):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        conditions = []
+        for _ in range(rng.integers(1, 4)):
+            prop = PROPERTIES[rng.integers(len(PROPERTIES))]
+            relation = rng.choice(['min', 'max', 'overlaps', 'within', 'contains'])
+            if relation in ('min', 'max'):
+                op = rng.choice(['>=', '<=', '>', '<', '=='])
+                conditions.append((prop, relation, op, float(rng.integers(0, 24))))
+            else:
+                lo = float(rng.integers(0, 22))
+                conditions.append((prop, relation, (lo, lo + float(rng.integers(0, 6)))))
+        yield conditions
+
+
+def test_query_matches_brute_force():
+    catalog = _catalog(500, seed=0)
+    index = RangeIndex.from_tables(catalog, PROPERTIES)
+    for conditions in _conditions(seed=1):
+        assert index.query(conditions) == _brute_force(catalog, conditions)
+
+
+def test_inserts_are_queryable_before_and_after_rebuild(monkeypatch):
+    monkeypatch.setattr(range_index, 'MIN_TAIL', 10)
+    catalog = _catalog(300, seed=2)
+    names = list(catalog)
+    index = RangeIndex.from_tables({n: catalog[n] for n in names[:200]}, PROPERTIES)
+    for i, name in enumerate(names[200:]):
+        index.insert(name, catalog[name])
+        if i in (5, 99):  # rows still in the tail, then after several merges
+            seen = {n: catalog[n] for n in names[:201 + i]}
+            for conditions in _conditions(seed=i, count=50):
+                assert index.query(conditions) == _brute_force(seen, conditions)
+
+
+def test_parse_condition():
+    assert parse_condition('Octane number: min >= 95') == ('Octane number', 'min', '>=', 95.0)
+    assert parse_condition('Autoignition temp.: overlaps 360 365') == ('Autoignition temp.', 'overlaps', (360.0, 365.0))
+    assert parse_condition('Flash point: contains 12') == ('Flash point', 'contains', (12.0, 12.0))
+    with pytest.raises(ValueError, match='cannot parse'):
+        parse_condition('Flash point is low')
+
+
+def test_unknown_property_lists_known_ones():
+    index = RangeIndex.from_tables(_catalog(5, seed=3), PROPERTIES)
+    with pytest.raises(ValueError, match='indexed properties: Octane number, Flash point, Density'):
+        index.query([('Cetane number', 'min', '>=', 40)])
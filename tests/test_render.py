@@ -0,0 +1,14 @@
+import figures
+from render import minmax_bar, render_all
+
+
+def test_pool_rendered_charts_reach_the_parent_profile(tmp_path):
+    jobs = [(minmax_bar, dict(data_subset={'Density': (0.7, 0.9), 'Viscosity': (1.0, 2.0)}, title=title,
+                              filename=str(tmp_path / f'{title}.png'), embed_width=5.5))
+            for title in ('thermal', 'physical')]
+    del figures.EMBEDDED[:]
+    images = render_all(jobs, max_workers=2)
+    records = list(figures.EMBEDDED)
+    del figures.EMBEDDED[:]
+    assert [r['path'] for r in records] == [kwargs['filename'] for _, kwargs in jobs]
+    assert [r['bytes'] for r in records] == [len(image.getvalue()) for image in images]
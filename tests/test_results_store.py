@@ -0,0 +1,34 @@
+import pytest
+
+from results_store import ResultsStore
+
+
+def _store(tmp_path):
+    store = ResultsStore(tmp_path / 'results.sqlite')
+    for started, shift in ((1000, 0.0), (2000, 0.5)):
+        store.record_run('bab.py', 'banana', [
+            ('anova', 'pH', '', 'p-value', 0.01 + shift),
+            ('anova', 'Brix', '', 'p-value', 0.02 + shift),
+            ('t-test', 'Viable Cell Count', 'A vs B', 'p-value', 0.03 + shift),
+            ('permutation', 'Viable Cell Count', 'A vs B', 'p-value', 0.04 + shift),
+        ], started=started)
+    return store
+
+
+def test_trend_table_widens_shared_columns(tmp_path):
+    with _store(tmp_path) as store:
+        table = store.trend_table('p-value')
+        assert table.drop(columns=['run_id', 'started']).to_dict('list') == {
+            'anova / pH': [0.01, 0.51], 'anova / Brix': [0.02, 0.52],
+            't-test / Viable Cell Count / A vs B': [0.03, 0.53],
+            'permutation / Viable Cell Count / A vs B': [0.04, 0.54]}
+        # one value per cell: plain treatment columns
+        assert list(store.trend_table('p-value', analysis='t-test').columns[2:]) == ['A vs B']
+
+
+def test_trend_table_rejects_ambiguous_cells(tmp_path):
+    with _store(tmp_path) as store:
+        store.record_run('bab.py', 'banana', [('anova', 'pH', '', 'p-value', 0.1),
+                                              ('anova', 'pH', '', 'p-value', 0.2)], started=3000)
+        with pytest.raises(ValueError, match='share a column'):
+            store.trend_table('p-value', analysis='anova')
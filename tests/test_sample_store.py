@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import datasets
+import sample_store
+from sample_store import COLUMNS, SampleStore, open_store, seed_frame, write_store
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    n = 400
+    dates = pd.to_datetime('2024-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D')
+    frame = pd.DataFrame({
+        'sample_id': [f's{i}' for i in rng.integers(0, 40, n)],
+        'feedstock': rng.choice(['banana', 'plantain', 'cassava'], n),
+        'dataset': rng.choice(['composition', 'physicochemical'], n),
+        'assay': rng.choice(['Moisture', 'Sugar', 'pH', 'Density'], n),
+        'unit': rng.choice(['%', 'g/cm³', None], n),
+        'value': rng.normal(size=n),
+        'date': dates.where(rng.random(n) > 0.1),  # some unknown dates
+    })
+    return frame
+
+
+def _rows(frame):
+    frame = frame.assign(unit=frame['unit'].fillna(''), date=pd.to_datetime(frame['date']).astype('datetime64[ns]'))
+    frame = frame[COLUMNS].astype({c: str for c in COLUMNS[:5]})
+    return frame.sort_values(COLUMNS, na_position='last').reset_index(drop=True)
+
+
+@pytest.mark.parametrize('query', [
+    {},
+    {'feedstock': 'plantain'},
+    {'feedstock': ['banana', 'cassava'], 'dataset': 'composition'},
+    {'start': '2024-02-01', 'end': '2024-02-29'},
+    {'feedstock': 'banana', 'start': '2024-03-01', 'assay': ['Sugar', 'pH']},
+    {'feedstock': 'coconut'},
+])
+def test_select_matches_pandas_filter(tmp_path, query):
+    frame = _frame()
+    store = SampleStore(write_store(frame, tmp_path / 'store'))
+    expected = frame
+    for col in ('feedstock', 'dataset', 'assay'):
+        if col in query:
+            wanted = [query[col]] if isinstance(query[col], str) else query[col]
+            expected = expected[expected[col].isin(wanted)]
+    if 'start' in query:
+        expected = expected[expected['date'] >= query['start']]
+    if 'end' in query:
+        expected = expected[expected['date'] <= query['end']]
+    got = store.select(**query)
+    assert len(got) == len(expected)
+    pd.testing.assert_frame_equal(_rows(got.astype({c: str for c in COLUMNS[:5]})), _rows(expected),
+                                  check_dtype=False)
+    # feedstocks are contiguous and dated rows sorted within each
+    for feedstock, (lo, hi) in store.manifest['feedstocks'].items():
+        assert (np.asarray(store.labels('feedstock'))[store.column('feedstock')[lo:hi]] == feedstock).all()
+        dates = store.column('date')[lo:hi]
+        known = dates[~np.isnat(dates)]
+        assert (np.diff(known.view(np.int64)) >= 0).all() and np.isnat(dates[len(known):]).all()
+
+
+def test_seeded_store_round_trips_datasets(tmp_path):
+    store = open_store(tmp_path / 'store')
+    assert store.record('banana-sap-1') == datasets.BANANA_SAP_COMPOSITION
+    assert len(store) == len(seed_frame())
+
+
+def test_seeded_store_rebuilt_when_seed_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'store'
+    open_store(path)
+    seed = json.loads((path / 'manifest.json').read_text())['seed']
+    monkeypatch.setattr(sample_store, 'SEED_VERSION', sample_store.SEED_VERSION + 1)
+    open_store(path)
+    assert json.loads((path / 'manifest.json').read_text())['seed'] not in (None, seed)
+
+    write_store(_frame(), path)  # imported: left alone
+    assert len(open_store(path)) == len(_frame())
@@ -0,0 +1,85 @@
+import asyncio
+import io
+import json
+
+from datasets import BANANA_SAP_COMPOSITION
+from service import DOCX_TYPE, ReportService
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    data = b'' if body is None else json.dumps(body).encode()
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n'.encode()
+                 + data)
+    await writer.drain()
+    raw = await reader.read()  # the service closes every connection
+    writer.close()
+    head, _, payload = raw.partition(b'\r\n\r\n')
+    status_line, *lines = head.decode('latin-1').split('\r\n')
+    headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(':') for line in lines)}
+    return int(status_line.split()[1]), headers, payload
+
+
+async def _serving(service, scenario):
+    server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with server:
+            return await scenario(port)
+    finally:
+        if service.pool is not None:
+            await service.stop()
+
+
+def test_submit_poll_report():
+    async def scenario(port):
+        status, headers, body = await _request(port, 'POST', '/jobs/composition',
+                                               {'compositions': BANANA_SAP_COMPOSITION})
+        assert status == 202
+        job = json.loads(body)['job']
+        assert headers['location'] == f'/jobs/{job}'
+        for _ in range(600):
+            status, _, body = await _request(port, 'GET', f'/jobs/{job}')
+            assert status == 200
+            if json.loads(body)['status'] in ('done', 'failed'):
+                break
+            await asyncio.sleep(0.1)
+        assert json.loads(body)['status'] == 'done'
+        return await _request(port, 'GET', f'/jobs/{job}/report')
+
+    async def run():
+        service = ReportService(workers=1, queue_size=4)
+        await service.start()
+        return await _serving(service, scenario)
+
+    status, headers, body = asyncio.run(run())
+    assert status == 200 and headers['content-type'] == DOCX_TYPE
+    from docx import Document
+    text = [p.text for p in Document(io.BytesIO(body)).paragraphs]
+    assert 'Derived Metrics' in text
+
+
+def test_full_queue_returns_503():
+    async def scenario(port):
+        first = await _request(port, 'POST', '/jobs/composition', {'compositions': BANANA_SAP_COMPOSITION})
+        second = await _request(port, 'POST', '/jobs/composition', {'compositions': BANANA_SAP_COMPOSITION})
+        return first, second
+
+    # not started: no consumers, so the one queue slot stays taken
+    (first, _, _), (status, headers, body) = asyncio.run(_serving(ReportService(workers=1, queue_size=1), scenario))
+    assert first == 202
+    assert status == 503 and headers['retry-after'] == '1'
+    assert 'queue full' in json.loads(body)['error']
+
+
+def test_unexpected_error_returns_500():
+    service = ReportService(workers=1, queue_size=1)
+
+    def broken(kind, payload):
+        raise TypeError('boom')
+
+    service.submit = broken
+    status, _, body = asyncio.run(_serving(service, lambda port: _request(
+        port, 'POST', '/jobs/composition', {'compositions': BANANA_SAP_COMPOSITION})))
+    assert status == 500
+    assert json.loads(body)['error'] == 'TypeError: boom'